@@ -0,0 +1,86 @@
+# Copyright 2024 The PyGlove Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of `pg.trusted_construction` on symbolic trees of 10^5 nodes.
+
+Usage::
+
+  python trusted_construction_benchmark.py [depth] [branching_factor]
+"""
+
+import json
+import sys
+import time
+
+import pyglove as pg
+
+
+class Node(pg.Object):
+  """A node of the benchmark tree."""
+
+  name: str
+  weight: pg.typing.Float(min_value=0.0) = 1.0
+  children: list['Node'] = []
+
+
+def make_tree(depth: int, branching_factor: int) -> Node:
+  """Makes a tree of `sum(branching_factor ** i for i in range(depth + 1))`."""
+  if depth == 0:
+    return Node('leaf')
+  return Node(
+      f'node{depth}',
+      weight=float(depth),
+      children=[make_tree(depth - 1, branching_factor)
+                for _ in range(branching_factor)])
+
+
+def timeit(name: str, fn, setup=lambda: (), repeat: int = 3) -> None:
+  """Prints the best elapse of `fn` among repeats."""
+  best = None
+  for _ in range(repeat):
+    args = setup()
+    start = time.time()
+    fn(*args)
+    elapse = time.time() - start
+    best = elapse if best is None else min(best, elapse)
+  print(f'{name:<40} {best * 1000:>10.1f} ms')
+
+
+def main(depth: int = 5, branching_factor: int = 10) -> None:
+  tree = make_tree(depth, branching_factor)
+  num_nodes = sum(branching_factor ** i for i in range(depth + 1))
+  print(f'Tree with {num_nodes} nodes (depth={depth}, '
+        f'branching_factor={branching_factor}):')
+
+  json_str = pg.to_json_str(tree)
+
+  def json_value():
+    # NOTE: `pg.from_json` consumes the '_type' keys of its input, therefore
+    # each run loads a fresh JSON value.
+    return (json.loads(json_str),)
+
+  def from_json(v):
+    pg.from_json(v)
+
+  def trusted_from_json(v):
+    with pg.trusted_construction():
+      pg.from_json(v)
+
+  timeit('from_json', from_json, json_value)
+  timeit('from_json (trusted)', trusted_from_json, json_value)
+  timeit('clone(deep=False)', tree.clone)
+  timeit('clone(deep=True)', lambda: tree.clone(deep=True))
+
+
+if __name__ == '__main__':
+  main(*[int(v) for v in sys.argv[1:]])
@@ -28,7 +28,21 @@ as enum, six, yaml.
 # pylint: disable=g-import-not-at-top
 
 from pyglove.core import *
-from pyglove.ext import *
+from pyglove import ext
+
+
+def __getattr__(name):
+  # NOTE: sub-modules of `pyglove.ext` (e.g. `pg.evolution`) are
+  # loaded upon first access.
+  if name in ext.__all__:
+    module = getattr(ext, name)
+    globals()[name] = module
+    return module
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+  return sorted(set(globals()) | set(ext.__all__))
 
 # Placeholder for Google-internal imports.
 
@@ -60,15 +60,19 @@ from pyglove.core import symbolic
 allow_empty_field_description = symbolic.allow_empty_field_description
 allow_repeated_class_registration = symbolic.allow_repeated_class_registration
 set_origin_stacktrace_limit = symbolic.set_origin_stacktrace_limit
+set_origin_history_size = symbolic.set_origin_history_size
 
 # Context manager for scoped flags.
 allow_partial = symbolic.allow_partial
 allow_writable_accessors = symbolic.allow_writable_accessors
 auto_call_functors = symbolic.auto_call_functors
 notify_on_change = symbolic.notify_on_change
+defer_notifications = symbolic.defer_notifications
 enable_type_check = symbolic.enable_type_check
 track_origin = symbolic.track_origin
 as_sealed = symbolic.as_sealed
+trusted_construction = symbolic.trusted_construction
+interning = symbolic.interning
 
 # Symbolic types.
 Symbolic = symbolic.Symbolic
@@ -161,6 +165,8 @@ from_json = symbolic.from_json
 from_json_str = symbolic.from_json_str
 to_json = symbolic.to_json
 to_json_str = symbolic.to_json_str
+from_binary = symbolic.from_binary
+to_binary = symbolic.to_binary
 save = symbolic.save
 load = symbolic.load
 open_jsonl = symbolic.open_jsonl
@@ -309,13 +315,6 @@ Html = views.Html
 to_html = views.to_html
 to_html_str = views.to_html_str
 
-# NOTE(daiyip): Hack to add `controls` to `pg.views.html`.
-# We exclude `html.controls` from `pyglove.core.views.html` package to avoid
-# circular dependency between `pyglove.core.views.html` and
-# `pyglove.core.symbolic`.
-from pyglove.core.views.html import controls
-views.html.controls = controls
-
 
 #
 # Symbols from `io` sub-module.
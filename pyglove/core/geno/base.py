@@ -475,6 +475,19 @@ class DNA(symbolic.Object):
   # Allow assignment on symbolic attributes.
   allow_symbolic_assignment = True
 
+  # DNA objects are created in large numbers, thus we store their fields
+  # compactly.
+  use_compact_storage = True
+
+  # DNA objects carry states beyond their symbolic attributes (e.g. the
+  # attached DNASpec), therefore they cannot be interned.
+  _sym_internable = False
+
+  # `DNA.__init__` only parses its arguments into field values, and its other
+  # states are set up in `_on_init`, thus it can be unpickled without calling
+  # `__init__`.
+  _sym_fast_pickle = True
+
   @object_utils.explicit_method_override
   def __init__(
       self,
@@ -505,15 +518,16 @@ class DNA(symbolic.Object):
         metadata=metadata or symbolic.Dict(),
         allow_partial=allow_partial,
         **kwargs)
+    if spec:
+      self.use_spec(spec)
 
-    self._decision_by_id_cache = None
-    self._named_decisions = None
+  def _on_init(self):
+    """Event that is triggered at the end of `__init__` or unpickling."""
+    super()._on_init()
     self._userdata = AttributeDict()
     self._cloneable_metadata_keys = set()
     self._cloneable_userdata_keys = set()
     self._spec = None
-    if spec:
-      self.use_spec(spec)
 
   def _on_bound(self):
     """Event that is triggered when any symbolic member changes."""
@@ -1240,7 +1254,12 @@ class DNA(symbolic.Object):
       else:
         value = _next_decision()
       return DNA(value, children, spec=dna_spec)
-    dna = _bind_decisions(dna_spec)
+
+    # NOTE: decisions are validated against the DNA spec by
+    # `_bind_decisions` and `DNA.use_spec`. Therefore, we can skip the
+    # validation during constructing the DNA objects.
+    with symbolic.trusted_construction():
+      dna = _bind_decisions(dna_spec)
     if context['index'] != len(dna_values):
       end_pos = context['index']
       raise ValueError(
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Tests for pyglove.geno.DNA."""
 
+import pickle
 import unittest
 
 from pyglove.core import object_utils
@@ -248,6 +249,16 @@ class DNATest(unittest.TestCase):
     self.assertEqual(dna, dna3)
     self.assertEqual(dna.metadata, dna3.metadata)
 
+  def test_pickle(self):
+    dna = DNA([0, (1, 2), [3, (4, 5, 'abc')]])
+    dna.set_metadata('a', 1)
+    dna2 = pickle.loads(pickle.dumps(dna))
+    self.assertEqual(dna, dna2)
+    self.assertEqual(dna2.metadata, dict(a=1))
+    self.assertIs(dna2.children[1].parent_dna, dna2)
+    self.assertEqual(dna2.userdata, {})
+    self.assertIsNone(dna2.spec)
+
   def test_decision_ids(self):
     self.assertEqual(
         self._dna().decision_ids,
@@ -135,6 +135,7 @@ class ObjectTemplate(base.HyperValue, object_utils.Formattable):
     self._compute_derived = compute_derived
     self._where = where
     self._parse_generators()
+    self._intern_fixed_subtrees()
 
   @property
   def root_path(self) -> object_utils.KeyPath:
@@ -171,6 +172,54 @@ class ObjectTemplate(base.HyperValue, object_utils.Formattable):
         self._value, _extract_immediate_child_hyper_primitives)
     self._hyper_primitives = hyper_primitives
 
+  def _intern_fixed_subtrees(self) -> None:
+    """Interns sealed sub-trees without hyper values for decoding.
+
+    Sealed sub-trees that do not contain hyper values are the same across all
+    decoded values, therefore their interned copies are placed into the decoded
+    values instead of being deep cloned on each `decode` call. See
+    `pg.symbolic.intern` for the contract on shared nodes.
+    """
+    fixed_subtrees = []
+    def _is_hyper_free(value: Any) -> bool:
+      """Returns True if value is hyper-free, collecting fixed sub-trees."""
+      if isinstance(value, base.HyperValue):
+        return False
+      if not isinstance(value, symbolic.Symbolic):
+        return True
+      if symbolic.is_interned(value):
+        return True
+      children = [(v, _is_hyper_free(v)) for v in value.sym_values()]
+      if all(hyper_free for _, hyper_free in children):
+        return True
+      for v, hyper_free in children:
+        if (hyper_free
+            and isinstance(v, symbolic.Symbolic)
+            and v.is_sealed
+            and not symbolic.is_interned(v)):
+          fixed_subtrees.append(v)
+      return False
+
+    interned = []
+    if isinstance(self._value, symbolic.Symbolic):
+      _is_hyper_free(self._value)
+      for subtree in fixed_subtrees:
+        try:
+          interned.append(
+              (subtree, symbolic.intern(subtree.clone(deep=True).seal())))
+        except ValueError:
+          # NOTE: sub-trees that are not pure data (e.g. containing `pg.Ref`)
+          # cannot be interned, which are cloned upon decoding.
+          pass
+    # NOTE: original sub-trees are held along with their interned copies,
+    # thus their ids stay valid as memo keys for `symbolic.clone`.
+    self._interned_subtrees = interned
+
+  def _clone_value(self, value: Any, **kwargs) -> Any:
+    """Deep clones a value, sharing interned copies of fixed sub-trees."""
+    memo = {id(subtree): copy for subtree, copy in self._interned_subtrees}
+    return symbolic.clone(value, deep=True, memo=memo, **kwargs)
+
   @property
   def value(self) -> Any:
     """Returns templated value."""
@@ -231,11 +280,9 @@ class ObjectTemplate(base.HyperValue, object_utils.Formattable):
         # should return 0 instead of rebinding the root `OneOf` object.
         value = rebind_dict['']
       else:
-        # NOTE(daiyip): Instead of deep copying the whole object (with hyper
-        # primitives), we can cherry-pick only non-hyper parts. Unless we saw
-        # performance issues it's not worthy to optimize this.
-        value = symbolic.clone(self._value, deep=True)
-        value.rebind(rebind_dict)
+        # NOTE: Hyper primitives are replaced by their decoded values
+        # during cloning, thus they are neither deep copied nor rebound.
+        value = self._clone_value(self._value, override=rebind_dict)
       copied = True
     else:
       assert self.is_constant
@@ -262,7 +309,7 @@ class ObjectTemplate(base.HyperValue, object_utils.Formattable):
 
       if derived_values:
         if not copied:
-          value = symbolic.clone(value, deep=True)
+          value = self._clone_value(value)
         rebind_dict = {}
         for path, derived_value in derived_values:
           rebind_dict[path.path] = derived_value()
@@ -208,6 +208,39 @@ class ObjectTemplateTest(unittest.TestCase):
         'Unmatched Object keys between template value and input value'):
       t.encode({'a': 0, 'b': 0.5, 'c': 0, 'd': A(y=1)})
 
+  def test_decode_shares_fixed_subtrees(self):
+
+    @symbolic.members([('x', pg_typing.Any()), ('y', pg_typing.Any())])
+    class A(symbolic.Object):
+      pass
+
+    fixed = A(x=[1, 2, 3], y=A(x='foo', y=None)).seal()
+    unsealed = A(x=1, y=2)
+    v = symbolic.Dict(a=oneof([0, 1]), b=fixed, c=unsealed,
+                      d=symbolic.Dict(e=fixed.clone(deep=True).seal(),
+                                      f=oneof([A(x=1, y=2).seal(), 3])))
+    t = ObjectTemplate(v)
+    self.assertIs(t.value.b, fixed)
+    self.assertFalse(symbolic.is_interned(fixed))
+
+    x = t.decode(geno.DNA([0, 0]))
+    y = t.decode(geno.DNA([1, 1]))
+    self.assertEqual(x, symbolic.Dict(a=0, b=fixed, c=unsealed,
+                                      d=symbolic.Dict(e=fixed, f=A(x=1, y=2))))
+    self.assertEqual(y.d.f, 3)
+
+    # Sealed hyper-free sub-trees are shared among decoded values.
+    self.assertTrue(symbolic.is_interned(x.b))
+    self.assertIs(x.b, y.b)
+    self.assertIs(x.d.e, x.b)
+    self.assertIsNone(x.b.sym_parent)
+
+    # Unsealed sub-trees and decoded values are still copied.
+    self.assertIsNot(x.c, unsealed)
+    self.assertIsNot(x.c, y.c)
+    self.assertFalse(symbolic.is_interned(x.d.f))
+    self.assertIs(x.d.f.sym_parent, x.d)
+
   def test_assignment_compatibility(self):
     sd = symbolic.Dict.partial(
         value_spec=pg_typing.Dict([
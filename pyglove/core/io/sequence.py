@@ -15,8 +15,10 @@
 
 import abc
 import collections
+import concurrent.futures
+import multiprocessing
 import os
-from typing import Any, Callable, Iterator, Optional, Union
+from typing import Any, Callable, Iterator, List, Optional, Union
 
 from pyglove.core.io import file_system
 
@@ -137,6 +139,7 @@ def open_sequence(
         Callable[[Union[bytes, str]], Any]
     ] = None,
     make_dirs_if_not_exist: bool = True,
+    **kwargs,
 ) -> Sequence:
   """Open sequence for reading or writing.
 
@@ -149,6 +152,8 @@ def open_sequence(
       bytes to a structured object.
     make_dirs_if_not_exist: (Optional) Whether to create the directories
       if they do not exist. Applicable when opening in write or append mode.
+    **kwargs: Additional keyword arguments for the record IO system, e.g.
+      `num_workers` for `LineSequenceIO`.
 
   Returns:
     A sequence for reading or writing.
@@ -158,7 +163,7 @@ def open_sequence(
     if make_dirs_if_not_exist:
       file_system.mkdirs(parent_dir, exist_ok=True)
   return _registry.get(path).open(
-      path, mode, serializer=serializer, deserializer=deserializer
+      path, mode, serializer=serializer, deserializer=deserializer, **kwargs
   )
 
 
@@ -279,6 +284,126 @@ class LineSequence(Sequence):
     self._file.close()
 
 
+class ParallelLineSequence(LineSequence):
+  """A new-line broken sequence whose records are deserialized in parallel.
+
+  The file is read in chunks that end at line boundaries, which are
+  deserialized by a process pool. At most `max_pending_chunks` chunks are read
+  ahead of the consumer, which bounds the memory used for reading.
+  """
+
+  def __init__(
+      self,
+      file: file_system.File,
+      serializer: Optional[Callable[[Any], Union[bytes, str]]],
+      deserializer: Optional[Callable[[Union[bytes, str]], Any]],
+      num_workers: int,
+      *,
+      ordered: bool = True,
+      chunk_size: int = 1 << 20,
+      max_pending_chunks: Optional[int] = None,
+      start_method: Optional[str] = None,
+  ) -> None:
+    """Constructor.
+
+    The worker processes load the deserializer and the classes of the records
+    by their import paths. Therefore, under the 'spawn' and 'forkserver' start
+    methods, they must be importable from the worker processes: classes
+    defined in the `__main__` module of an interactive session (e.g. a
+    notebook) cannot be loaded, and scripts must guard their entry points
+    with `if __name__ == '__main__':`.
+
+    Args:
+      file: The file to read.
+      serializer: (Optional) A serializer function for converting a structured
+        object to a string or bytes.
+      deserializer: (Optional) A deserializer function for converting a string
+        or bytes to a structured object. It must be picklable, e.g. a module
+        level function.
+      num_workers: The number of worker processes.
+      ordered: If True, records are yielded in the order of the file.
+        Otherwise they are yielded as soon as their chunks are deserialized.
+      chunk_size: The approximate size of each chunk sent to the workers.
+      max_pending_chunks: The maximum number of chunks that are read but not
+        yet consumed. If None, it will be twice the number of workers.
+      start_method: The start method of the worker processes, which is one of
+        'fork', 'spawn' and 'forkserver'. If None, 'forkserver' will be used
+        when the platform supports it, since forking a multi-threaded process
+        may deadlock. Otherwise the default start method of the platform will
+        be used. See `multiprocessing.get_context` for details.
+    """
+    super().__init__(file, serializer, deserializer)
+    if num_workers < 1:
+      raise ValueError(
+          f'`num_workers` must be positive. Encountered: {num_workers}.')
+    self._num_workers = num_workers
+    self._ordered = ordered
+    self._chunk_size = chunk_size
+    self._max_pending_chunks = max_pending_chunks or 2 * num_workers
+    if (start_method is None
+        and 'forkserver' in multiprocessing.get_all_start_methods()):
+      start_method = 'forkserver'
+    self._mp_context = multiprocessing.get_context(start_method)
+
+  def _iter_chunks(self) -> Iterator[Union[str, bytes]]:
+    """Iterates chunks of whole lines."""
+    while True:
+      chunk = self._file.read(self._chunk_size)
+      if not chunk:
+        break
+      if not chunk.endswith('\n' if isinstance(chunk, str) else b'\n'):
+        chunk += self._file.readline()
+      yield chunk
+
+  def __iter__(self) -> Iterator[Any]:
+    """Iterates over the deserialized records in the reader."""
+    chunks = self._iter_chunks()
+    pending = collections.deque()
+    executor = concurrent.futures.ProcessPoolExecutor(
+        self._num_workers, mp_context=self._mp_context)
+
+    def _submit_chunks() -> None:
+      while len(pending) < self._max_pending_chunks:
+        chunk = next(chunks, None)
+        if chunk is None:
+          break
+        pending.append(
+            executor.submit(_deserialize_lines, chunk, self._deserializer))
+    try:
+      _submit_chunks()
+      while pending:
+        if self._ordered:
+          done = [pending.popleft()]
+        else:
+          done, _ = concurrent.futures.wait(
+              pending, return_when=concurrent.futures.FIRST_COMPLETED)
+          for future in done:
+            pending.remove(future)
+        for future in done:
+          records = future.result()
+          # NOTE: we refill the pipeline before yielding the records,
+          # so the workers are kept busy while the records are consumed.
+          _submit_chunks()
+          yield from records
+    finally:
+      executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _deserialize_lines(
+    chunk: Union[str, bytes],
+    deserializer: Optional[Callable[[Union[bytes, str]], Any]]
+) -> List[Any]:
+  """Deserializes the lines of a chunk in a worker process."""
+  lines = chunk.split('\n' if isinstance(chunk, str) else b'\n')
+  # A chunk ends with a new line, except the last chunk of a file whose last
+  # line has no trailing new line.
+  if not lines[-1]:
+    lines.pop()
+  if deserializer is None:
+    return lines
+  return [deserializer(line) for line in lines]
+
+
 class LineSequenceIO(SequenceIO):
   """Line-based record IO."""
 
@@ -289,11 +414,30 @@ class LineSequenceIO(SequenceIO):
       *,
       serializer: Optional[Callable[[Any], Union[bytes, str]]],
       deserializer: Optional[Callable[[Union[bytes, str]], Any]],
+      num_workers: Optional[int] = None,
       **kwargs
   ) -> Sequence:
-    """Opens a reader for a sequence."""
-    del kwargs
-    return LineSequence(
-        file_system.open(path, mode), serializer, deserializer
-    )
+    """Opens a reader for a sequence.
+
+    Args:
+      path: The path to the sequence.
+      mode: The mode of the sequence.
+      serializer: (Optional) A serializer function for converting a structured
+        object to a string or bytes.
+      deserializer: (Optional) A deserializer function for converting a string
+        or bytes to a structured object.
+      num_workers: (Optional) If not None, records will be deserialized by
+        this number of worker processes when reading. See
+        `ParallelLineSequence` for details.
+      **kwargs: Additional keyword arguments for `ParallelLineSequence`, e.g.
+        `ordered`, `chunk_size` and `max_pending_chunks`.
+
+    Returns:
+      A sequence for reading or writing.
+    """
+    file = file_system.open(path, mode)
+    if num_workers is not None and 'r' in mode:
+      return ParallelLineSequence(
+          file, serializer, deserializer, num_workers, **kwargs)
+    return LineSequence(file, serializer, deserializer)
 
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import multiprocessing
 import os
+import shutil
 import tempfile
 import unittest
 from pyglove.core.io import sequence as sequence_io
@@ -72,6 +74,81 @@ class LineSequenceIOTest(unittest.TestCase):
       self.assertEqual(list(iter(f)), ['foo', 'bar'])
 
 
+class ParallelLineSequenceTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    tmp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+    self._tmp_dir = tmp_dir
+    self._file = os.path.join(tmp_dir, 'file.jsonl')
+    self._records = [dict(x=i, y=[str(i)] * (i % 7)) for i in range(500)]
+    with pg_symbolic.open_jsonl(self._file, 'w') as f:
+      for r in self._records:
+        f.add(r)
+
+  def test_ordered(self):
+    with pg_symbolic.open_jsonl(
+        self._file, 'r', num_workers=2, chunk_size=256) as f:
+      self.assertIsInstance(f, sequence_io.ParallelLineSequence)
+      self.assertEqual(list(iter(f)), self._records)
+
+  def test_unordered(self):
+    with pg_symbolic.open_jsonl(
+        self._file, 'r', num_workers=2, ordered=False,
+        chunk_size=100, max_pending_chunks=3) as f:
+      self.assertEqual(
+          sorted(iter(f), key=lambda r: r['x']), self._records)
+
+  def test_raw_lines(self):
+    with sequence_io.open_sequence(
+        self._file, 'r', num_workers=1, chunk_size=4096) as f:
+      with sequence_io.open_sequence(self._file, 'r') as f2:
+        self.assertEqual(list(iter(f)), list(iter(f2)))
+
+  def test_last_line_without_new_line(self):
+    path = os.path.join(self._tmp_dir, 'no_newline.jsonl')
+    with open(path, 'w') as f:
+      f.write('{"a": 1}\n{"a": 2}\n{"a": 3}')
+    with pg_symbolic.open_jsonl(path, 'r') as f:
+      expected = list(iter(f))
+    self.assertEqual(len(expected), 3)
+    for chunk_size in (4, 1024):
+      with pg_symbolic.open_jsonl(
+          path, 'r', num_workers=2, chunk_size=chunk_size) as f:
+        self.assertEqual(list(iter(f)), expected)
+
+  def test_start_method(self):
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+      with pg_symbolic.open_jsonl(self._file, 'r', num_workers=1) as f:
+        self.assertEqual(
+            f._mp_context.get_start_method(), 'forkserver')  # pylint: disable=protected-access
+    with pg_symbolic.open_jsonl(
+        self._file, 'r', num_workers=1, chunk_size=4096,
+        start_method='spawn') as f:
+      self.assertEqual(list(iter(f)), self._records)
+
+  def test_early_exit(self):
+    with pg_symbolic.open_jsonl(
+        self._file, 'r', num_workers=2, chunk_size=64) as f:
+      for i, r in enumerate(f):
+        if i == 10:
+          break
+      self.assertEqual(r, self._records[10])
+
+  def test_bad_records(self):
+    with pg_symbolic.open_jsonl(self._file, 'a') as f:
+      f.add('foo')
+      f._file.write('{"x": \n')  # pylint: disable=protected-access
+    with pg_symbolic.open_jsonl(self._file, 'r', num_workers=1) as f:
+      with self.assertRaises(ValueError):
+        list(iter(f))
+
+  def test_bad_num_workers(self):
+    with self.assertRaisesRegex(ValueError, '`num_workers` must be positive'):
+      pg_symbolic.open_jsonl(self._file, 'r', num_workers=0)
+
+
 class MemorySequenceIOTest(unittest.TestCase):
 
   def test_read_write(self):
@@ -42,6 +42,10 @@ modules with the following features:
   |                     | :func:`pg.object_utils.to_json`,           |
   |                     |                                            |
   |                     | :func:`pg.object_utils.from_json`,         |
+  |                     |                                            |
+  |                     | :func:`pg.object_utils.to_binary`,         |
+  |                     |                                            |
+  |                     | :func:`pg.object_utils.from_binary`,       |
   +---------------------+--------------------------------------------+
   | Partial construction| :class:`pg.MaybePartial`,                  |
   |                     |                                            |
@@ -81,6 +85,12 @@ from pyglove.core.object_utils.json_conversion import from_json
 from pyglove.core.object_utils.json_conversion import to_json
 from pyglove.core.object_utils.json_conversion import registered_types
 
+# Handling binary conversion.
+from pyglove.core.object_utils.binary_conversion import BinaryEncoder
+from pyglove.core.object_utils.binary_conversion import BinaryDecoder
+from pyglove.core.object_utils.binary_conversion import from_binary
+from pyglove.core.object_utils.binary_conversion import to_binary
+
 # Handling formatting.
 from pyglove.core.object_utils.formatting import Formattable
 from pyglove.core.object_utils.formatting import format            # pylint: disable=redefined-builtin
@@ -110,6 +120,8 @@ from pyglove.core.object_utils.missing import MissingValue
 from pyglove.core.object_utils.missing import MISSING_VALUE
 
 # Handling hierarchical.
+from pyglove.core.object_utils.hierarchical import TraverseAction
+from pyglove.core.object_utils.hierarchical import walk
 from pyglove.core.object_utils.hierarchical import traverse
 from pyglove.core.object_utils.hierarchical import transform
 from pyglove.core.object_utils.hierarchical import flatten
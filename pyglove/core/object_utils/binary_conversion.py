@@ -0,0 +1,486 @@
+# Copyright 2024 The PyGlove Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A compact binary format for JSON values.
+
+The binary format encodes the same JSON values as produced by
+:func:`pg.object_utils.to_json`, with the following differences from JSON
+text:
+
+  * Type names (the values of the '_type' keys) and string dict keys are
+    stored in tables that are shared by all values within a stream, therefore
+    each of them is written only once, and each type name is resolved only
+    once.
+  * Ints are varint-encoded, floats are written as raw IEEE 754 doubles and
+    strings are length-prefixed UTF-8, so no text parsing is involved.
+  * Int dict keys are encoded as ints, without the 'n_:' prefix used in JSON
+    strings.
+
+A stream starts with a 4-byte header, followed by a sequence of records, each
+of which is a varint length followed by one encoded value. Hence a stream can
+be read record by record::
+
+  with open('values.pgb', 'wb') as f:
+    encoder = pg.object_utils.BinaryEncoder(f)
+    encoder.write(pg.to_json(value1))
+    encoder.write(pg.to_json(value2))
+
+  with open('values.pgb', 'rb') as f:
+    for json_value in pg.object_utils.BinaryDecoder(f):
+      print(pg.from_json(json_value))
+
+A stream can also be appended to by a new encoder, e.g. one that writes to a
+file opened in 'ab' mode. The new encoder starts its records with another
+header, upon which the decoder resets its type and key tables.
+"""
+
+import io
+import struct
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pyglove.core.object_utils import json_conversion
+
+
+# Header of a binary stream: magic bytes followed by a version byte.
+_HEADER = b'PGB\x01'
+
+# Value tags.
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3              # Followed by a varint.
+_NEG_INT = 4          # Followed by a varint of the negated value.
+_FLOAT = 5            # Followed by an 8-byte little-endian double.
+_STR = 6              # Followed by a varint length and UTF-8 bytes.
+_LIST = 7             # Followed by a varint size and the items.
+_DICT = 8             # Followed by a varint size and key/value pairs.
+_OBJECT = 9           # Followed by a varint type index, then as _DICT.
+_NEW_OBJECT = 10      # Followed by a type name (as _STR payload), then as
+                      # _DICT. The type name is appended to the type table.
+_KEY = 11             # A string dict key, followed by a varint index.
+_NEW_KEY = 12         # A string dict key (as _STR payload), which is appended
+                      # to the key table.
+
+_DOUBLE = struct.Struct('<d')
+_TYPE_NAME_KEY = json_conversion.JSONConvertible.TYPE_NAME_KEY
+
+
+def _write_varint(buf: bytearray, n: int) -> None:
+  while n > 0x7f:
+    buf.append((n & 0x7f) | 0x80)
+    n >>= 7
+  buf.append(n)
+
+
+class BinaryEncoder:
+  """Writes JSON values to a binary stream."""
+
+  def __init__(self, fp: BinaryIO):
+    """Constructor.
+
+    Args:
+      fp: A file-like object opened for writing bytes. The header is written
+        along with the first value.
+    """
+    self._fp = fp
+    self._header_written = False
+    self._type_indices: Dict[str, int] = {}
+    self._key_indices: Dict[str, int] = {}
+
+  def write(self, json_value: Any) -> None:
+    """Writes a JSON value as a record."""
+    buf = bytearray()
+    new_type_indices, new_key_indices = self._encode(json_value, buf)
+    record = bytearray()
+    if not self._header_written:
+      record += _HEADER
+    _write_varint(record, len(buf))
+    record += buf
+    self._fp.write(bytes(record))
+    # The tables are updated only after the record is written, so a value that
+    # fails to encode does not leave entries that are never written.
+    self._header_written = True
+    self._type_indices.update(new_type_indices)
+    self._key_indices.update(new_key_indices)
+
+  def _encode(
+      self, json_value: Any, buf: bytearray
+  ) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Encodes a JSON value into a buffer.
+
+    Args:
+      json_value: The JSON value to encode.
+      buf: The buffer to write to.
+
+    Returns:
+      A tuple of (new type indices, new key indices) introduced by the value,
+      which are not added to the tables of the encoder.
+    """
+    # NOTE: the state is kept in local variables instead of object attributes
+    # for speed.
+    type_indices = self._type_indices
+    key_indices = self._key_indices
+    new_type_indices = {}
+    new_key_indices = {}
+    append = buf.append
+    pack_double = _DOUBLE.pack
+
+    def write_str(tag: int, v: str) -> None:
+      b = v.encode('utf-8', 'surrogatepass')
+      append(tag)
+      _write_varint(buf, len(b))
+      buf.extend(b)
+
+    def write_pairs(items: Iterable[Tuple[Any, Any]]) -> None:
+      for k, x in items:
+        if type(k) is str:   # pylint: disable=unidiomatic-typecheck
+          index = key_indices.get(k)
+          if index is None:
+            index = new_key_indices.get(k)
+          if index is None:
+            new_key_indices[k] = len(key_indices) + len(new_key_indices)
+            write_str(_NEW_KEY, k)
+          else:
+            append(_KEY)
+            _write_varint(buf, index)
+        else:
+          write_value(k)
+        write_value(x)
+
+    def write_value(v: Any) -> None:
+      t = type(v)
+      if t is str:
+        write_str(_STR, v)
+      elif t is int:
+        if v >= 0:
+          append(_INT)
+          _write_varint(buf, v)
+        else:
+          append(_NEG_INT)
+          _write_varint(buf, -v)
+      elif t is float:
+        append(_FLOAT)
+        buf.extend(pack_double(v))
+      elif v is None:
+        append(_NONE)
+      elif t is bool:
+        append(_TRUE if v else _FALSE)
+      elif isinstance(v, dict):
+        type_name = v.get(_TYPE_NAME_KEY)
+        if isinstance(type_name, str):
+          index = type_indices.get(type_name)
+          if index is None:
+            index = new_type_indices.get(type_name)
+          if index is None:
+            new_type_indices[type_name] = (
+                len(type_indices) + len(new_type_indices))
+            write_str(_NEW_OBJECT, type_name)
+          else:
+            append(_OBJECT)
+            _write_varint(buf, index)
+          _write_varint(buf, len(v) - 1)
+          write_pairs((k, x) for k, x in v.items() if k != _TYPE_NAME_KEY)
+        else:
+          append(_DICT)
+          _write_varint(buf, len(v))
+          write_pairs(v.items())
+      elif isinstance(v, (list, tuple)):
+        append(_LIST)
+        _write_varint(buf, len(v))
+        for x in v:
+          write_value(x)
+      elif isinstance(v, bool):
+        append(_TRUE if v else _FALSE)
+      elif isinstance(v, int):
+        write_value(int(v))
+      elif isinstance(v, float):
+        write_value(float(v))
+      elif isinstance(v, str):
+        write_value(str(v))
+      else:
+        raise TypeError(
+            f'Object of type {type(v).__name__} is not JSON serializable.')
+
+    write_value(json_value)
+    return new_type_indices, new_key_indices
+
+
+class BinaryDecoder:
+  """Reads JSON values from a binary stream record by record.
+
+  The '_type' keys of the decoded values are resolved into their factories
+  the same way as :func:`pg.object_utils.json_conversion.resolve_typenames`
+  does, with each type name resolved once per stream. The values are thus
+  ready to be loaded by :func:`pg.from_json` without resolving type names
+  again.
+  """
+
+  def __init__(
+      self,
+      fp: BinaryIO,
+      auto_import: bool = True,
+      auto_dict: bool = False):
+    """Constructor.
+
+    Args:
+      fp: A file-like object opened for reading bytes.
+      auto_import: If True, when a '_type' is not registered, PyGlove will
+        identify its parent module and automatically import it.
+      auto_dict: If True, dict with '_type' that cannot be loaded will remain
+        as dict, with '_type' renamed to 'type_name'.
+    """
+    self._fp = fp
+    self._auto_import = auto_import
+    self._auto_dict = auto_dict
+    self._header_read = False
+    # A list of (type name, factory). Factory is None if the type cannot be
+    # loaded and `auto_dict` is True.
+    self._types: List[Tuple[str, Optional[Any]]] = []
+    self._keys: List[str] = []
+
+  def read(self) -> Any:
+    """Reads the next value from the stream.
+
+    Returns:
+      The next JSON value.
+
+    Raises:
+      EOFError: If there is no more records in the stream.
+      ValueError: If the stream is malformed.
+    """
+    if not self._header_read:
+      header = self._fp.read(len(_HEADER))
+      if not header:
+        raise EOFError()
+      if header != _HEADER:
+        raise ValueError(f'Not a PyGlove binary stream. Header: {header!r}.')
+      self._header_read = True
+    size, data = self._read_record_size()
+    if size is None:
+      raise EOFError()
+    data += self._fp.read(size - len(data))
+    if len(data) != size:
+      raise ValueError(
+          f'Truncated record: expected {size} bytes, got {len(data)}.')
+    # Entries added to the tables by a record that fails to decode are
+    # discarded, so the tables stay consistent with the encoder's.
+    num_types, num_keys = len(self._types), len(self._keys)
+    try:
+      try:
+        value, pos = self._decode(data)
+      except IndexError as e:
+        raise ValueError('Malformed record.') from e
+      if pos != size:
+        raise ValueError(f'Malformed record: {size - pos} trailing bytes.')
+    except BaseException:
+      del self._types[num_types:]
+      del self._keys[num_keys:]
+      raise
+    return value
+
+  def __iter__(self) -> Iterator[Any]:
+    """Iterates the remaining values in the stream."""
+    while True:
+      try:
+        yield self.read()
+      except EOFError:
+        return
+
+  def _read_record_size(self) -> Tuple[Optional[int], bytes]:
+    """Reads the varint size of the next record.
+
+    A header in place of a record starts the records appended by another
+    encoder, upon which the type and key tables are reset.
+
+    Returns:
+      A tuple of (the size of the next record or None on EOF, the leading
+      bytes of the record that are read ahead).
+    """
+    b = self._fp.read(1)
+    while b == _HEADER[:1]:
+      # NOTE: the first byte of the header is also a valid size of a record,
+      # whose first byte is a value tag. Since no value tag equals to the
+      # second byte of the header, the bytes read ahead tell them apart.
+      ahead = self._fp.read(len(_HEADER) - 1)
+      if b + ahead != _HEADER:
+        return b[0], ahead
+      self._types.clear()
+      self._keys.clear()
+      b = self._fp.read(1)
+    n, shift = 0, 0
+    while True:
+      if not b:
+        if shift == 0:
+          return None, b''
+        raise ValueError('Truncated record size.')
+      n |= (b[0] & 0x7f) << shift
+      if b[0] < 0x80:
+        return n, b''
+      shift += 7
+      b = self._fp.read(1)
+
+  def _add_type(self, type_name: str) -> int:
+    """Resolves a new type name and appends it to the type table."""
+    self._types.append((
+        type_name,
+        json_conversion.factory_from_typename(
+            type_name, self._auto_import, self._auto_dict)))
+    return len(self._types) - 1
+
+  def _decode(self, data: bytes) -> Tuple[Any, int]:
+    """Decodes a record, returning the value and the end position."""
+    # NOTE: decoding is the hot path of loading, therefore the state
+    # is kept in local variables instead of object attributes.
+    pos = 0
+    types = self._types
+    keys = self._keys
+    add_type = self._add_type
+    unpack_double = _DOUBLE.unpack_from
+
+    def read_varint() -> int:
+      nonlocal pos
+      b = data[pos]
+      pos += 1
+      if b < 0x80:
+        return b
+      n, shift = b & 0x7f, 7
+      while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7f) << shift
+        if b < 0x80:
+          return n
+        shift += 7
+
+    def read_str() -> str:
+      nonlocal pos
+      size = read_varint()
+      start = pos
+      pos += size
+      if pos > len(data):
+        raise IndexError()
+      return data[start:pos].decode('utf-8', 'surrogatepass')
+
+    def read_pairs(v: Dict[Any, Any]) -> Dict[Any, Any]:
+      nonlocal pos
+      for _ in range(read_varint()):
+        if data[pos] == _KEY:
+          pos += 1
+          k = keys[read_varint()]
+        else:
+          k = read_value()
+        v[k] = read_value()
+      return v
+
+    def read_value() -> Any:
+      nonlocal pos
+      tag = data[pos]
+      pos += 1
+      if tag == _STR:
+        return read_str()
+      elif tag == _INT:
+        return read_varint()
+      elif tag == _FLOAT:
+        pos += 8
+        return unpack_double(data, pos - 8)[0]
+      elif tag == _LIST:
+        return [read_value() for _ in range(read_varint())]
+      elif tag == _DICT:
+        return read_pairs({})
+      elif tag == _OBJECT or tag == _NEW_OBJECT:
+        index = add_type(read_str()) if tag == _NEW_OBJECT else read_varint()
+        type_name, factory = types[index]
+        if factory is None:
+          v = read_pairs({})
+          v['type_name'] = type_name
+          return v
+        return read_pairs({_TYPE_NAME_KEY: factory})
+      elif tag == _KEY:
+        return keys[read_varint()]
+      elif tag == _NEW_KEY:
+        key = read_str()
+        keys.append(key)
+        return key
+      elif tag == _NONE:
+        return None
+      elif tag == _TRUE:
+        return True
+      elif tag == _FALSE:
+        return False
+      elif tag == _NEG_INT:
+        return -read_varint()
+      raise ValueError(f'Unknown tag {tag} at position {pos - 1}.')
+
+    value = read_value()
+    return value, pos
+
+
+def encode(json_value: Any) -> bytes:
+  """Encodes a JSON value into a binary stream with a single record."""
+  fp = io.BytesIO()
+  BinaryEncoder(fp).write(json_value)
+  return fp.getvalue()
+
+
+def decode(
+    data: bytes,
+    auto_import: bool = True,
+    auto_dict: bool = False) -> Any:
+  """Decodes a JSON value from a binary stream with a single record."""
+  decoder = BinaryDecoder(io.BytesIO(data), auto_import, auto_dict)
+  try:
+    value = decoder.read()
+  except EOFError as e:
+    raise ValueError('Empty binary stream.') from e
+  try:
+    decoder.read()
+  except EOFError:
+    return value
+  raise ValueError('Binary stream contains more than one record.')
+
+
+def to_binary(value: Any, **kwargs) -> bytes:
+  """Serializes a (maybe) JSONConvertible value into bytes.
+
+  Args:
+    value: Value to serialize.
+    **kwargs: Keyword arguments to pass to `to_json`.
+
+  Returns:
+    A binary stream with a single record.
+  """
+  return encode(json_conversion.to_json(value, **kwargs))
+
+
+def from_binary(
+    data: bytes,
+    *,
+    auto_import: bool = True,
+    auto_dict: bool = False,
+    **kwargs) -> Any:
+  """Deserializes a (maybe) JSONConvertible value from bytes.
+
+  Args:
+    data: A binary stream with a single record, e.g. returned from
+      `to_binary`.
+    auto_import: If True, when a '_type' is not registered, PyGlove will
+      identify its parent module and automatically import it.
+    auto_dict: If True, dict with '_type' that cannot be loaded will remain
+      as dict, with '_type' renamed to 'type_name'.
+    **kwargs: Keyword arguments that will be passed to `from_json`.
+
+  Returns:
+    Deserialized value.
+  """
+  return json_conversion.from_json(
+      decode(data, auto_import, auto_dict), _typename_resolved=True, **kwargs)
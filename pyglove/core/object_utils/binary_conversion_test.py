@@ -0,0 +1,181 @@
+# Copyright 2024 The PyGlove Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for pyglove.object_utils.binary_conversion."""
+
+import io
+import math
+import unittest
+from pyglove.core.object_utils import binary_conversion
+from pyglove.core.object_utils import json_conversion
+
+
+class Point(json_conversion.JSONConvertible):
+
+  def __init__(self, x, y):
+    self.x = x
+    self.y = y
+
+  def __eq__(self, other):
+    return (isinstance(other, Point)
+            and self.x == other.x and self.y == other.y)
+
+  def to_json(self, **kwargs):
+    return self.to_json_dict(dict(x=self.x, y=self.y), **kwargs)
+
+  @classmethod
+  def from_json(cls, json_value, **kwargs):
+    del kwargs
+    return cls(json_value['x'], json_value['y'])
+
+
+class BinaryConversionTest(unittest.TestCase):
+
+  def test_encode_decode(self):
+    values = [
+        None, True, False, 0, 127, 128, -1, -300, 2 ** 100, -(2 ** 70),
+        0.0, -1.5, 1e300, float('inf'), '', 'foo', '中文', '\ud800',
+        [], [1, [2.5, 'a'], None], {}, {'a': 1, 2: 'b', 'c': {3: [True]}},
+    ]
+    for v in values:
+      self.assertEqual(
+          binary_conversion.decode(binary_conversion.encode(v)), v)
+    self.assertTrue(math.isnan(
+        binary_conversion.decode(binary_conversion.encode(float('nan')))))
+    # Tuples are encoded as lists, like JSON.
+    self.assertEqual(
+        binary_conversion.decode(binary_conversion.encode((1, 2))), [1, 2])
+
+  def test_encode_compactness(self):
+    json_value = [{'_type': 'foo.Bar', 'xyz': i} for i in range(100)]
+    data = binary_conversion.encode(json_value)
+    self.assertEqual(data.count(b'foo.Bar'), 1)
+    self.assertEqual(data.count(b'xyz'), 1)
+
+  def test_encode_bad_value(self):
+    with self.assertRaisesRegex(TypeError, 'is not JSON serializable'):
+      binary_conversion.encode(object())
+
+  def test_to_binary_from_binary(self):
+    value = [Point(1, 2.5), (Point('a', None), {1: Point(3, 4)})]
+    self.assertEqual(
+        binary_conversion.from_binary(binary_conversion.to_binary(value)),
+        value)
+
+  def test_decode_unknown_types(self):
+    data = binary_conversion.encode(
+        [{'_type': '__main__.Unknown', 'x': 1}] * 2)
+    with self.assertRaisesRegex(TypeError, 'Cannot load class'):
+      binary_conversion.decode(data)
+    with self.assertRaisesRegex(TypeError, 'is not registered'):
+      binary_conversion.decode(data, auto_import=False)
+    self.assertEqual(
+        binary_conversion.decode(data, auto_dict=True),
+        [{'x': 1, 'type_name': '__main__.Unknown'}] * 2)
+
+  def test_streaming(self):
+    fp = io.BytesIO()
+    encoder = binary_conversion.BinaryEncoder(fp)
+    encoder.write(Point(1, 2).to_json())
+    encoder.write([Point(3, 4).to_json(), {'x': 5}])
+    encoder.write(None)
+
+    # Type names are written once per stream.
+    self.assertEqual(fp.getvalue().count(b'.Point'), 1)
+
+    fp.seek(0)
+    decoder = binary_conversion.BinaryDecoder(fp)
+    self.assertEqual(
+        [json_conversion.from_json(v, _typename_resolved=True)
+         for v in decoder],
+        [Point(1, 2), [Point(3, 4), {'x': 5}], None])
+    with self.assertRaises(EOFError):
+      decoder.read()
+
+    # Empty stream.
+    self.assertEqual(
+        list(binary_conversion.BinaryDecoder(io.BytesIO(b''))), [])
+
+  def test_appended_streams(self):
+    fp = io.BytesIO()
+    encoder = binary_conversion.BinaryEncoder(fp)
+    encoder.write(Point(1, 2).to_json())
+    encoder.write({'x': 3})
+
+    # A new encoder appends records with its own type and key tables.
+    encoder = binary_conversion.BinaryEncoder(fp)
+    encoder.write({'y': 4, 'x': 5})
+    encoder.write([Point(6, 7).to_json(), {'x': 8}])
+    self.assertEqual(fp.getvalue().count(b'.Point'), 2)
+
+    # A record whose size equals to the first byte of the header.
+    encoder.write('a' * (binary_conversion._HEADER[0] - 2))  # pylint: disable=protected-access
+
+    fp.seek(0)
+    self.assertEqual(
+        [json_conversion.from_json(v, _typename_resolved=True)
+         for v in binary_conversion.BinaryDecoder(fp)],
+        [Point(1, 2), {'x': 3}, {'y': 4, 'x': 5},
+         [Point(6, 7), {'x': 8}], 'a' * (binary_conversion._HEADER[0] - 2)])  # pylint: disable=protected-access
+
+  def test_failed_write(self):
+    fp = io.BytesIO()
+    encoder = binary_conversion.BinaryEncoder(fp)
+    with self.assertRaisesRegex(TypeError, 'is not JSON serializable'):
+      encoder.write({'_type': 'foo.Bar', 'x': 1, 'y': object()})
+    self.assertEqual(fp.getvalue(), b'')
+    # Type names and keys of the failed record are written with the next
+    # record that uses them.
+    encoder.write({'_type': 'foo.Bar', 'x': 1})
+    encoder.write({'x': 2, 'y': 3})
+    fp.seek(0)
+    self.assertEqual(
+        list(binary_conversion.BinaryDecoder(fp, auto_dict=True)),
+        [{'type_name': 'foo.Bar', 'x': 1}, {'x': 2, 'y': 3}])
+
+  def test_failed_read(self):
+    fp = io.BytesIO()
+    encoder = binary_conversion.BinaryEncoder(fp)
+    encoder.write({'a': 1})
+    encoder.write([{'b': 1}, {'_type': '__main__.Unknown', 'c': 2}])
+    fp.seek(0)
+    decoder = binary_conversion.BinaryDecoder(fp, auto_import=False)
+    self.assertEqual(decoder.read(), {'a': 1})
+    with self.assertRaisesRegex(TypeError, 'is not registered'):
+      decoder.read()
+    # Entries of the failed record are discarded.
+    self.assertEqual(decoder._keys, ['a'])  # pylint: disable=protected-access
+    self.assertEqual(decoder._types, [])  # pylint: disable=protected-access
+
+  def test_decode_bad_data(self):
+    data = binary_conversion.encode({'x': [1, 'abc']})
+    with self.assertRaisesRegex(ValueError, 'Not a PyGlove binary stream'):
+      binary_conversion.decode(b'{"x": 1}')
+    with self.assertRaisesRegex(ValueError, 'Empty binary stream'):
+      binary_conversion.decode(b'')
+    with self.assertRaisesRegex(ValueError, 'Truncated record'):
+      binary_conversion.decode(data[:-1])
+    with self.assertRaisesRegex(ValueError, 'more than one record'):
+      binary_conversion.decode(data + data[4:])
+    with self.assertRaisesRegex(ValueError, 'Malformed record: 1 trailing'):
+      binary_conversion.decode(
+          data[:4] + bytes([data[4] + 1]) + data[5:] + b'\x00')
+    with self.assertRaisesRegex(ValueError, 'Malformed record'):
+      # A string of 5 bytes without content.
+      binary_conversion.decode(data[:4] + b'\x02\x06\x05')
+    with self.assertRaisesRegex(ValueError, 'Unknown tag'):
+      binary_conversion.decode(data[:4] + b'\x01\xff')
+
+
+if __name__ == '__main__':
+  unittest.main()
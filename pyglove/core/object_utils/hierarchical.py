@@ -13,12 +13,175 @@
 # limitations under the License.
 """Operating hierarchical object."""
 
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from pyglove.core.object_utils import common_traits
 from pyglove.core.object_utils.missing import MISSING_VALUE
 from pyglove.core.object_utils.value_location import KeyPath
 
 
+class TraverseAction(enum.Enum):
+  """Enum for the next action after a node is visited.
+
+  See also: :func:`pyglove.traverse`.
+  """
+
+  # Traverse should immediately stop.
+  STOP = 0
+
+  # Traverse should enter sub-tree if sub-tree exists and traverse is in
+  # pre-order. For post-order traverse, it has the same effect as CONTINUE.
+  ENTER = 1
+
+  # Traverse should continue to next node without entering the sub-tree.
+  CONTINUE = 2
+
+
+def walk(
+    value: Any,
+    children_fn: Callable[[Any], Optional[Iterable[Tuple[Any, Any]]]],
+    preorder_visitor_fn: Optional[
+        Callable[[KeyPath, Any, Any], Optional[TraverseAction]]] = None,
+    postorder_visitor_fn: Optional[
+        Callable[[KeyPath, Any, Any], Optional[TraverseAction]]] = None,
+    root_path: Optional[KeyPath] = None,
+    parent: Optional[Any] = None,
+    postorder_on_stop: bool = True) -> bool:
+  """Walks a tree with an explicit stack, which is the engine of traversals.
+
+  Unlike recursive traversals, `walk` is not bounded by the recursion limit of
+  Python. Besides, the key paths passed to the visitor functions are built
+  lazily: a path is a light-weight node pointing to its parent path, whose
+  keys are materialized only when they are accessed by the visitor.
+
+  Example::
+
+    def children(v):
+      if isinstance(v, dict):
+        return v.items()
+      return None
+
+    def visit(path, value, parent):
+      print(path.key, value)
+      return pg.object_utils.TraverseAction.ENTER
+
+    pg.object_utils.walk({'a': {'b': 1}}, children, visit)
+
+  Args:
+    value: The root of the tree.
+    children_fn: A function that returns an iterable of (key, child) for a
+      node, or None if the node is a leaf. Children are iterated lazily.
+    preorder_visitor_fn: Preorder visitor function in signature
+      `(path, value, parent) -> action`. A return value of None is treated as
+      `TraverseAction.ENTER`.
+    postorder_visitor_fn: Postorder visitor function in signature
+      `(path, value, parent) -> action`.
+    root_path: The key path of the root value.
+    parent: Optional parent of the root value.
+    postorder_on_stop: If True, when a visitor function returns
+      `TraverseAction.STOP`, the postorder visitor function will still be
+      called on the stopped node and its ancestors. Otherwise the walk returns
+      immediately.
+
+  Returns:
+    True if no visitor function returns `TraverseAction.STOP`, otherwise False.
+  """
+  stop, enter = TraverseAction.STOP, TraverseAction.ENTER
+  stopped = False
+
+  # Each frame is a tuple of (path, node, parent, iterator of children).
+  stack = []
+  path, node, node_parent = root_path or KeyPath(), value, parent
+  while True:
+    action = (preorder_visitor_fn(path, node, node_parent)
+              if preorder_visitor_fn is not None else None)
+    children = None
+    if action is None or action is enter:
+      children = children_fn(node)
+    elif action is stop:
+      stopped = True
+      if not postorder_on_stop:
+        return False
+
+    if children is not None:
+      stack.append((path, node, node_parent, iter(children)))
+    elif (postorder_visitor_fn is not None
+          and postorder_visitor_fn(path, node, node_parent) is stop):
+      stopped = True
+      if not postorder_on_stop:
+        return False
+
+    # Move to the next node, visiting the exhausted nodes in post-order.
+    while stack:
+      parent_path, parent_node, grandparent, children = stack[-1]
+      if not stopped:
+        child = next(children, _END)
+        if child is not _END:
+          key, node = child
+          path, node_parent = _LazyKeyPath(key, parent_path), parent_node
+          break
+      stack.pop()
+      if (postorder_visitor_fn is not None
+          and postorder_visitor_fn(
+              parent_path, parent_node, grandparent) is stop):
+        stopped = True
+        if not postorder_on_stop:
+          return False
+    else:
+      return not stopped
+
+
+# Sentinel for exhausted iterators.
+_END = object()
+
+
+class _LazyKeys:
+  """Non-data descriptor that materializes the keys of a `_LazyKeyPath`."""
+
+  def __get__(self, path: Optional['_LazyKeyPath'], owner: Any = None) -> Any:
+    if path is None:
+      return self
+    # Materialize the unmaterialized ancestors top-down without recursion.
+    # The keys are stored in the instance dict, which shadows this descriptor
+    # on subsequent accesses.
+    pending = [path]
+    current = path._parent  # pylint: disable=protected-access
+    while '_keys' not in current.__dict__:
+      pending.append(current)
+      current = current._parent  # pylint: disable=protected-access
+    keys = current._keys  # pylint: disable=protected-access
+    for p in reversed(pending):
+      keys = keys + [p._key]  # pylint: disable=protected-access
+      p.__dict__['_keys'] = keys
+    return keys
+
+
+class _LazyKeyPath(KeyPath):
+  """A key path whose keys are materialized from its parent upon access."""
+
+  def __init__(self, key: Any, parent: KeyPath):  # pylint: disable=super-init-not-called
+    self._key = key
+    self._parent = parent
+    self._path_str = None
+
+  _keys = _LazyKeys()
+
+  @property
+  def key(self) -> Any:
+    """The rightmost key of this path."""
+    return self._key
+
+
+def _hierarchical_children(
+    value: Any) -> Optional[Iterable[Tuple[Any, Any]]]:
+  """Returns the children of a dict or a list."""
+  if isinstance(value, dict):
+    return value.items()
+  elif isinstance(value, list):
+    return enumerate(value)
+  return None
+
+
 def traverse(value: Any,
              preorder_visitor_fn: Optional[Callable[[KeyPath, Any],
                                                     bool]] = None,
@@ -57,32 +220,20 @@ def traverse(value: Any,
   Returns:
     Whether visitor function returns True on all nodes.
   """
-  root_path = root_path or KeyPath()
-  def no_op_visitor(key, value):
-    del key, value
-    return True
-
-  if preorder_visitor_fn is None:
-    preorder_visitor_fn = no_op_visitor
-  if postorder_visitor_fn is None:
-    postorder_visitor_fn = no_op_visitor
-
-  if not preorder_visitor_fn(root_path, value):
-    return False
-  if isinstance(value, dict):
-    for k in value.keys():
-      if not traverse(
-          value[k], preorder_visitor_fn, postorder_visitor_fn,
-          KeyPath(k, root_path)):
-        return False
-  elif isinstance(value, list):
-    for i, v in enumerate(value):
-      if not traverse(
-          v, preorder_visitor_fn, postorder_visitor_fn, KeyPath(i, root_path)):
-        return False
-  if not postorder_visitor_fn(root_path, value):
-    return False
-  return True
+  def _as_walk_visitor(visitor_fn):
+    if visitor_fn is None:
+      return None
+    def _visit(path, value, parent):
+      del parent
+      if visitor_fn(path, value):
+        return TraverseAction.ENTER
+      return TraverseAction.STOP
+    return _visit
+
+  return walk(value, _hierarchical_children,
+              _as_walk_visitor(preorder_visitor_fn),
+              _as_walk_visitor(postorder_visitor_fn),
+              root_path, postorder_on_stop=False)
 
 
 def transform(value: Any,
@@ -131,29 +282,39 @@ def transform(value: Any,
   Returns:
     Transformed value.
   """
-  def _transform(value: Any, current_path: KeyPath) -> Any:
-    """Implementation of transform function."""
+  # A stack of the transformed (key, value) pairs for the children of the
+  # containers being walked. The bottom holds the transformed root.
+  outputs = [[]]
+
+  def _children(value):
+    children = _hierarchical_children(value)
+    if children is not None:
+      outputs.append([])
+    return children
+
+  def _transform(path, value, parent):
+    """Transforms a node after its children are transformed."""
+    del parent
     new_value = value
     if isinstance(value, dict):
+      children = outputs.pop()
       if not inplace:
         new_value = value.__class__()
       deleted_keys = []
-      for k, v in value.items():
-        nv = _transform(v, KeyPath(k, current_path))
+      for k, nv in children:
         if MISSING_VALUE != nv:
           if not inplace or value[k] is not nv:
             new_value[k] = nv
         elif inplace:
           deleted_keys.append(k)
-
       for k in deleted_keys:
         del value[k]
     elif isinstance(value, list):
+      children = outputs.pop()
       deleted_indices = []
       if not inplace:
         new_value = value.__class__()
-      for i, v in enumerate(value):
-        nv = _transform(v, KeyPath(i, current_path))
+      for i, nv in children:
         if MISSING_VALUE != nv:
           if not inplace:
             new_value.append(nv)
@@ -163,8 +324,12 @@ def transform(value: Any,
           deleted_indices.append(i)
       for i in reversed(deleted_indices):
         del value[i]
-    return transform_fn(current_path, new_value)
-  return _transform(value, root_path or KeyPath())
+    outputs[-1].append(
+        (path.key if len(outputs) > 1 else None,
+         transform_fn(path, new_value)))
+
+  walk(value, _children, None, _transform, root_path)
+  return outputs[0][0][1]
 
 
 def flatten(src: Any, flatten_complex_keys: bool = True) -> Any:
@@ -261,11 +426,11 @@ def flatten(src: Any, flatten_complex_keys: bool = True) -> Any:
     return src
 
   dest = dict()
-  def _output_leaf(path: KeyPath, value: Any):
-    if path and (not isinstance(value, (dict, list)) or not value):
+  def _output_leaf(path: KeyPath, value: Any, parent: Any):
+    del parent
+    if (not isinstance(value, (dict, list)) or not value) and path:
       dest[path.path_str(not flatten_complex_keys)] = value
-    return True
-  traverse(src, postorder_visitor_fn=_output_leaf)
+  walk(src, _hierarchical_children, postorder_visitor_fn=_output_leaf)
   return dest
 
 
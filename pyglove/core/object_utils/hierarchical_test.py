@@ -125,6 +125,90 @@ class TraverseTest(unittest.TestCase):
     ])
 
 
+class WalkTest(unittest.TestCase):
+  """Tests for walk method."""
+
+  def test_actions(self):
+    tree = {'a': [{'c': [1, 2]}, {'d': {'g': (3, 4)}}], 'b': 'foo'}
+    children = hierarchical._hierarchical_children  # pylint: disable=protected-access
+    visited = []
+
+    def previsit_fn(p, v, parent):
+      del v, parent
+      visited.append(('pre', str(p)))
+      if p == 'a[0]':
+        return hierarchical.TraverseAction.CONTINUE
+      if p == 'a[1].d':
+        return hierarchical.TraverseAction.STOP
+      return None
+
+    def postvisit_fn(p, v, parent):
+      del v, parent
+      visited.append(('post', str(p)))
+
+    self.assertFalse(
+        hierarchical.walk(tree, children, previsit_fn, postvisit_fn))
+    self.assertEqual(visited, [
+        ('pre', ''),
+        ('pre', 'a'),
+        ('pre', 'a[0]'),
+        ('post', 'a[0]'),
+        ('pre', 'a[1]'),
+        ('pre', 'a[1].d'),
+        ('post', 'a[1].d'),
+        ('post', 'a[1]'),
+        ('post', 'a'),
+        ('post', ''),
+    ])
+
+    visited[:] = []
+    self.assertFalse(
+        hierarchical.walk(tree, children, previsit_fn, postvisit_fn,
+                          postorder_on_stop=False))
+    self.assertEqual(visited[-2:], [('pre', 'a[1]'), ('pre', 'a[1].d')])
+
+  def test_lazy_paths(self):
+    tree = {'a': {'b': [1, {'c': 2}]}}
+    paths = {}
+
+    def visit_fn(p, v, parent):
+      del parent
+      paths[id(v)] = p
+      return hierarchical.TraverseAction.ENTER
+
+    hierarchical.walk(
+        tree, hierarchical._hierarchical_children, visit_fn,  # pylint: disable=protected-access
+        root_path=value_location.KeyPath('x'))
+    path = paths[id(tree['a']['b'][1])]
+    self.assertIsInstance(path, value_location.KeyPath)
+    self.assertNotIn('_keys', path.__dict__)
+    self.assertEqual(path.key, 1)
+    self.assertEqual(path, 'x.a.b[1]')
+    self.assertEqual(paths[id(tree['a']['b'])].keys, ['x', 'a', 'b'])
+    self.assertEqual(
+        value_location.KeyPath('c', path), 'x.a.b[1].c')
+
+  def test_deep_tree(self):
+    depth = 10000
+    tree = 1
+    for _ in range(depth):
+      tree = [tree]
+    leaves = []
+
+    def visit_fn(p, v):
+      if not isinstance(v, list):
+        leaves.append((p, v))
+      return True
+
+    self.assertTrue(hierarchical.traverse(tree, visit_fn))
+    self.assertEqual(len(leaves), 1)
+    self.assertEqual(leaves[0][0].depth, depth)
+    self.assertEqual(len(hierarchical.flatten(tree)), 1)
+    output = hierarchical.transform(
+        tree, lambda p, v: v + 1 if isinstance(v, int) else v, inplace=False)
+    self.assertEqual(list(hierarchical.flatten(output).values()), [2])
+
+
 class ListifyDictWithIntKeysTest(unittest.TestCase):
   """Tests for try_listify_dict_with_int_keys."""
 
@@ -16,11 +16,13 @@
 import abc
 import base64
 import collections
+import concurrent.futures
 import contextlib
 import importlib
 import inspect
 import marshal
 import pickle
+import sys
 import types
 import typing
 from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Union
@@ -58,7 +60,13 @@ class _TypeRegistry:
     # registered for a user class.
     self._type_to_cls_map = dict()
     self._prefix_mapping = dict()
+    self._lazy_modules = []
     self._ondemand_registry_stack = []
+    # Cache for resolved type names, including those resolved via module
+    # aliases and lazy modules.
+    self._resolved_cache = dict()
+    self._cache_hits = 0
+    self._cache_misses = 0
 
   def register(
       self, type_name: str, cls: Type[Any], override_existing: bool = False
@@ -81,11 +89,31 @@ class _TypeRegistry:
       raise KeyError(
           f'Type {type_name!r} has already been registered with class '
           f'{self._type_to_cls_map[type_name].__name__}.')
+    if type_name in self._type_to_cls_map:
+      # Type names resolved via module aliases may refer to the overridden
+      # class.
+      self._resolved_cache.clear()
+    else:
+      self._resolved_cache.pop(type_name, None)
     self._type_to_cls_map[type_name] = cls
 
   def add_module_alias(self, module: str, alias: str) -> None:
     """Maps a module name to another name. Usually due to rename."""
     self._prefix_mapping[alias] = module
+    self._resolved_cache.clear()
+
+  def add_lazy_module(self, module: str) -> None:
+    """Adds a module to import when looking up a type name under it."""
+    self._lazy_modules.append(module)
+
+  def _import_lazy_modules(self, type_name: str) -> bool:
+    """Imports the lazy modules that may define a type name."""
+    imported = False
+    for module in self._lazy_modules:
+      if type_name.startswith(f'{module}.') and module not in sys.modules:
+        importlib.import_module(module)
+        imported = True
+    return imported
 
   def is_registered(self, type_name: str) -> bool:
     """Returns whether a type name is registered."""
@@ -117,6 +145,12 @@ class _TypeRegistry:
       if class_name in top_registry:
         return top_registry[class_name]
 
+    cls = self._resolved_cache.get(type_name, None)
+    if cls is not None:
+      self._cache_hits += 1
+      return cls
+    self._cache_misses += 1
+
     cls = self._type_to_cls_map.get(type_name, None)
     if cls is None:
       # Modules could be renamed, to load legacy serialized objects, we
@@ -127,13 +161,32 @@ class _TypeRegistry:
           cls = self._type_to_cls_map.get(remapped_type_name, None)
           if cls is not None:
             break
+    if cls is None and self._import_lazy_modules(type_name):
+      cls = self.class_from_typename(type_name)
+    if cls is not None:
+      self._resolved_cache[type_name] = cls
     return cls
 
+  def cache_info(self) -> 'TypeNameCacheInfo':
+    """Returns the statistics of the cache for resolved type names."""
+    return TypeNameCacheInfo(
+        self._cache_hits, self._cache_misses, len(self._resolved_cache))
+
+  def clear_cache(self) -> None:
+    """Clears the cache for resolved type names and its statistics."""
+    self._resolved_cache.clear()
+    self._cache_hits = 0
+    self._cache_misses = 0
+
   def iteritems(self) -> Iterable[Tuple[str, Type[Any]]]:
     """Iterate type registry."""
     return self._type_to_cls_map.items()
 
 
+TypeNameCacheInfo = collections.namedtuple(
+    'TypeNameCacheInfo', ['hits', 'misses', 'currsize'])
+
+
 class JSONConvertible(metaclass=abc.ABCMeta):
   """Interface for classes whose instances are convertible from/to JSON.
 
@@ -249,6 +302,19 @@ class JSONConvertible(metaclass=abc.ABCMeta):
     """Adds a module alias so previous serialized objects could be loaded."""
     cls._TYPE_REGISTRY.add_module_alias(source_name, target_name)
 
+  @classmethod
+  def add_lazy_module(cls, module: str) -> None:
+    """Adds a module to import upon deserializing a type name under it.
+
+    This allows a module that defines JSON convertible classes to be loaded
+    lazily, while values of these classes can still be deserialized without
+    importing the module explicitly.
+
+    Args:
+      module: The full name of the module.
+    """
+    cls._TYPE_REGISTRY.add_lazy_module(module)
+
   @classmethod
   def is_registered(cls, type_name: str) -> bool:
     """Returns True if a type name is registered. Otherwise False."""
@@ -268,6 +334,22 @@ class JSONConvertible(metaclass=abc.ABCMeta):
     """
     return cls._TYPE_REGISTRY.class_from_typename(type_name)
 
+  @classmethod
+  def typename_cache_info(cls) -> TypeNameCacheInfo:
+    """Returns the hits and misses of looking up registered type names.
+
+    Lookups within `load_types_for_deserialization` are not counted.
+
+    Returns:
+      A named tuple of (hits, misses, currsize).
+    """
+    return cls._TYPE_REGISTRY.cache_info()
+
+  @classmethod
+  def clear_typename_cache(cls) -> None:
+    """Clears the cache for looking up registered type names."""
+    cls._TYPE_REGISTRY.clear_cache()
+
   @classmethod
   def registered_types(cls) -> Iterable[Tuple[str, Type['JSONConvertible']]]:
     """Returns an iterator of registered (serialization key, class) tuples."""
@@ -490,78 +572,179 @@ def from_json(
   return json_value
 
 
-def resolve_typenames(
-    json_value: JSONValueType,
+def factory_from_typename(
+    type_name: str,
     auto_import: bool = True,
     auto_dict: bool = False
-) -> JSONValueType:
-  """Inplace resolves the "_type" keys with their factories in a JSON tree."""
-
-  def _resolve_typename(v: Dict[str, Any]) -> bool:
-    """Returns True if the subtree is resolved for the first time."""
-    if JSONConvertible.TYPE_NAME_KEY not in v:
-      return True
-    if not isinstance(v[JSONConvertible.TYPE_NAME_KEY], str):
-      return False
-    type_name = v[JSONConvertible.TYPE_NAME_KEY]
-    if type_name == 'type':
-      factory_fn = _type_from_json
-    elif type_name == 'function':
-      factory_fn = _function_from_json
-    elif type_name == 'method':
-      factory_fn = _method_from_json
-    else:
-      cls = JSONConvertible.class_from_typename(type_name)
-      if cls is None:
-        if auto_import:
-          try:
-            cls = _load_symbol(type_name)
-            assert inspect.isclass(cls), cls
-          except (ModuleNotFoundError, AttributeError) as e:
-            if not auto_dict:
-              raise TypeError(
-                  f'Cannot load class {type_name!r}.\n'
-                  'Try pass `auto_dict=True` to load the object into a dict '
-                  'without depending on the type.'
-              ) from e
-        elif not auto_dict:
+) -> Optional[Callable[..., Any]]:
+  """Returns the factory for creating values from JSON dicts of a type name.
+
+  Args:
+    type_name: The value of the '_type' key of a JSON dict.
+    auto_import: If True, unregistered types will be imported from their
+      modules.
+    auto_dict: If True, returns None when the type cannot be loaded.
+
+  Returns:
+    A callable that takes a JSON dict (without the '_type' key) and keyword
+    arguments, and returns the deserialized value. Or None if the type cannot
+    be loaded while `auto_dict` is True.
+
+  Raises:
+    TypeError: If the type cannot be loaded while `auto_dict` is False.
+  """
+  if type_name == 'type':
+    return _type_from_json
+  elif type_name == 'function':
+    return _function_from_json
+  elif type_name == 'method':
+    return _method_from_json
+
+  cls = JSONConvertible.class_from_typename(type_name)
+  if cls is None:
+    if auto_import:
+      try:
+        cls = _load_symbol(type_name)
+        assert inspect.isclass(cls), cls
+      except (ModuleNotFoundError, AttributeError) as e:
+        if not auto_dict:
           raise TypeError(
-              f'Type name \'{type_name}\' is not registered '
-              'with a `pg.JSONConvertible` subclass.\n'
-              'Try pass `auto_import=True` to load the type from its module, '
-              'or pass `auto_dict=True` to load the object into a dict '
+              f'Cannot load class {type_name!r}.\n'
+              'Try pass `auto_dict=True` to load the object into a dict '
               'without depending on the type.'
-          )
-
-      factory_fn = getattr(cls, 'from_json', None)
-      if cls is not None and factory_fn is None and not auto_dict:
-        raise TypeError(
-            f'{cls} is not a `pg.JSONConvertible` subclass.'
-            'Try pass `auto_dict=True` to load the object into a dict '
-            'without depending on the type.'
-        )
-
-      if factory_fn is None and auto_dict:
-        v['type_name'] = type_name
-        v.pop(JSONConvertible.TYPE_NAME_KEY)
-        return True
-      assert factory_fn is not None
+          ) from e
+    elif not auto_dict:
+      raise TypeError(
+          f'Type name \'{type_name}\' is not registered '
+          'with a `pg.JSONConvertible` subclass.\n'
+          'Try pass `auto_import=True` to load the type from its module, '
+          'or pass `auto_dict=True` to load the object into a dict '
+          'without depending on the type.'
+      )
 
+  factory_fn = getattr(cls, 'from_json', None)
+  if cls is not None and factory_fn is None and not auto_dict:
+    raise TypeError(
+        f'{cls} is not a `pg.JSONConvertible` subclass.'
+        'Try pass `auto_dict=True` to load the object into a dict '
+        'without depending on the type.'
+    )
+  return factory_fn
+
+
+def _assign_factory(
+    v: Dict[str, Any],
+    type_name: str,
+    factory_fn: Optional[Callable[..., Any]]) -> None:
+  """Replaces the type name of a JSON dict with its factory."""
+  if factory_fn is None:
+    v['type_name'] = type_name
+    # NOTE: a dict may be referenced multiple times within a tree.
+    v.pop(JSONConvertible.TYPE_NAME_KEY, None)
+  else:
     v[JSONConvertible.TYPE_NAME_KEY] = factory_fn
+
+
+def resolve_typename(
+    v: Dict[str, Any],
+    auto_import: bool = True,
+    auto_dict: bool = False,
+    factories: Optional[Dict[str, Optional[Callable[..., Any]]]] = None,
+) -> bool:
+  """Inplace resolves the "_type" key of a JSON dict with its factory.
+
+  Args:
+    v: A JSON dict.
+    auto_import: If True, unregistered types will be imported from their
+      modules.
+    auto_dict: If True, a dict whose type cannot be loaded will have its
+      '_type' renamed to 'type_name'.
+    factories: An optional table of type names to their resolved factories
+      (see `factory_from_typename`), which is looked up and updated. It can
+      be shared across the dicts of the same document for resolving each type
+      name only once.
+
+  Returns:
+    True if the dict is resolved for the first time.
+  """
+  if JSONConvertible.TYPE_NAME_KEY not in v:
     return True
+  type_name = v[JSONConvertible.TYPE_NAME_KEY]
+  if not isinstance(type_name, str):
+    return False
+  if factories is None:
+    factory_fn = factory_from_typename(type_name, auto_import, auto_dict)
+  elif type_name in factories:
+    factory_fn = factories[type_name]
+  else:
+    factory_fn = factory_from_typename(type_name, auto_import, auto_dict)
+    factories[type_name] = factory_fn
+  _assign_factory(v, type_name, factory_fn)
+  return True
+
+
+def resolve_typenames(
+    json_value: JSONValueType,
+    auto_import: bool = True,
+    auto_dict: bool = False,
+    max_workers: Optional[int] = None,
+) -> JSONValueType:
+  """Inplace resolves the "_type" keys with their factories in a JSON tree.
+
+  Type names are resolved in two phases: the tree is first scanned for the
+  dicts with unresolved type names, then each distinct type name is resolved
+  only once, whose factory is assigned to all the dicts of the type name.
+
+  Args:
+    json_value: A JSON tree.
+    auto_import: If True, unregistered types will be imported from their
+      modules.
+    auto_dict: If True, dicts whose types cannot be loaded will have their
+      '_type' renamed to 'type_name'.
+    max_workers: If not None, the distinct type names will be resolved with a
+      thread pool of this size, which speeds up loading documents of many
+      types that need to be imported.
+
+  Returns:
+    `json_value` with its type names resolved.
+  """
+  # Phase 1: collect the dicts with unresolved type names by type name.
+  dicts_by_typename = collections.defaultdict(list)
 
   def _visit(v) -> None:
     if isinstance(v, (tuple, list)):
       for x in v:
         _visit(x)
     elif isinstance(v, dict):
-      if _resolve_typename(v):
-        # Only resolve children when _types in this tree is not resolved
-        # previously
-        for x in v.values():
-          _visit(x)
+      if JSONConvertible.TYPE_NAME_KEY in v:
+        type_name = v[JSONConvertible.TYPE_NAME_KEY]
+        if not isinstance(type_name, str):
+          # Only resolve children when _types in this tree is not resolved
+          # previously
+          return
+        dicts_by_typename[type_name].append(v)
+      for x in v.values():
+        _visit(x)
 
   _visit(json_value)
+  if not dicts_by_typename:
+    return json_value
+
+  # Phase 2: resolve each type name once and assign its factory to the dicts.
+  def _resolve(type_name):
+    return factory_from_typename(type_name, auto_import, auto_dict)
+
+  type_names = list(dicts_by_typename.keys())
+  if max_workers is None or len(type_names) == 1:
+    factories = [_resolve(t) for t in type_names]
+  else:
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+      # NOTE: errors are raised in the order of type names.
+      factories = list(executor.map(_resolve, type_names))
+
+  for type_name, factory_fn in zip(type_names, factories):
+    for v in dicts_by_typename[type_name]:
+      _assign_factory(v, type_name, factory_fn)
   return json_value
 
 
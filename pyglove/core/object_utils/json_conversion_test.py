@@ -151,6 +151,98 @@ class JSONConvertibleTest(unittest.TestCase):
         []
     )
 
+  def test_typename_cache(self):
+
+    class E(json_conversion.JSONConvertible):
+
+      def to_json(self):
+        return self.__class__.to_json_dict({})
+
+    class F(E):
+      pass
+
+    registry = json_conversion.JSONConvertible
+    type_name = f'{E.__module__}.{E.__qualname__}'
+    registry.clear_typename_cache()
+    self.assertEqual(registry.typename_cache_info(), (0, 0, 0))
+    self.assertIs(registry.class_from_typename(type_name), E)
+    self.assertIs(registry.class_from_typename(type_name), E)
+    self.assertEqual(registry.typename_cache_info(), (1, 1, 1))
+
+    # Misses are not cached.
+    self.assertIsNone(registry.class_from_typename('__main__.NotExist'))
+    self.assertIsNone(registry.class_from_typename('__main__.NotExist'))
+    self.assertEqual(registry.typename_cache_info(), (1, 3, 1))
+
+    # Type names resolved via module aliases are cached.
+    registry.add_module_alias(E.__module__, 'my_cached_module')
+    alias_name = f'my_cached_module.{E.__qualname__}'
+    self.assertIs(registry.class_from_typename(alias_name), E)
+    self.assertIs(registry.class_from_typename(alias_name), E)
+    self.assertEqual(registry.typename_cache_info(), (2, 4, 1))
+
+    # Overriding a registered type invalidates the cache.
+    registry.register(type_name, F, override_existing=True)
+    self.assertEqual(registry.typename_cache_info().currsize, 0)
+    self.assertIs(registry.class_from_typename(type_name), F)
+    self.assertIs(registry.class_from_typename(alias_name), F)
+
+    registry.clear_typename_cache()
+    self.assertEqual(registry.typename_cache_info(), (0, 0, 0))
+
+  def test_resolve_typenames(self):
+
+    class G(json_conversion.JSONConvertible):
+
+      def __init__(self, x=None):
+        super().__init__()
+        self.x = x
+
+      def to_json(self):
+        return self.__class__.to_json_dict({'x': self.x})
+
+    type_name = f'{G.__module__}.{G.__qualname__}'
+    for max_workers in (None, 4):
+      shared = {'_type': 'Unknown type'}
+      json_value = [
+          {'_type': type_name, 'x': {'_type': type_name}},
+          {'_type': type_name, 'x': [shared, shared]},
+          {'_type': 'function', 'name': 'builtins.print'},
+      ]
+      self.assertIs(
+          json_conversion.resolve_typenames(
+              json_value, auto_dict=True, max_workers=max_workers),
+          json_value)
+      self.assertEqual(json_value[0]['_type'], G.from_json)
+      # Each type name is resolved only once.
+      self.assertIs(json_value[0]['x']['_type'], json_value[0]['_type'])
+      self.assertIs(json_value[1]['_type'], json_value[0]['_type'])
+      self.assertEqual(shared, {'type_name': 'Unknown type'})
+      self.assertTrue(callable(json_value[2]['_type']))
+      # Resolved trees are not resolved again.
+      factory_fn = json_value[0]['_type']
+      json_conversion.resolve_typenames(json_value)
+      self.assertIs(json_value[0]['_type'], factory_fn)
+
+      with self.assertRaisesRegex(TypeError, 'Cannot load class'):
+        json_conversion.resolve_typenames(
+            [{'_type': type_name}, {'_type': '__main__.NotExist'}],
+            max_workers=max_workers)
+
+    # Resolution with a table of factories.
+    factories = {}
+    v1, v2 = {'_type': type_name}, {'_type': 'Unknown type'}
+    json_conversion.resolve_typename(v1, factories=factories)
+    json_conversion.resolve_typename(v2, auto_dict=True, factories=factories)
+    self.assertEqual(
+        factories, {type_name: G.from_json, 'Unknown type': None})
+    self.assertEqual(v2, {'type_name': 'Unknown type'})
+    # Type names are looked up from the table first.
+    factories['Unknown type'] = G.from_json
+    v3 = {'_type': 'Unknown type'}
+    json_conversion.resolve_typename(v3, factories=factories)
+    self.assertEqual(v3['_type'], G.from_json)
+
   def test_json_conversion(self):
 
     class T(json_conversion.JSONConvertible):
@@ -71,15 +71,14 @@ class KeyPath(formatting.Formattable):
         string form.
       parent: Parent KeyPath.
     """
-    if key_or_key_list is None:
-      key_or_key_list = []
-    elif not isinstance(key_or_key_list, (tuple, list)):
-      key_or_key_list = [key_or_key_list]
-
-    keys = []
-    if parent:
-      keys.extend(parent.keys)
-    keys.extend(key_or_key_list)
+    if parent is not None:
+      keys = list(parent._keys)  # pylint: disable=protected-access
+    else:
+      keys = []
+    if isinstance(key_or_key_list, (tuple, list)):
+      keys.extend(key_or_key_list)
+    elif key_or_key_list is not None:
+      keys.append(key_or_key_list)
     self._keys = keys
     # NOTE(daiyip): Lazy to build path string cache for fast access.
     self._path_str = None
@@ -31,6 +31,9 @@ from pyglove.core.symbolic.flags import is_repeated_class_registration_allowed
 from pyglove.core.symbolic.flags import set_origin_stacktrace_limit
 from pyglove.core.symbolic.flags import get_origin_stacktrace_limit
 
+from pyglove.core.symbolic.flags import set_origin_history_size
+from pyglove.core.symbolic.flags import get_origin_history_size
+
 from pyglove.core.symbolic.flags import set_load_handler
 from pyglove.core.symbolic.flags import get_load_handler
 
@@ -60,6 +63,14 @@ from pyglove.core.symbolic.flags import is_change_notification_enabled
 from pyglove.core.symbolic.flags import auto_call_functors
 from pyglove.core.symbolic.flags import should_call_functors_during_init
 
+from pyglove.core.symbolic.flags import trusted_construction
+from pyglove.core.symbolic.flags import is_under_trusted_construction
+
+from pyglove.core.symbolic.flags import interning
+from pyglove.core.symbolic.flags import is_interning_enabled
+
+from pyglove.core.symbolic.flags import defer_notifications
+
 # Symbolic types and their definition helpers.
 from pyglove.core.symbolic.base import Symbolic
 from pyglove.core.symbolic.list import List
@@ -107,6 +118,8 @@ from pyglove.core.symbolic.base import lt
 from pyglove.core.symbolic.base import gt
 from pyglove.core.symbolic.base import sym_hash as hash  # pylint: disable=redefined-builtin
 from pyglove.core.symbolic.base import contains
+from pyglove.core.symbolic.base import intern
+from pyglove.core.symbolic.base import is_interned
 from pyglove.core.symbolic.diff import diff
 
 from pyglove.core.symbolic.base import is_deterministic
@@ -118,6 +131,8 @@ from pyglove.core.symbolic.base import from_json
 from pyglove.core.symbolic.base import from_json_str
 from pyglove.core.symbolic.base import to_json
 from pyglove.core.symbolic.base import to_json_str
+from pyglove.core.symbolic.base import from_binary
+from pyglove.core.symbolic.base import to_binary
 from pyglove.core.symbolic.base import load
 from pyglove.core.symbolic.base import save
 from pyglove.core.symbolic.base import open_jsonl
@@ -133,6 +148,8 @@ from pyglove.core.symbolic.base import TraverseAction
 from pyglove.core.symbolic.list import Insertion
 from pyglove.core.symbolic.diff import Diff
 from pyglove.core.symbolic.origin import Origin
+from pyglove.core.symbolic.origin import origin_history
+from pyglove.core.symbolic.query_index import QueryIndex
 
 # Symbolic helper methods.
 from pyglove.core.symbolic.base import default_load_handler
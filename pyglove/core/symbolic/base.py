@@ -14,6 +14,7 @@
 """Symbolic type base."""
 
 import abc
+import contextlib
 import copy
 import enum
 import inspect
@@ -21,8 +22,10 @@ import json
 import os
 import re
 import sys
+import threading
 import typing
-from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Type, Union
+import weakref
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Type, Union
 
 from pyglove.core import io as pg_io
 from pyglove.core import object_utils
@@ -200,9 +203,28 @@ class Symbolic(
   DictType = None
   ListType = None
   ObjectType = None
+  RefType = None
 
   # pylint: enable=invalid-name
 
+  # Query index attached to current node, set by `pg.symbolic.QueryIndex`.
+  _sym_query_index = None
+
+  # Whether instances of the class can be interned, which requires their state
+  # to be fully captured by their symbolic attributes.
+  _sym_internable = True
+
+  # True if current node is interned by `pg.symbolic.intern`, which makes it
+  # immutable and shared among trees without being relocated.
+  _sym_interned = False
+
+  # Memoized flag on whether different symbolic hashes of current node and
+  # another node of the same type imply their inequality. See `_hashes_differ`.
+  _sym_exact_hash = None
+
+  # Number of mutations within the sub-tree of current node.
+  _sym_generation = 0
+
   def __init__(self,
                *,
                allow_partial: bool,
@@ -237,13 +259,40 @@ class Symbolic(
     # NOTE(daiyip): parent is used for rebind call to notify their ancestors
     # for updates, not for external usage.
     self._set_raw_attr('_sym_parent', None)
-    self._set_raw_attr('_sym_path', root_path or object_utils.KeyPath())
+
+    # NOTE: the symbolic path is computed lazily from the parent chain
+    # and the key of each node in its parent. `_sym_root_path` is used when the
+    # node is not located by a key under its parent, e.g. a root node.
+    self._set_raw_attr('_sym_path_key', None)
+    self._set_raw_attr('_sym_root_path', root_path or None)
+    # NOTE: a node's path is cached only when the paths of its ancestors are
+    # cached, therefore invalidating the cache of a sub-tree could stop at the
+    # nodes without a cached path.
+    self._set_raw_attr('_sym_path_cache', None)
+
+    # Number of nodes within current sub-tree (including current node) that
+    # subscribe path changes, which need to be notified upon relocation.
+    self._set_raw_attr(
+        '_sym_num_path_subscribers',
+        1 if self._subscribes_path_changes else 0)
     self._set_raw_attr('_sym_puresymbolic', None)
     self._set_raw_attr('_sym_missing_values', None)
     self._set_raw_attr('_sym_nondefault_values', None)
-
-    origin = Origin(None, '__init__') if flags.is_tracking_origin() else None
+    self._set_raw_attr('_sym_hash_value', None)
+    self._set_raw_attr('_sym_pending_updates', None)
+
+    origin, skipped_scope = None, None
+    scope = flags.get_origin_tracking_scope()
+    if scope is not None:
+      if flags.should_track_origin(self):
+        origin = Origin(None, '__init__')
+      else:
+        # NOTE: a value skipped by the sampling of `pg.track_origin` records
+        # the scope, so its later origin events within the same scope are
+        # skipped too. See `_should_track_origin` for details.
+        skipped_scope = scope
     self._set_raw_attr('_sym_origin', origin)
+    self._set_raw_attr('_sym_origin_skipped_scope', skipped_scope)
 
     # super.__init__ may enter into next base class's __init__ when
     # multi-inheritance is used. Since we have override `__setattr__` for
@@ -522,7 +571,7 @@ class Symbolic(
 
   def sym_setparent(self, parent: 'Symbolic'):
     """Sets the parent of current node in the symbolic tree."""
-    self._set_raw_attr('_sym_parent', parent)
+    self._sym_setlocation(parent, self._sym_path_key)
 
   def sym_contains(
       self,
@@ -535,15 +584,81 @@ class Symbolic(
   @property
   def sym_path(self) -> object_utils.KeyPath:
     """Returns the path of current object from the root of its symbolic tree."""
-    return getattr(self, '_sym_path')
+    path = self._sym_path_cache
+    if path is not None:
+      return path
+
+    # Walk up the parent chain iteratively to support very deep trees.
+    uncached = []
+    node = self
+    while True:
+      path = node._sym_path_cache
+      if path is not None:
+        break
+      parent = node._sym_parent
+      key = node._sym_path_key
+      if parent is None or key is None:
+        path = node._sym_root_path or object_utils.KeyPath()
+        node._set_raw_attr('_sym_path_cache', path)
+        break
+      uncached.append(node)
+      node = parent
+
+    for node in reversed(uncached):
+      path = object_utils.KeyPath(node._sym_path_key, path)
+      node._set_raw_attr('_sym_path_cache', path)
+    return path
 
   def sym_setpath(
       self, path: Optional[Union[str, object_utils.KeyPath]]) -> None:
     """Sets the path of current node in its symbolic tree."""
-    if self.sym_path != path:
-      old_path = self.sym_path
-      self._set_raw_attr('_sym_path', path)
-      self._update_children_paths(old_path, path)
+    old_path = self.sym_path
+    if old_path != path:
+      parent = self._sym_parent
+      if (parent is not None
+          and isinstance(path, object_utils.KeyPath)
+          and path
+          and path.parent == parent.sym_path):
+        self._set_raw_attr('_sym_path_key', path.key)
+      else:
+        self._set_raw_attr('_sym_path_key', None)
+        self._set_raw_attr('_sym_root_path', path)
+      _invalidate_sym_paths(self)
+      if self._sym_num_path_subscribers:
+        self._update_children_paths(old_path, path)
+
+  def _sym_setlocation(
+      self, parent: Optional['Symbolic'], key: Optional[Union[str, int]]
+      ) -> None:
+    """Places current node under a parent with a key.
+
+    Args:
+      parent: The new parent of current node.
+      key: The key of current node in its parent, based on which the path of
+        current node is computed. If None, current node is not located by key
+        and its path will be its root path.
+    """
+    old_parent = self._sym_parent
+    # NOTE: interned values are shared among trees, thus they stay at
+    # their original locations.
+    if self._sym_interned or (
+        old_parent is parent and self._sym_path_key == key):
+      return
+    num_subscribers = self._sym_num_path_subscribers
+    old_path = self.sym_path if num_subscribers else None
+    if old_parent is not parent:
+      if num_subscribers:
+        _add_path_subscribers(old_parent, -num_subscribers)
+        _add_path_subscribers(parent, num_subscribers)
+      self._set_raw_attr('_sym_parent', parent)
+    if key is not None:
+      self._set_raw_attr('_sym_root_path', None)
+    self._set_raw_attr('_sym_path_key', key)
+    _invalidate_sym_paths(self)
+    if old_path is not None:
+      new_path = self.sym_path
+      if old_path != new_path:
+        self._update_children_paths(old_path, new_path)
 
   def sym_rebind(
       self,
@@ -593,13 +708,54 @@ class Symbolic(
                 override: Optional[Dict[str, Any]] = None):
     """Clones current object symbolically."""
     assert deep or not memo
-    new_value = self._sym_clone(deep, memo)
+    if deep and override:
+      # NOTE: symbolic sub-trees that will be replaced by `override`
+      # are not cloned. Instead, their replacements are registered in the memo
+      # and are placed into the copy during its construction.
+      memo = dict(memo) if memo else {}
+      override = self._sym_substitute_on_clone(override, memo)
+
+    # NOTE: a clone is sampled as a single origin event, whose decision is
+    # shared by all the values created during cloning.
+    with (flags.origin_event(self) if flags.is_tracking_origin()
+          else contextlib.nullcontext(False)) as track_origin:
+      new_value = self._sym_clone(deep, memo)
     if override:
       new_value.sym_rebind(override, raise_on_no_change=False)
-    if flags.is_tracking_origin():
+    if track_origin:
       new_value.sym_setorigin(self, 'deepclone' if deep else 'clone')
     return new_value
 
+  def _sym_substitute_on_clone(
+      self,
+      override: Dict[Union[object_utils.KeyPath, str, int], Any],
+      memo: Dict[int, Any],
+  ) -> Dict[object_utils.KeyPath, Any]:
+    """Registers replaced sub-nodes in memo and returns remaining overrides."""
+    override = {object_utils.KeyPath.from_value(k): v
+                for k, v in override.items()}
+    remaining = {}
+    for path, value in override.items():
+      node = path.get(self) if path else None
+      if (not isinstance(node, Symbolic)
+          or pg_typing.MISSING_VALUE == value
+          # Interned nodes are shared by the copy (see `_clone_child`), and
+          # they may appear at multiple locations, thus a replacement cannot
+          # be registered by their identity.
+          or node._sym_interned
+          # `pg.Insertion` should not be substituted as it does not replace
+          # the existing list element.
+          or (isinstance(node.sym_parent, list)
+              and not isinstance(value, Symbolic))
+          # Nested overrides need to be applied in order via rebind.
+          or any(p is not path and (p.is_relative_to(path)
+                                    or path.is_relative_to(p))
+                 for p in override)):
+        remaining[path] = value
+      else:
+        memo[id(node)] = value
+    return remaining
+
   @abc.abstractmethod
   def sym_jsonify(self,
                   *,
@@ -623,9 +779,31 @@ class Symbolic(
     """Returns True if this object is symbolically less than other object."""
     return lt(self, other)
 
-  @abc.abstractmethod
+  @property
+  def sym_generation(self) -> int:
+    """Returns a counter that increases upon each mutation within the sub-tree.
+
+    It allows the results computed from an unchanged symbolic value to be
+    reused, e.g. the validation cache of `pg.typing.ValueSpec`.
+    """
+    return self._sym_generation
+
   def sym_hash(self) -> int:
-    """Computes the symbolic hash of current object."""
+    """Computes the symbolic hash of current object.
+
+    The hash is memoized on each symbolic node and is invalidated along the
+    parent chain upon mutation. Therefore hashing an unchanged tree repeatedly
+    costs O(1), and re-hashing after updating a single leaf costs O(depth).
+    Non-symbolic leaf values are assumed to have stable hashes.
+
+    Returns:
+      The symbolic hash of current object.
+    """
+    hash_value = getattr(self, '_sym_hash_value')
+    if hash_value is None:
+      hash_value = self._sym_hash()
+      self._set_raw_attr('_sym_hash_value', hash_value)
+    return hash_value
 
   @property
   def sym_origin(self) -> Optional[Origin]:
@@ -686,6 +864,7 @@ class Symbolic(
     self._set_raw_attr(
         '_sym_origin',
         Origin(source, tag, stacktrace, stacklimit, stacktop - 1))
+    self._set_raw_attr('_sym_origin_skipped_scope', None)
 
   #
   # Methods for operating the control flags of symbolic behaviors.
@@ -1068,10 +1247,78 @@ class Symbolic(
     """Overridden deep copy."""
     return self.sym_clone(deep=True, memo=memo)
 
+  def __reduce_ex__(self, protocol):
+    """Customizes pickle.dump with a fast path that skips validation."""
+    state = self._sym_reduce_state()
+    if state is None:
+      return super().__reduce_ex__(protocol)
+    # NOTE: children of an interned value are restored as regular
+    # values, while the interned root is re-interned upon restoration, which
+    # makes it shared with equal values interned in current process.
+    interned = self._sym_interned and self._sym_parent is None
+    return (_restore, (self.__class__, state, interned))
+
+  def _sym_reduce_state(self) -> Optional[Tuple[Any, ...]]:
+    """Returns the state for fast pickling, or None if not applicable.
+
+    The state is passed to `_sym_restore` upon unpickling, which restores
+    current value from its validated members without going through the
+    construction path.
+    """
+    return None
+
+  @classmethod
+  def _sym_restore(cls, *state) -> 'Symbolic':
+    """Restores a value from the state returned by `_sym_reduce_state`."""
+    raise NotImplementedError()
+
   #
   # Proteted methods to implement from subclasses
   #
 
+  @contextlib.contextmanager
+  def sym_transaction(self) -> Iterator['Symbolic']:
+    """Returns a context manager that batches the changes within the sub-tree.
+
+    Within a transaction, mutations (via `rebind`, attribute or item
+    assignments) on current node and its descendants are applied immediately,
+    while their notifications are deferred until the transaction ends. Updates
+    on the same field are merged into one, and each `_on_change` (or
+    `_on_bound`) event is then triggered at most once, bottom-up. For example::
+
+      with x.sym_transaction():
+        x.rebind({'a.b': 1})
+        x.a.c = 2
+        x.rebind({'a.b': 2})
+      # `x._on_bound` is called once here.
+
+    Content-based caches (e.g. the results of `sym_missing`, `sym_nondefault`
+    and `sym_hash`) are reset upon each mutation, thus they are up to date
+    within the transaction, while states maintained by `_on_change` or
+    `_on_bound` are updated only when the transaction ends.
+
+    Transactions can be nested, in which case the updates of the inner
+    transaction are forwarded to the outer one upon exit.
+
+    Yields:
+      Current object.
+    """
+    if self._sym_pending_updates is not None:
+      # Reentrant transaction on the same node.
+      yield self
+      return
+
+    pending_updates = dict()
+    self._set_raw_attr('_sym_pending_updates', pending_updates)
+    try:
+      yield self
+    finally:
+      # NOTE: mutations are applied immediately, therefore the
+      # notifications are fired even when the transaction raises.
+      self._set_raw_attr('_sym_pending_updates', None)
+      if pending_updates:
+        self._notify_field_updates(list(pending_updates.values()))
+
   @abc.abstractmethod
   def _sym_rebind(
       self, path_value_pairs: Dict[object_utils.KeyPath, Any]
@@ -1105,6 +1352,18 @@ class Symbolic(
   def _sym_getattr(self, key: Union[str, int]) -> Any:
     """Get symbolic attribute by key."""
 
+  def _sym_hash(self) -> int:
+    """Subclass specific hash implementation without memoization.
+
+    Subclasses override this method to have their hashes memoized by
+    `sym_hash`. Subclasses that override `sym_hash` instead, which is the
+    override point prior to memoization, do not need to implement it.
+    """
+    raise NotImplementedError(
+        f'{self.__class__.__name__} should implement either `_sym_hash` or '
+        '`sym_hash`.'
+    )
+
   @abc.abstractmethod
   def _sym_clone(self, deep: bool, memo=None) -> 'Symbolic':
     """Subclass specific clone implementation."""
@@ -1114,7 +1373,16 @@ class Symbolic(
       self,
       old_path: object_utils.KeyPath,
       new_path: object_utils.KeyPath) -> None:
-    """Update children paths according to root_path of current node."""
+    """Notifies path changes to the subscribers within current sub-tree.
+
+    This method is called only when the sub-tree has path subscribers (see
+    `_subscribes_path_changes`), since the paths of child nodes are computed
+    lazily from their parents.
+
+    Args:
+      old_path: The old path of current node.
+      new_path: The new path of current node.
+    """
 
   @abc.abstractmethod
   def _set_item_without_permission_check(
@@ -1137,6 +1405,11 @@ class Symbolic(
         current object.
     """
 
+  @property
+  def _subscribes_path_changes(self) -> bool:
+    """Returns True if current node needs to be notified on path changes."""
+    return False
+
   @property
   @abc.abstractmethod
   def _subscribes_field_updates(self) -> bool:
@@ -1172,27 +1445,80 @@ class Symbolic(
       Formalized value that is ready for insertion as members.
     """
     if isinstance(value, Symbolic):
+      # NOTE: under `pg.interning`, sealed pure-data values are
+      # replaced with their canonical instances, which are shared among trees.
+      if flags.is_interning_enabled():
+        value = _maybe_intern(value)
       # NOTE(daiyip): make a copy of symbolic object if it belongs to another
       # object tree, this prevents it from having multiple parents. See
       # List._formalized_value for similar logic.
-      root_path = object_utils.KeyPath(key, self.sym_path)
       if (value.sym_parent is not None and
           (value.sym_parent is not self
-           or root_path != value.sym_path)):
+           or value._sym_path_key != key)):  # pylint: disable=protected-access
         value = value.clone()
-
-    if isinstance(value, TopologyAware):
+      value._sym_setlocation(self._sym_parent_for_children(), key)  # pylint: disable=protected-access
+    elif isinstance(value, TopologyAware):
       value.sym_setpath(object_utils.KeyPath(key, self.sym_path))
       value.sym_setparent(self._sym_parent_for_children())
     return value
 
+  def _formalized_value_without_validation(
+      self, key: Union[str, int], value: Any) -> Any:
+    """Formalizes a child value of a new container under trusted construction.
+
+    Unlike `_formalized_value` of `pg.Dict` and `pg.List`, it only loads plain
+    JSON containers and relocates symbolic values, without validating or
+    recording the update.
+
+    Args:
+      key: Key used to insert the value.
+      value: Input value to be inserted.
+
+    Returns:
+      Formalized value that is ready for insertion as members.
+    """
+    if isinstance(value, (list, dict)) and not isinstance(value, Symbolic):
+      value = from_json(
+          value,
+          allow_partial=accepts_partial(self),
+          root_path=object_utils.KeyPath(key, self.sym_path))
+    return self._relocate_if_symbolic(key, value)
+
   def _sym_parent_for_children(self) -> Optional['Symbolic']:
     """Returns the symbolic parent for children."""
     return self
 
+  def _invalidate_sym_hash(self) -> None:
+    """Invalidates the memoized hash of current node and its ancestors."""
+    node = self
+    while node is not None:
+      node._set_raw_attr('_sym_hash_value', None)  # pylint: disable=protected-access
+      node._set_raw_attr('_sym_generation', node._sym_generation + 1)  # pylint: disable=protected-access
+      if node._sym_exact_hash is not None:  # pylint: disable=protected-access
+        node._set_raw_attr('_sym_exact_hash', None)  # pylint: disable=protected-access
+      if node._sym_query_index is not None:  # pylint: disable=protected-access
+        node._sym_query_index._on_change(self)  # pylint: disable=protected-access
+      node = node.sym_parent
+
   def _set_item_of_current_tree(
-      self, path: object_utils.KeyPath, value: Any) -> Optional[FieldUpdate]:
-    """Set a field of current tree by key path and return its parent."""
+      self,
+      path: object_utils.KeyPath,
+      value: Any,
+      resolved_nodes: Optional[List[Any]] = None,
+  ) -> Optional[FieldUpdate]:
+    """Set a field of current tree by key path and return its parent.
+
+    Args:
+      path: Key path of the field to set, relative to current node.
+      value: New value for the field.
+      resolved_nodes: An optional trie of symbolic nodes that have been
+        resolved from current node, in the form of `[node, {key: sub_trie}]`.
+        When provided, parent nodes shared by multiple paths are resolved only
+        once across calls, and the trie is updated upon the change.
+
+    Returns:
+      The field update if the value is changed, otherwise None.
+    """
     assert isinstance(path, object_utils.KeyPath), path
     if not path:
       raise KeyError(
@@ -1201,7 +1527,13 @@ class Symbolic(
               f'{self.__class__.__name__}.rebind. '
               f'Encountered {path!r}'))
 
-    parent_node = path.parent.query(self)
+    parent_trie = None
+    if resolved_nodes is not None:
+      parent_trie = _resolve_from_trie(resolved_nodes, path.parent)
+    if parent_trie is not None:
+      parent_node = parent_trie[0]
+    else:
+      parent_node = path.parent.query(self)
     if not isinstance(parent_node, Symbolic):
       raise KeyError(
           f'Cannot rebind key {path.key!r}: {parent_node!r} is not a '
@@ -1212,53 +1544,245 @@ class Symbolic(
           f'Cannot rebind key {path.key!r} of '
           f'sealed {parent_node.__class__.__name__}: {parent_node!r}. '
           f'(path=\'{path.parent}\')')
-    return parent_node._set_item_without_permission_check(path.key, value)  # pylint: disable=protected-access
+    update = parent_node._set_item_without_permission_check(path.key, value)  # pylint: disable=protected-access
+    if parent_trie is not None:
+      # NOTE: list insertions and deletions shift the indices of
+      # siblings, thus all resolved children of a list are dropped.
+      if isinstance(parent_node, list):
+        parent_trie[1].clear()
+      else:
+        parent_trie[1].pop(path.key, None)
+    return update
 
   def _notify_field_updates(
       self,
       field_updates: List[FieldUpdate],
       notify_parents: bool = True) -> None:
     """Notify field updates."""
-    per_target_updates = dict()
-
-    def _get_target_updates(
-        target: 'Symbolic'
-    ) -> Dict[object_utils.KeyPath, FieldUpdate]:
-      target_id = id(target)
-      if target_id not in per_target_updates:
-        per_target_updates[target_id] = (target, dict())
-      return per_target_updates[target_id][1]
-
-    for update in field_updates:
-      target = update.target
-      while target is not None:
-        target_updates = _get_target_updates(target)
-        if target._subscribes_field_updates:  # pylint: disable=protected-access
-          relative_path = update.path - target.sym_path
-          target_updates[relative_path] = update
-        target = target.sym_parent
-
-    # Trigger the notification bottom-up, thus the parent node will always
-    # be notified after the child nodes.
-    for target, updates in sorted(per_target_updates.values(),
-                                  key=lambda x: x[0].sym_path,
-                                  reverse=True):
-      # Reset content-based cache for the object being notified.
-      target._set_raw_attr('_sym_puresymbolic', None)       # pylint: disable=protected-access
-      target._set_raw_attr('_sym_missing_values', None)     # pylint: disable=protected-access
-      target._set_raw_attr('_sym_nondefault_values', None)  # pylint: disable=protected-access
-      target._on_change(updates)   # pylint: disable=protected-access
-
-      # If `notify_parents` is set to False, stop notifications once `self`
-      # is processed.
-      if target is self and not notify_parents:
-        break
+    # Defer the notifications if current node is within a transaction, or
+    # within a `pg.defer_notifications` scope.
+    pending_updates = _transaction_updates_of(self)
+    if pending_updates is None and notify_parents:
+      pending_updates = flags.get_deferred_notifications()
+    if pending_updates is not None:
+      _merge_field_updates(pending_updates, field_updates)
+      # NOTE: the content-based caches are reset right away, so they do not
+      # go stale while the notifications are deferred.
+      for update in field_updates:
+        node = update.target
+        while node is not None:
+          _reset_content_caches(node)
+          node = node.sym_parent
+      return
+    _fire_field_updates(field_updates, self if not notify_parents else None)
 
   def _error_message(self, message: str) -> str:
     """Create error message to include path information."""
     return object_utils.message_on_path(message, self.sym_path)
 
 
+def _transaction_updates_of(
+    node: Optional[Symbolic]) -> Optional[Dict[Any, FieldUpdate]]:
+  """Returns the pending updates of the innermost transaction of a node."""
+  while node is not None:
+    pending_updates = node._sym_pending_updates  # pylint: disable=protected-access
+    if pending_updates is not None:
+      return pending_updates
+    node = node.sym_parent
+  return None
+
+
+def _merge_field_updates(
+    pending_updates: Dict[Any, FieldUpdate],
+    field_updates: List[FieldUpdate]) -> None:
+  """Merges field updates into pending updates keyed by target and path."""
+  for update in field_updates:
+    key = (id(update.target), update.path)
+    merged = pending_updates.get(key)
+    if merged is None:
+      pending_updates[key] = update
+    else:
+      merged.new_value = update.new_value
+
+
+def _should_track_origin(value: Symbolic) -> bool:
+  """Returns True if an origin event of a symbolic value should be tracked.
+
+  Under the sampling of `pg.track_origin`, each value consumes the sampling
+  counter at most once per scope: the decision made upon its construction is
+  reused by its subsequent origin events within the same scope, e.g. being
+  returned from `pg.load` or a functor call.
+
+  Args:
+    value: The symbolic value whose origin is about to be set.
+
+  Returns:
+    True if the origin of `value` should be set.
+  """
+  scope = flags.get_origin_tracking_scope()
+  if scope is None:
+    return False
+  if value._sym_origin_skipped_scope is scope:  # pylint: disable=protected-access
+    return False
+  origin = value._sym_origin  # pylint: disable=protected-access
+  if origin is not None and origin.tag == '__init__':
+    return True
+  return flags.should_track_origin(value)
+
+
+def _requires_apply(value_spec: pg_typing.ValueSpec, value: Any) -> bool:
+  """Returns True if a value needs to be applied under trusted construction.
+
+  Under `pg.trusted_construction`, values are bound without validation, except
+  those which are subject to the transform of the value spec or need a type
+  conversion.
+
+  Args:
+    value_spec: The value spec of the field that holds the value.
+    value: The value to bind.
+
+  Returns:
+    True if `value_spec.apply` should be called on `value`.
+  """
+  if value_spec.transform is not None:
+    return True
+  if isinstance(value, object_utils.MissingValue):
+    return False
+  try:
+    value_type = value_spec.value_type
+  except TypeError:
+    # NOTE: the value type of a spec with unresolved forward references is
+    # not available. It's cheaper than checking `value_spec.type_resolved`
+    # upfront, which collects the forward references of the entire spec.
+    return False
+  if value_type is None:
+    return False
+  try:
+    return not isinstance(value, value_type)
+  except TypeError:
+    # Generic types and `typing.Any` are not supported by `isinstance`.
+    return not pg_typing.is_instance(value, value_type)
+
+
+def _fire_deferred_updates(pending_updates: Dict[Any, FieldUpdate]) -> None:
+  """Fires the updates deferred by `pg.defer_notifications`."""
+  updates = []
+  for update in pending_updates.values():
+    # Updates within an active transaction are forwarded to it.
+    transaction_updates = _transaction_updates_of(update.target)
+    if transaction_updates is not None:
+      _merge_field_updates(transaction_updates, [update])
+    else:
+      updates.append(update)
+  if updates:
+    _fire_field_updates(updates)
+
+
+flags.set_deferred_notifications_handler(_fire_deferred_updates)
+
+
+def _reset_content_caches(node: Symbolic) -> None:
+  """Resets the content-based caches of a symbolic node."""
+  node._set_raw_attr('_sym_puresymbolic', None)       # pylint: disable=protected-access
+  node._set_raw_attr('_sym_missing_values', None)     # pylint: disable=protected-access
+  node._set_raw_attr('_sym_nondefault_values', None)  # pylint: disable=protected-access
+  node._set_raw_attr('_sym_hash_value', None)         # pylint: disable=protected-access
+  if node._sym_exact_hash is not None:                # pylint: disable=protected-access
+    node._set_raw_attr('_sym_exact_hash', None)       # pylint: disable=protected-access
+
+
+def _fire_field_updates(
+    field_updates: List[FieldUpdate],
+    last_target: Optional[Symbolic] = None) -> None:
+  """Fires field updates on their targets and ancestors, bottom-up.
+
+  Args:
+    field_updates: Field updates to fire.
+    last_target: If not None, the notification stops once this node is
+      notified, which is used for skipping the notifications of its parents.
+  """
+  # Map of target id to (target, subscribers from the target and its
+  # ancestors). Each ancestor chain is visited only once across updates.
+  targets = dict()
+  per_subscriber_updates = dict()
+
+  def _subscribers_of(target: Symbolic) -> Tuple[Symbolic, ...]:
+    chain = []
+    while target is not None and id(target) not in targets:
+      chain.append(target)
+      target = target.sym_parent
+    subscribers = targets[id(target)][1] if target is not None else tuple()
+    for target in reversed(chain):
+      if target._subscribes_field_updates:  # pylint: disable=protected-access
+        subscribers = subscribers + (target,)
+      targets[id(target)] = (target, subscribers)
+    return subscribers
+
+  for update in field_updates:
+    for subscriber in _subscribers_of(update.target):
+      subscriber_updates = per_subscriber_updates.get(id(subscriber))
+      if subscriber_updates is None:
+        subscriber_updates = dict()
+        per_subscriber_updates[id(subscriber)] = subscriber_updates
+      subscriber_updates[update.path - subscriber.sym_path] = update
+
+  # Trigger the notification bottom-up, thus the parent node will always
+  # be notified after the child nodes.
+  for target, _ in sorted(targets.values(),
+                          key=lambda x: x[0].sym_path,
+                          reverse=True):
+    # Reset content-based cache for the object being notified.
+    _reset_content_caches(target)
+    target._on_change(per_subscriber_updates.get(id(target), {}))   # pylint: disable=protected-access
+
+    # Stop notifications once `last_target` is processed.
+    if target is last_target:
+      break
+
+
+def _invalidate_sym_paths(node: Symbolic) -> None:
+  """Invalidates the cached symbolic paths of a node and its descendants."""
+  stack = [node]
+  while stack:
+    node = stack.pop()
+    # NOTE: descendants of a node without a cached path have no cached paths,
+    # which saves the traversal on relocating nodes during construction.
+    if node._sym_path_cache is None:  # pylint: disable=protected-access
+      continue
+    node._set_raw_attr('_sym_path_cache', None)  # pylint: disable=protected-access
+    for v in node.sym_values():
+      if isinstance(v, Symbolic) and v.sym_parent is node:
+        stack.append(v)
+
+
+def _add_path_subscribers(node: Optional[Symbolic], num: int) -> None:
+  """Adds the number of path subscribers to a node and its ancestors."""
+  while node is not None:
+    node._set_raw_attr(   # pylint: disable=protected-access
+        '_sym_num_path_subscribers',
+        node._sym_num_path_subscribers + num)  # pylint: disable=protected-access
+    node = node.sym_parent
+
+
+def _resolve_from_trie(
+    trie: List[Any], path: object_utils.KeyPath) -> Optional[List[Any]]:
+  """Returns the trie node for a path, or None if not a symbolic path."""
+  for key in path.keys:
+    children = trie[1]
+    child_trie = children.get(key)
+    if child_trie is None:
+      node = trie[0]
+      if not node.sym_hasattr(key):
+        return None
+      child = node.sym_getattr(key)
+      if not isinstance(child, Symbolic):
+        return None
+      child_trie = [child, {}]
+      children[key] = child_trie
+    trie = child_trie
+  return trie
+
+
 #
 # Function for rebinders.
 #
@@ -1312,21 +1836,7 @@ def get_rebind_dict(
 #
 
 
-class TraverseAction(enum.Enum):
-  """Enum for the next action after a symbolic node is visited.
-
-  See also: :func:`pyglove.traverse`.
-  """
-
-  # Traverse should immediately stop.
-  STOP = 0
-
-  # Traverse should enter sub-tree if sub-tree exists and traverse is in
-  # pre-order. For post-order traverse, it has the same effect as CONTINUE.
-  ENTER = 1
-
-  # Traverse should continue to next node without entering the sub-tree.
-  CONTINUE = 2
+TraverseAction = object_utils.TraverseAction
 
 
 def traverse(x: Any,
@@ -1372,42 +1882,20 @@ def traverse(x: Any,
       either `TraverseAction.ENTER` or `TraverseAction.CONTINUE` for all nodes.
       Otherwise False.
   """
-  root_path = root_path or object_utils.KeyPath()
+  return object_utils.walk(
+      x, _sym_children, preorder_visitor_fn, postorder_visitor_fn,
+      root_path, parent)
 
-  def no_op_visitor(path, value, parent):
-    del path, value, parent
-    return TraverseAction.ENTER
 
-  if preorder_visitor_fn is None:
-    preorder_visitor_fn = no_op_visitor
-  if postorder_visitor_fn is None:
-    postorder_visitor_fn = no_op_visitor
-
-  preorder_action = preorder_visitor_fn(root_path, x, parent)
-  if preorder_action is None or preorder_action == TraverseAction.ENTER:
-    if isinstance(x, dict):
-      for k, v in x.items():
-        if not traverse(v, preorder_visitor_fn, postorder_visitor_fn,
-                        object_utils.KeyPath(k, root_path), x):
-          preorder_action = TraverseAction.STOP
-          break
-    elif isinstance(x, list):
-      for i, v in enumerate(x):
-        if not traverse(v, preorder_visitor_fn, postorder_visitor_fn,
-                        object_utils.KeyPath(i, root_path), x):
-          preorder_action = TraverseAction.STOP
-          break
-    elif isinstance(x, Symbolic.ObjectType):  # pytype: disable=wrong-arg-types
-      for k, v in x.sym_items():
-        if not traverse(v, preorder_visitor_fn, postorder_visitor_fn,
-                        object_utils.KeyPath(k, root_path), x):
-          preorder_action = TraverseAction.STOP
-          break
-  postorder_action = postorder_visitor_fn(root_path, x, parent)
-  if (preorder_action == TraverseAction.STOP or
-      postorder_action == TraverseAction.STOP):
-    return False
-  return True
+def _sym_children(x: Any) -> Optional[Iterable[Tuple[Any, Any]]]:
+  """Returns the (key, child) pairs of a (maybe) symbolic value."""
+  if isinstance(x, dict):
+    return x.items()
+  elif isinstance(x, list):
+    return enumerate(x)
+  elif isinstance(x, Symbolic.ObjectType):  # pytype: disable=wrong-arg-types
+    return x.sym_items()
+  return None
 
 
 def query(
@@ -1418,7 +1906,10 @@ def query(
     enter_selected: bool = False,
     custom_selector: Optional[Union[
         Callable[[object_utils.KeyPath, Any], bool],
-        Callable[[object_utils.KeyPath, Any, Any], bool]]] = None
+        Callable[[object_utils.KeyPath, Any, Any], bool]]] = None,
+    type: Optional[Union[    # pylint: disable=redefined-builtin
+        Type[Any],
+        Tuple[Type[Any], ...]]] = None,
 ) -> Dict[str, Any]:
   """Queries a (maybe) symbolic value.
 
@@ -1464,6 +1955,14 @@ def query(
           value, r'.*y',
           where=lambda v, p: v > 1 and isinstance(p, A) and p.x == 1))
 
+      # Query by type.
+      # Shall print:
+      # {
+      #    'a3.p': A(x=2, y=1),
+      #    'a3.q': A(x=2, y=2),
+      # }
+      print(pg.query(value, r'a3.*', type=A))
+
   Args:
     x: A nested structure that may contains symbolic value.
     path_regex: Optional regex expression to constrain path.
@@ -1480,6 +1979,10 @@ def query(
 
         `(key_path, value) -> should_select`
         or `(key_path, value, parent) -> should_select`
+    type: Optional type or tuple of types that selected values should be
+      instances of. If `x` has a :class:`pyglove.symbolic.QueryIndex` attached
+      and `type` only involves symbolic types, candidates are looked up from
+      the index instead of traversing the tree.
 
   Returns:
     A dict of key path to value as results for selected values.
@@ -1490,8 +1993,7 @@ def query(
       raise ValueError('\'path_regex\' and \'where\' must be None when '
                        '\'custom_selector\' is provided.')
     signature = pg_typing.signature(
-        custom_selector, auto_typing=False, auto_doc=False
-    )
+        custom_selector, auto_typing=False, auto_doc=False)
     if len(signature.args) == 2:
       select_fn = lambda k, v, p: custom_selector(k, v)  # pytype: disable=wrong-arg-count
     elif len(signature.args) == 3:
@@ -1502,7 +2004,8 @@ def query(
           f'(key_path, value, [parent]). Encountered: {signature.args}')
   else:
     if where is not None:
-      signature = pg_typing.signature(where)
+      signature = pg_typing.signature(
+          where, auto_typing=False, auto_doc=False)
       if len(signature.args) == 1:
         where_fn = lambda v, p: where(v)  # pytype: disable=wrong-arg-count
       elif len(signature.args) == 2:
@@ -1520,6 +2023,26 @@ def query(
       return where_fn(v, p)  # pytype: disable=wrong-arg-count
 
   results = {}
+  index = _query_index_for(x, type)
+
+  # NOTE: locating a node from the index is a few times more expensive
+  # than visiting it during traversal, therefore the index is used only when
+  # the candidates are a small fraction of the tree.
+  if index is not None and index.count(type) * 8 <= len(index):
+    selected = set()
+    for path, v in index.select(type):
+      parent = v.sym_parent if v is not x else None
+      if not enter_selected and _has_selected_ancestor(v, x, selected):
+        continue
+      if select_fn(path, v, parent):  # pytype: disable=wrong-arg-count
+        results[str(path)] = v
+        selected.add(id(v))
+    return results
+
+  if type is not None:
+    type_agnostic_select_fn = select_fn
+    select_fn = lambda k, v, p: (  # pylint: disable=g-long-lambda
+        isinstance(v, type) and type_agnostic_select_fn(k, v, p))
 
   def _preorder_visitor(path: object_utils.KeyPath, v: Any,
                         parent: Any) -> TraverseAction:
@@ -1532,6 +2055,31 @@ def query(
   return results
 
 
+def _query_index_for(
+    x: Any,
+    value_type: Optional[Union[Type[Any], Tuple[Type[Any], ...]]]) -> Any:
+  """Returns the query index of `x` if it can serve a typed query."""
+  if value_type is None or not isinstance(x, Symbolic):
+    return None
+  index = x._sym_query_index  # pylint: disable=protected-access
+  if index is None or index.has_shared_nodes:
+    return None
+  value_types = value_type if isinstance(value_type, tuple) else (value_type,)
+  for t in value_types:
+    if not (inspect.isclass(t) and issubclass(t, Symbolic)):
+      return None
+  return index
+
+
+def _has_selected_ancestor(node: 'Symbolic', root: Any, selected) -> bool:
+  """Returns True if any ancestor of `node` under `root` is selected."""
+  while node is not root:
+    node = node.sym_parent
+    if id(node) in selected:
+      return True
+  return False
+
+
 def eq(left: Any, right: Any) -> bool:
   """Compares if two values are equal. Use symbolic equality if possible.
 
@@ -1569,6 +2117,8 @@ def eq(left: Any, right: Any) -> bool:
   # comparison on their items.
   if left is right:
     return True
+  if _hashes_differ(left, right):
+    return False
   if ((isinstance(left, list) and isinstance(right, list))
       or (isinstance(left, tuple) and isinstance(right, tuple))):
     if len(left) != len(right):
@@ -1604,6 +2154,72 @@ def eq(left: Any, right: Any) -> bool:
   return pg_typing.callable_eq(left, right)
 
 
+# Leaf types whose equality implies equal hashes.
+_EXACT_HASH_LEAF_TYPES = frozenset([
+    type(None), bool, int, float, str, bytes, object_utils.MissingValue])
+
+# Cache of whether a symbolic class compares and hashes its nodes structurally.
+_STRUCTURAL_CLASSES: Dict[Type[Any], bool] = {}
+
+
+def _hashes_differ(
+    left: Any, right: Any, compute_hashes: bool = False) -> bool:
+  """Returns True if two values are known to be unequal by their hashes.
+
+  Different symbolic hashes imply inequality only when both values are of the
+  same type, and are compared and hashed structurally all the way down to
+  builtin leaf values (e.g. no user `sym_eq` that equates `A(1)` with `1`).
+  Since equal hashes do not imply equality, the caller needs to compare the
+  values when this function returns False.
+
+  Args:
+    left: The left-hand value.
+    right: The right-hand value.
+    compute_hashes: If True, the symbolic hashes of both values will be
+      computed (and memoized) when needed. Otherwise only the memoized hashes
+      are used, so the check is O(1).
+
+  Returns:
+    True if `left` and `right` are known to be unequal.
+  """
+  if type(left) is not type(right) or not isinstance(left, Symbolic):
+    return False
+  if not compute_hashes:
+    left_hash, right_hash = left._sym_hash_value, right._sym_hash_value  # pylint: disable=protected-access
+    if left_hash is None or right_hash is None or left_hash == right_hash:
+      return False
+  if not (_has_exact_hash(left) and _has_exact_hash(right)):
+    return False
+  return not compute_hashes or left.sym_hash() != right.sym_hash()
+
+
+def _has_exact_hash(x: Symbolic) -> bool:
+  """Returns True if equality of `x` with a same-typed value implies same hash."""
+  exact = x._sym_exact_hash  # pylint: disable=protected-access
+  if exact is None:
+    exact = _is_structural_class(type(x)) and all(
+        type(v) in _EXACT_HASH_LEAF_TYPES
+        or (isinstance(v, Symbolic) and _has_exact_hash(v))
+        for v in x.sym_values())
+    x._set_raw_attr('_sym_exact_hash', exact)  # pylint: disable=protected-access
+  return exact
+
+
+def _is_structural_class(cls: Type[Any]) -> bool:
+  """Returns True if a symbolic class uses the default `sym_eq`/`sym_hash`."""
+  structural = _STRUCTURAL_CLASSES.get(cls)
+  if structural is None:
+    dict_cls, list_cls, object_cls = (
+        Symbolic.DictType, Symbolic.ListType, Symbolic.ObjectType)
+    structural = (
+        cls.sym_eq in (Symbolic.sym_eq, object_cls.sym_eq)
+        and cls.sym_hash in (Symbolic.sym_hash, dict_cls.sym_hash)
+        and cls._sym_hash in (  # pylint: disable=protected-access
+            dict_cls._sym_hash, list_cls._sym_hash, object_cls._sym_hash))  # pylint: disable=protected-access
+    _STRUCTURAL_CLASSES[cls] = structural
+  return structural
+
+
 def ne(left: Any, right: Any) -> bool:
   """Compares if two values are not equal. Use symbolic equality if possible.
 
@@ -1849,6 +2465,8 @@ def clone(
     Cloned instance.
   """
   if isinstance(x, Symbolic):
+    if memo is not None and id(x) in memo:
+      return memo[id(x)]
     return x.sym_clone(deep, memo, override)
   elif isinstance(x, list):
     assert not override, override
@@ -1864,6 +2482,27 @@ def clone(
     return copy.deepcopy(x, memo) if deep else copy.copy(x)
 
 
+def _clone_child(x: Any, deep: bool, memo: Optional[Any] = None) -> Any:
+  """Clones a child value for `Symbolic._sym_clone`.
+
+  Interned values are immutable and can be placed in any number of trees,
+  therefore they are shared between the original value and the copy instead of
+  being cloned. This makes cloning a tree proportional to the size of its
+  sub-trees that are not interned.
+
+  Args:
+    x: The child value to clone.
+    deep: If True, use deep clone, otherwise use shallow clone.
+    memo: Optional memo object for deep clone.
+
+  Returns:
+    The cloned child value, or `x` itself if it is interned.
+  """
+  if isinstance(x, Symbolic) and x._sym_interned:  # pylint: disable=protected-access
+    return x
+  return clone(x, deep, memo)
+
+
 def is_deterministic(x: Any) -> bool:
   """Returns if the input value is deterministic.
 
@@ -1990,6 +2629,9 @@ def contains(
     True if `x` itself or any of its sub-nodes equal to `value` or
     is an instance of `value_type`.
   """
+  index = _query_index_for(x, type)
+  if index is not None:
+    return index.contains(type)
   if type is not None:
     def _contains(k, v, p):
       del k, p
@@ -2005,6 +2647,157 @@ def contains(
   return not traverse(x, _contains)
 
 
+# Immutable non-symbolic values that are allowed in interned values.
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, type)
+
+# Interned values by their symbolic hash. Values are held by weak references,
+# so an interned value is dropped from the table once it is no longer used.
+_INTERNED: Dict[int, List[weakref.ref]] = {}
+_INTERNED_LOCK = threading.RLock()
+
+
+def intern(value: Symbolic) -> Symbolic:  # pylint: disable=redefined-builtin
+  """Returns the canonical instance of a sealed pure-data symbolic value.
+
+  Interning (a.k.a. hash-consing) shares one instance among all symbolically
+  equal values, which saves memory for trees with many identical sub-trees and
+  makes `pg.eq` on them an identity check. For example::
+
+    a = pg.symbolic.intern(A(1, sealed=True))
+    b = pg.symbolic.intern(A(1, sealed=True))
+    assert a is b
+
+  Values can also be interned implicitly under :func:`pg.interning`.
+
+  A value can be interned when:
+
+    * It is sealed, and it is a root, namely it does not have a parent.
+    * Its sub-tree is pure data, namely it consists of symbolic values and
+      immutable values (None, bool, int, float, complex, str, bytes, types
+      and tuples of them). Inferential values (e.g. `pg.Ref`) are not allowed
+      since they depend on their locations.
+
+  Contract on shared nodes: an interned value is immutable and stays where it
+  was when interned. It may be placed in any number of trees (including many
+  times in the same tree) without being copied, while its `sym_parent` remains
+  None and its `sym_path` remains the root path. Therefore, an interned value
+  does not see the trees that contain it, and its descendants are located
+  relative to it. Its whole sub-tree is sealed permanently, which cannot be
+  lifted by `seal(False)` or `pg.as_sealed(False)`. Cloning an interned value
+  produces a regular (not interned) copy, while the interned values within a
+  cloned tree are shared by the copy.
+
+  Args:
+    value: A sealed pure-data symbolic value without a parent.
+
+  Returns:
+    The canonical instance that is symbolically equal to `value`, which is
+    `value` itself if no equal value was interned before.
+
+  Raises:
+    ValueError: If `value` cannot be interned.
+  """
+  if not isinstance(value, Symbolic):
+    raise ValueError(
+        f'Only symbolic values can be interned. Encountered: {value!r}.')
+  if value._sym_interned:  # pylint: disable=protected-access
+    return value
+  if value.sym_parent is not None:
+    raise ValueError(
+        f'Only root values can be interned. Encountered: {value!r} '
+        f'at {value.sym_path!r}.')
+  if not value.is_sealed:
+    raise ValueError(
+        f'Only sealed values can be interned. Encountered: {value!r}.')
+  if not _is_pure_data(value):
+    raise ValueError(
+        f'Only pure-data values can be interned. Encountered: {value!r}.')
+  return _intern(value)
+
+
+def _restore(cls: Type[Symbolic], state: Tuple[Any, ...], interned: bool):
+  """Restores a pickled symbolic value. See `Symbolic.__reduce_ex__`."""
+  value = cls._sym_restore(*state)  # pylint: disable=protected-access
+  if interned:
+    value = _maybe_intern(value)
+  return value
+
+
+def is_interned(value: Any) -> bool:
+  """Returns True if a value is interned."""
+  return isinstance(value, Symbolic) and value._sym_interned  # pylint: disable=protected-access
+
+
+def num_interned() -> int:
+  """Returns the number of live interned values."""
+  with _INTERNED_LOCK:
+    return sum(1 for refs in _INTERNED.values()
+               for ref in refs if ref() is not None)
+
+
+def _maybe_intern(value: Any) -> Any:
+  """Interns a value if it can be interned."""
+  if (isinstance(value, Symbolic)
+      and not value._sym_interned  # pylint: disable=protected-access
+      and value.sym_parent is None
+      and value.is_sealed
+      and _is_pure_data(value)):
+    return _intern(value)
+  return value
+
+
+def _intern(value: Symbolic) -> Symbolic:
+  """Interns a value that can be interned."""
+  key = value.sym_hash()
+  with _INTERNED_LOCK:
+    refs = _INTERNED.setdefault(key, [])
+    for ref in refs:
+      canonical = ref()
+      if (canonical is not None
+          and canonical.__class__ is value.__class__
+          and canonical.sym_eq(value)):
+        return canonical
+    _mark_interned(value)
+    refs.append(weakref.ref(value, _on_release(key)))
+    return value
+
+
+def _on_release(key: int):
+  """Returns a callback that cleans up the table when a value is released."""
+
+  def _callback(ref: weakref.ref) -> None:
+    with _INTERNED_LOCK:
+      refs = _INTERNED.get(key)
+      if refs is not None and ref in refs:
+        refs.remove(ref)
+        if not refs:
+          del _INTERNED[key]
+
+  return _callback
+
+
+def _is_pure_data(value: Any) -> bool:
+  """Returns True if a value consists of only symbolic and immutable values."""
+  if isinstance(value, Symbolic):
+    if value._sym_interned:  # pylint: disable=protected-access
+      return True
+    if (isinstance(value, Inferential)
+        or not value.__class__._sym_internable):  # pylint: disable=protected-access
+      return False
+    return all(_is_pure_data(v) for v in value.sym_values())
+  if isinstance(value, (tuple, frozenset)):
+    return all(_is_pure_data(v) for v in value)
+  return isinstance(value, _IMMUTABLE_TYPES)
+
+
+def _mark_interned(value: Symbolic) -> None:
+  """Marks the sub-tree of a value as interned."""
+  value._set_raw_attr('_sym_interned', True)  # pylint: disable=protected-access
+  for v in value.sym_values():
+    if isinstance(v, Symbolic) and not v._sym_interned:  # pylint: disable=protected-access
+      _mark_interned(v)
+
+
 def from_json(
     json_value: Any,
     *,
@@ -2030,6 +2823,11 @@ def from_json(
     a2 = pg.from_json(json)
     assert pg.eq(a1, a2)
 
+  The sharing among values is restored for JSON values serialized with
+  ``pg.to_json(..., preserve_refs=True)``: each shared value is loaded once,
+  values referenced by multiple ``pg.Ref`` objects are referenced by the
+  loaded ``pg.Ref`` objects, and interned values are interned again.
+
   Args:
     json_value: Input JSON value.
     allow_partial: Whether to allow elements of the list to be partial.
@@ -2080,11 +2878,14 @@ def from_json(
                 f'besides \'{object_utils.JSONConvertible.TUPLE_MARKER}\'. '
                 f'Encountered: {json_value}', root_path))
       return tuple(_load_child(i, v) for i, v in enumerate(json_value[1:]))
+    # NOTE: the typenames of the entire tree have been resolved, thus
+    # we let the children skip the resolution.
     return Symbolic.ListType.from_json(    # pytype: disable=attribute-error
         json_value,
         value_spec=value_spec,
         root_path=root_path,
         allow_partial=allow_partial,
+        _typename_resolved=True,
         **kwargs,
     )
   elif isinstance(json_value, dict):
@@ -2094,12 +2895,16 @@ def from_json(
           value_spec=value_spec,
           root_path=root_path,
           allow_partial=allow_partial,
+          _typename_resolved=True,
           **kwargs,
       )
-    return object_utils.from_json(
+    value = object_utils.from_json(
         json_value, _typename_resolved=True,
         root_path=root_path, allow_partial=allow_partial, **kwargs
     )
+    if flags.is_interning_enabled():
+      value = _maybe_intern(value)
+    return value
   return json_value
 
 
@@ -2142,31 +2947,56 @@ def from_json_str(json_str: str,
   Returns:
     A deserialized value.
   """
-  def _get_key(k: str) -> Union[str, int]:
-    if k.startswith('n_:'):
-      return int(k[3:])
-    return k
-
-  def _decode_int_keys(v):
-    if isinstance(v, dict):
-      return {
-          _get_key(k): _decode_int_keys(v)
-          for k, v in v.items()
-      }
-    elif isinstance(v, list):
-      return [_decode_int_keys(v) for v in v]
-    return v
-
+  # NOTE: int keys and '_type' keys are decoded while the JSON string
+  # is being parsed, so the parsed tree is ready to be loaded by `from_json`
+  # without being walked again.
+  json_value = json.loads(
+      json_str,
+      object_pairs_hook=_json_object_decoder(
+          # Avoid per-key checks when the string has no int key at all.
+          decode_int_keys=_INT_KEY_PREFIX in json_str,
+          auto_import=auto_import,
+          auto_dict=auto_dict,
+      ),
+  )
   return from_json(
-      _decode_int_keys(json.loads(json_str)),
+      json_value,
       allow_partial=allow_partial,
       root_path=root_path,
-      auto_import=auto_import,
-      auto_dict=auto_dict,
+      _typename_resolved=True,
       **kwargs
   )
 
 
+_INT_KEY_PREFIX = 'n_:'
+
+
+def _json_object_decoder(
+    decode_int_keys: bool,
+    auto_import: bool,
+    auto_dict: bool
+) -> Callable[[List[Tuple[str, Any]]], Dict[Any, Any]]:
+  """Returns an `object_pairs_hook` for decoding JSON objects in one pass."""
+  type_key = object_utils.JSONConvertible.TYPE_NAME_KEY
+  resolve_typename = object_utils.json_conversion.resolve_typename
+  prefix_len = len(_INT_KEY_PREFIX)
+  # Factories by type name, so each type name is resolved once per document.
+  factories = {}
+
+  def _decode(pairs: List[Tuple[str, Any]]) -> Dict[Any, Any]:
+    if decode_int_keys:
+      v = {
+          int(k[prefix_len:]) if k.startswith(_INT_KEY_PREFIX) else k: x
+          for k, x in pairs
+      }
+    else:
+      v = dict(pairs)
+    if type_key in v:
+      resolve_typename(v, auto_import, auto_dict, factories)
+    return v
+  return _decode
+
+
 def to_json(value: Any, **kwargs) -> Any:
   """Serializes a (maybe) symbolic value into a plain Python object.
 
@@ -2193,11 +3023,34 @@ def to_json(value: Any, **kwargs) -> Any:
       * Dict types.
 
     **kwargs: Keyword arguments to pass to value.to_json if value is
-      JSONConvertible.
+      JSONConvertible. The following keyword arguments are handled by
+      ``pg.to_json`` itself:
+
+      * ``preserve_refs``: If True, values that occur at multiple locations
+        of `value`, namely values referenced by multiple ``pg.Ref`` objects
+        and interned values, are written once into a table of shared values
+        and referred to by their indices elsewhere. ``pg.from_json`` loads
+        each shared value once and restores the sharing.
+      * ``dedup_equal``: If True, symbolically equal sub-trees, located by
+        their symbolic hashes, are also written once. They are loaded as
+        copies of the same value. It implies ``preserve_refs``.
 
   Returns:
     JSON value.
   """
+  shared_values = kwargs.get('_shared_values')
+  if shared_values is not None:
+    return shared_values.to_json(value, kwargs)
+  if kwargs.get('preserve_refs') or kwargs.get('dedup_equal'):
+    shared_values = _SharedValues(value, kwargs.pop('dedup_equal', False))
+    kwargs['preserve_refs'] = True
+    kwargs['_shared_values'] = shared_values
+    return shared_values.document(value, kwargs)
+  return _to_json(value, **kwargs)
+
+
+def _to_json(value: Any, **kwargs) -> Any:
+  """Serializes a value into a plain Python object."""
   # NOTE(daiyip): special handling `sym_jsonify` since symbolized
   # classes may have conflicting `to_json` method in their existing classes.
   if isinstance(value, Symbolic):
@@ -2205,6 +3058,267 @@ def to_json(value: Any, **kwargs) -> Any:
   return object_utils.to_json(value, **kwargs)
 
 
+class _SharedValues:
+  """Values that occur at multiple locations of a value to serialize.
+
+  Serializing a value with shared values takes two passes: the first pass
+  counts the occurrences of each value, and the second pass writes each shared
+  value into a table when it is first met, with a reference to its index in the
+  table at each location. Since a shared value is added to the table after the
+  shared values within it, the table can be loaded in order.
+
+  Under `dedup_equal`, a value that is symbolically equal to a value visited
+  before (namely its canonical value) is written as a copy of the latter.
+  """
+
+  def __init__(self, root: Any, dedup_equal: bool):
+    self._dedup_equal = dedup_equal
+    # Canonical values by value ID.
+    self._canonicals: Dict[int, Any] = {}
+    # Number of occurrences by value ID.
+    self._counts: Dict[int, int] = {}
+    # Number of occurrences of the values equal to a canonical value by the
+    # ID of the canonical value.
+    self._group_counts: Dict[int, int] = {}
+    # Canonical values by class and symbolic hash.
+    self._buckets: Dict[Tuple[Type[Any], int], List[Symbolic]] = {}
+    # Index in the table by value ID.
+    self._indices: Dict[int, int] = {}
+    self._table: List[Any] = []
+    self._interned: List[int] = []
+    self._visit(root)
+
+  def _visit(self, value: Any) -> None:
+    """Counts the occurrences of the values within a value."""
+    if isinstance(value, Symbolic):
+      if isinstance(value, Symbolic.RefType):
+        self._visit(value.value)
+        return
+      children = value.sym_values()
+    elif isinstance(value, dict):
+      children = value.values()
+    elif isinstance(value, list):
+      children = value
+    elif isinstance(value, tuple):
+      for v in value:
+        self._visit(v)
+      return
+    elif isinstance(value, object_utils.JSONConvertible):
+      children = ()
+    else:
+      return
+
+    value_id = id(value)
+    count = self._counts.get(value_id, 0)
+    self._counts[value_id] = count + 1
+    if count:
+      self._group_counts[id(self._canonicals[value_id])] += 1
+      return
+
+    canonical = value
+    if (self._dedup_equal
+        and isinstance(value, Symbolic)
+        and not value._sym_interned  # pylint: disable=protected-access
+        # Empty containers are smaller than the references to them.
+        and (value or not isinstance(value, (list, dict)))):
+      canonical = self._canonical(value)
+    self._canonicals[value_id] = canonical
+    group_count = self._group_counts.get(id(canonical), 0)
+    self._group_counts[id(canonical)] = group_count + 1
+    if group_count == 0:
+      for v in children:
+        self._visit(v)
+
+  def _canonical(self, value: Symbolic) -> Symbolic:
+    """Returns the canonical value of a symbolic value."""
+    bucket = self._buckets.setdefault(
+        (value.__class__, value.sym_hash()), []
+    )
+    for canonical in bucket:
+      if canonical.sym_eq(value):
+        return canonical
+    bucket.append(value)
+    return value
+
+  def _index(self, value: Any, kwargs: Dict[str, Any]) -> int:
+    """Returns the index of a value in the table, which adds it if absent."""
+    index = self._indices.get(id(value))
+    if index is None:
+      canonical = self._canonicals[id(value)]
+      if canonical is value:
+        json_value = _to_json(value, **kwargs)
+      else:
+        json_value = _SharedRef(self._index(canonical, kwargs), True).to_json()
+      index = len(self._table)
+      self._table.append(json_value)
+      self._indices[id(value)] = index
+      if is_interned(value):
+        self._interned.append(index)
+    return index
+
+  def to_json(self, value: Any, kwargs: Dict[str, Any]) -> Any:
+    """Serializes a value, which is a reference if it is shared."""
+    canonical = self._canonicals.get(id(value))
+    if canonical is None or self._group_counts[id(canonical)] == 1:
+      return _to_json(value, **kwargs)
+    if canonical is not value and self._counts[id(value)] == 1:
+      return _SharedRef(self._index(canonical, kwargs), True).to_json()
+    return _SharedRef(self._index(value, kwargs)).to_json()
+
+  def document(self, value: Any, kwargs: Dict[str, Any]) -> Any:
+    """Serializes the root value along with the table of shared values."""
+    json_value = self.to_json(value, kwargs)
+    if not self._table:
+      return json_value
+    return _SharedValuesDocument(
+        self._table, json_value, self._interned
+    ).to_json()
+
+
+class _SharedValuesDocument(object_utils.JSONConvertible):
+  """A serialized value along with the table of its shared values.
+
+  Documents are marked with a registered type name, thus plain dicts are never
+  mistaken for them.
+  """
+
+  __serialization_key__ = 'pyglove.symbolic.SharedValuesDocument'
+
+  def __init__(
+      self, shared: List[Any], root: Any, interned: List[int]
+  ) -> None:
+    self.shared = shared
+    self.root = root
+    self.interned = interned
+
+  def to_json(self, **kwargs) -> object_utils.JSONValueType:
+    del kwargs
+    json_value = {
+        object_utils.JSONConvertible.TYPE_NAME_KEY: (
+            self.__serialization_key__
+        ),
+        'shared': self.shared,
+        'root': self.root,
+    }
+    if self.interned:
+      json_value['interned'] = self.interned
+    return json_value
+
+  @classmethod
+  def from_json(
+      cls,
+      json_value: Dict[str, Any],
+      *,
+      allow_partial: bool = False,
+      root_path: Optional[object_utils.KeyPath] = None,
+      **kwargs
+  ) -> Any:
+    """Loads the root value with the sharing among values restored."""
+    interned = set(json_value.get('interned', ()))
+    values = []
+    for i, v in enumerate(json_value['shared']):
+      value = from_json(
+          _replace_refs(v, values),
+          allow_partial=allow_partial,
+          _typename_resolved=True,
+          **kwargs
+      )
+      if i in interned:
+        value = _maybe_intern(value.seal())
+      values.append(value)
+    return from_json(
+        _replace_refs(json_value['root'], values),
+        allow_partial=allow_partial,
+        root_path=root_path,
+        _typename_resolved=True,
+        **kwargs
+    )
+
+
+class _SharedRef(object_utils.JSONConvertible):
+  """A reference to a shared value within a `_SharedValuesDocument`.
+
+  Like documents, references are marked with a registered type name, thus
+  plain dicts are never mistaken for them. They are replaced by the values
+  they refer to before the root of a document is loaded.
+  """
+
+  __serialization_key__ = 'pyglove.symbolic.SharedRef'
+
+  def __init__(self, index: int, copy: bool = False) -> None:
+    self.index = index
+    self.copy = copy
+
+  def to_json(self, **kwargs) -> object_utils.JSONValueType:
+    del kwargs
+    json_value = {
+        object_utils.JSONConvertible.TYPE_NAME_KEY: (
+            self.__serialization_key__
+        ),
+        'id': self.index,
+    }
+    if self.copy:
+      json_value['copy'] = True
+    return json_value
+
+  @classmethod
+  def from_json(cls, json_value: Dict[str, Any], **kwargs) -> Any:
+    del kwargs
+    raise ValueError(
+        f'Shared value reference {json_value!r} is not within a document '
+        'serialized by `pg.to_json(..., preserve_refs=True)`.')
+
+  @classmethod
+  def is_ref(cls, v: Dict[str, Any]) -> bool:
+    """Returns True if a JSON dict is a reference."""
+    type_name = v.get(object_utils.JSONConvertible.TYPE_NAME_KEY)
+    # NOTE: the type name is replaced by its factory if it is resolved.
+    return type_name is not None and (
+        type_name == cls.__serialization_key__
+        or type_name == cls.from_json)  # pylint: disable=comparison-with-callable
+
+
+def _replace_refs(v: Any, values: List[Any]) -> Any:
+  """Returns a JSON value whose references are replaced by values.
+
+  Like `_encode_int_keys`, containers without references are returned as is.
+
+  Args:
+    v: A JSON value from a document written with `preserve_refs`.
+    values: Loaded shared values by their indices.
+
+  Returns:
+    `v` itself if it has no reference, otherwise a copy with each reference
+    replaced by the value it refers to, or a deep copy of the value.
+  """
+  if isinstance(v, dict):
+    if _SharedRef.is_ref(v):
+      value = values[v['id']]
+      return value.clone(deep=True) if v.get('copy') else value
+    updates = None
+    for k, x in v.items():
+      if isinstance(x, (dict, list)):
+        y = _replace_refs(x, values)
+        if y is not x:
+          if updates is None:
+            updates = {}
+          updates[k] = y
+    if updates is None:
+      return v
+    return {k: updates.get(k, x) for k, x in v.items()}
+  elif isinstance(v, list):
+    replaced = None
+    for i, x in enumerate(v):
+      if isinstance(x, (dict, list)):
+        y = _replace_refs(x, values)
+        if y is not x:
+          if replaced is None:
+            replaced = list(v)
+          replaced[i] = y
+    return v if replaced is None else replaced
+  return v
+
+
 def to_json_str(value: Any,
                 *,
                 json_indent=None,
@@ -2232,22 +3346,121 @@ def to_json_str(value: Any,
   Returns:
     A JSON string.
   """
-  def _encode_int_keys(v):
-    if isinstance(v, dict):
-      return {
-          f'n_:{k}' if isinstance(k, int) else k: _encode_int_keys(v)
-          for k, v in v.items()
-      }
-    elif isinstance(v, list):
-      return [
-          _encode_int_keys(v) for v in v
-      ]
-    return v
   return json.dumps(
       _encode_int_keys(to_json(value, **kwargs)), indent=json_indent
   )
 
 
+def _encode_int_keys(v: Any) -> Any:
+  """Returns a JSON value whose int keys are encoded as strings.
+
+  The containers without int keys in their subtrees are returned as is, so
+  the common case walks the tree without allocating new containers.
+
+  Args:
+    v: A JSON value returned from `to_json`.
+
+  Returns:
+    `v` itself if it has no int key, otherwise a copy with int keys encoded.
+  """
+  if isinstance(v, dict):
+    has_int_key = False
+    updates = None
+    for k, x in v.items():
+      if isinstance(k, int):
+        has_int_key = True
+      if isinstance(x, (dict, list)):
+        y = _encode_int_keys(x)
+        if y is not x:
+          if updates is None:
+            updates = {}
+          updates[k] = y
+    if not has_int_key and updates is None:
+      return v
+    if updates is None:
+      updates = {}
+    return {
+        f'{_INT_KEY_PREFIX}{k}' if isinstance(k, int) else k: updates.get(k, x)
+        for k, x in v.items()
+    }
+  elif isinstance(v, list):
+    encoded = None
+    for i, x in enumerate(v):
+      if isinstance(x, (dict, list)):
+        y = _encode_int_keys(x)
+        if y is not x:
+          if encoded is None:
+            encoded = list(v)
+          encoded[i] = y
+    return v if encoded is None else encoded
+  return v
+
+
+def to_binary(value: Any, **kwargs) -> bytes:
+  """Serializes a (maybe) symbolic value into a compact binary format.
+
+  Example::
+
+    @pg.members([
+      ('x', pg.typing.Any())
+    ])
+    class A(pg.Object):
+      pass
+
+    a1 = A(1)
+    data = pg.to_binary(a1)
+    a2 = pg.from_binary(data)
+    assert pg.eq(a1, a2)
+
+  Compared to ``pg.to_json_str``, the binary format writes each type name
+  only once, and stores numbers and strings without text conversion. See
+  :mod:`pyglove.core.object_utils.binary_conversion` for details.
+
+  Args:
+    value: Value to serialize.
+    **kwargs: Additional keyword arguments that are passed to ``pg.to_json``.
+
+  Returns:
+    Serialized bytes.
+  """
+  return object_utils.binary_conversion.encode(to_json(value, **kwargs))
+
+
+def from_binary(data: bytes,
+                *,
+                allow_partial: bool = False,
+                root_path: Optional[object_utils.KeyPath] = None,
+                auto_import: bool = True,
+                auto_dict: bool = False,
+                **kwargs) -> Any:
+  """Deserializes a (maybe) symbolic value from bytes of the binary format.
+
+  Args:
+    data: Bytes returned from ``pg.to_binary``.
+    allow_partial: If True, allow a partial symbolic object to be created.
+      Otherwise error will be raised on partial value.
+    root_path: The symbolic path used for the deserialized root object.
+    auto_import: If True, when a '_type' is not registered, PyGlove will
+      identify its parent module and automatically import it. For example,
+      if the type is 'foo.bar.A', PyGlove will try to import 'foo.bar' and
+      find the class 'A' within the imported module.
+    auto_dict: If True, dict with '_type' that cannot be loaded will remain
+      as dict, with '_type' renamed to 'type_name'.
+    **kwargs: Additional keyword arguments that will be passed to
+      ``pg.from_json``.
+
+  Returns:
+    A deserialized value.
+  """
+  return from_json(
+      object_utils.binary_conversion.decode(data, auto_import, auto_dict),
+      allow_partial=allow_partial,
+      root_path=root_path,
+      _typename_resolved=True,
+      **kwargs
+  )
+
+
 def load(path: str, *args, **kwargs) -> Any:
   """Load a symbolic value using the global load handler.
 
@@ -2277,7 +3490,7 @@ def load(path: str, *args, **kwargs) -> Any:
   """
   load_handler = flags.get_load_handler() or default_load_handler
   value = load_handler(path, *args, **kwargs)
-  if flags.is_tracking_origin() and isinstance(value, Symbolic):
+  if isinstance(value, Symbolic) and _should_track_origin(value):
     value.sym_setorigin(path, 'load')
   return value
 
@@ -2335,11 +3548,19 @@ def open_jsonl(
       for value in f:
         print(value)
 
+    # Deserialize the records with 8 worker processes.
+    with pg.open_jsonl('my_file.jsonl', 'r', num_workers=8) as f:
+      for value in f:
+        print(value)
+
   Args:
     path: The path to the file.
     mode: The mode of the file.
     **kwargs: Additional keyword arguments that will be passed to
-      ``pg_io.open_sequence``.
+      ``pg_io.open_sequence``. For reading a local JSONL file, `num_workers`
+      can be specified for deserializing the records in parallel, with
+      `ordered=False` for yielding the records as soon as they are
+      deserialized.
 
   Returns:
     A sequence for PyGlove objects.
@@ -2355,9 +3576,12 @@ def open_jsonl(
 
 def default_load_handler(
     path: str,
-    file_format: Literal['json', 'txt'] = 'json',
+    file_format: Literal['json', 'txt', 'binary'] = 'json',
     **kwargs) -> Any:
   """Default load handler from file."""
+  if file_format == 'binary':
+    return from_binary(
+        pg_io.readfile(path, mode='rb'), allow_partial=True, **kwargs)
   content = pg_io.readfile(path)
   if file_format == 'json':
     return from_json_str(content, allow_partial=True, **kwargs)
@@ -2372,19 +3596,23 @@ def default_save_handler(
     path: str,
     *,
     indent: Optional[int] = None,
-    file_format: Literal['json', 'txt'] = 'json',
+    file_format: Literal['json', 'txt', 'binary'] = 'json',
     **kwargs) -> None:
   """Default save handler to file."""
+  mode = 'w'
   if file_format == 'json':
     content = to_json_str(value, json_indent=indent, **kwargs)
   elif file_format == 'txt':
     content = value if isinstance(value, str) else object_utils.format(
         value, compact=False, verbose=True)
+  elif file_format == 'binary':
+    content = to_binary(value, **kwargs)
+    mode = 'wb'
   else:
     raise ValueError(f'Unsupported `file_format`: {file_format!r}.')
 
   pg_io.mkdirs(os.path.dirname(path), exist_ok=True)
-  pg_io.writefile(path, content)
+  pg_io.writefile(path, content, mode=mode)
 
 
 #
@@ -2408,6 +3636,8 @@ def writtable_via_accessors(value: Symbolic) -> bool:
 
 def treats_as_sealed(value: Symbolic) -> bool:
   """Returns True if current object is treated as sealed in scope."""
+  if value._sym_interned:  # pylint: disable=protected-access
+    return True
   sealed_in_scope = flags.is_under_sealed_scope()
   return value.sym_sealed if sealed_in_scope is None else sealed_in_scope
 
@@ -14,17 +14,25 @@
 """Tests for pyglove.symbolic.base."""
 
 import copy
+import gc
 import inspect
+import json
 from typing import Any
 import unittest
+import weakref
 
 from pyglove.core import object_utils
 from pyglove.core import typing as pg_typing
 from pyglove.core import views
 from pyglove.core.symbolic import base
+from pyglove.core.symbolic import flags
 from pyglove.core.symbolic.dict import Dict
 from pyglove.core.symbolic.inferred import ValueFromParentChain
+from pyglove.core.symbolic.list import List
+from pyglove.core.symbolic.object import members as pg_members
 from pyglove.core.symbolic.object import Object
+from pyglove.core.symbolic.query_index import QueryIndex
+from pyglove.core.symbolic.ref import Ref
 
 
 class FieldUpdateTest(unittest.TestCase):
@@ -90,6 +98,30 @@ class FieldUpdateTest(unittest.TestCase):
     )
 
 
+class SymHashOverrideTest(unittest.TestCase):
+  """Tests for subclasses that override `sym_hash` instead of `_sym_hash`."""
+
+  def test_override_sym_hash(self):
+    methods = {
+        name: lambda *args, **kwargs: None
+        for name in base.Symbolic.__abstractmethods__
+    }
+    legacy_cls = type('Legacy', (base.Symbolic,), methods)
+    legacy_cls.sym_hash = lambda self: 1
+    v = legacy_cls(
+        allow_partial=False, accessor_writable=True, sealed=False,
+        root_path=None)
+    self.assertEqual(base.sym_hash(v), 1)
+
+    # Subclasses that implement neither get an error upon hashing.
+    v = type('Bad', (base.Symbolic,), methods)(
+        allow_partial=False, accessor_writable=True, sealed=False,
+        root_path=None)
+    with self.assertRaisesRegex(
+        NotImplementedError, 'should implement either'):
+      v.sym_hash()
+
+
 class HtmlTreeViewExtensionTest(unittest.TestCase):
 
   def assert_content(self, html, expected):
@@ -191,5 +223,388 @@ class HtmlTreeViewExtensionTest(unittest.TestCase):
       )
 
 
+@pg_members([
+    ('x', pg_typing.Any()),
+    ('y', pg_typing.List(pg_typing.Int(), default=[])),
+])
+class Leaf(Object):
+  allow_symbolic_mutation = False
+
+
+@pg_members([
+    ('a', pg_typing.Any()),
+    ('b', pg_typing.Any(default=None)),
+])
+class Node(Object):
+  pass
+
+
+class InternTest(unittest.TestCase):
+  """Tests for `pg.symbolic.intern`."""
+
+  def test_intern(self):
+    a1 = base.intern(Leaf(1, [1, 2]))
+    a2 = base.intern(Leaf(1, [1, 2]))
+    a3 = base.intern(Leaf(1, [1, 3]))
+    self.assertIs(a1, a2)
+    self.assertIsNot(a1, a3)
+    self.assertTrue(base.is_interned(a1))
+    self.assertTrue(base.is_interned(a1.y))
+    self.assertFalse(base.is_interned(Leaf(1)))
+    self.assertFalse(base.is_interned(1))
+    self.assertIs(base.intern(a1), a1)
+
+    # Values of different types are not interned together.
+    d = base.intern(Dict(x=1, y=List([1, 2]), sealed=True))
+    self.assertIsNot(d, a1)
+    self.assertTrue(base.is_interned(d))
+
+  def test_intern_bad_values(self):
+    with self.assertRaisesRegex(ValueError, 'Only symbolic values'):
+      base.intern(1)
+
+    with self.assertRaisesRegex(ValueError, 'Only sealed values'):
+      base.intern(Node(1))
+
+    with self.assertRaisesRegex(ValueError, 'Only root values'):
+      base.intern(Node(Leaf(1), sealed=True).a)
+
+    with self.assertRaisesRegex(ValueError, 'Only pure-data values'):
+      base.intern(Leaf(object()))
+
+    with self.assertRaisesRegex(ValueError, 'Only pure-data values'):
+      base.intern(Leaf(ValueFromParentChain()))
+
+  def test_shared_nodes(self):
+    a = base.intern(Leaf(1, [1, 2]))
+    b = Node(a, a)
+    # Interned values are placed without being copied or relocated.
+    self.assertIs(b.a, a)
+    self.assertIs(b.b, a)
+    self.assertIsNone(a.sym_parent)
+    self.assertEqual(a.sym_path, '')
+    self.assertIs(a.y.sym_parent, a)
+    self.assertEqual(a.y.sym_path, 'y')
+    self.assertTrue(base.eq(b, Node(Leaf(1, [1, 2]), Leaf(1, [1, 2]))))
+    self.assertEqual(
+        base.query(b, type=Leaf), {'a': a, 'b': a})
+
+    # Queries on indexed trees with shared nodes fall back to traversal.
+    index = QueryIndex(b)
+    self.assertTrue(index.has_shared_nodes)
+    self.assertEqual(base.query(b, type=Leaf), {'a': a, 'b': a})
+
+    # Replacing a shared node does not detach it.
+    b.rebind(a=1)
+    self.assertEqual(b.a, 1)
+    self.assertIs(b.b, a)
+    self.assertIsNone(a.sym_parent)
+
+    # Interned values stay sealed.
+    b.seal()
+    b.seal(False)
+    self.assertTrue(a.is_sealed)
+    self.assertTrue(a.y.is_sealed)
+    with flags.as_sealed(False):
+      with self.assertRaisesRegex(base.WritePermissionError, 'sealed'):
+        a.rebind(x=2)
+      with self.assertRaisesRegex(base.WritePermissionError, 'sealed'):
+        a.y.append(3)
+
+    # Clones are not interned.
+    c = a.clone(deep=True)
+    self.assertFalse(base.is_interned(c))
+    self.assertTrue(base.eq(c, a))
+
+  def test_clone_with_shared_nodes(self):
+    a = base.intern(Leaf(1, [1, 2]))
+    b = Node(Node(a, Leaf(2)), a)
+
+    # Interned values are shared by shallow and deep clones.
+    for deep in (False, True):
+      c = b.clone(deep=deep)
+      self.assertTrue(base.eq(c, b))
+      self.assertIs(c.a.a, a)
+      self.assertIs(c.b, a)
+      self.assertIsNot(c.a, b.a)
+      self.assertIsNot(c.a.b, b.a.b)
+      self.assertIsNone(a.sym_parent)
+
+    # Overrides replace the shared nodes only at their paths.
+    c = b.clone(deep=True, override={'a.a': 1, 'a.b': 2})
+    self.assertEqual(c.a.a, 1)
+    self.assertEqual(c.a.b, 2)
+    self.assertIs(c.b, a)
+    self.assertIs(b.a.a, a)
+
+    # Values within the shared nodes cannot be overridden.
+    with self.assertRaisesRegex(base.WritePermissionError, 'sealed'):
+      b.clone(deep=True, override={'b.x': 2})
+
+  def test_interning_scope(self):
+    self.assertFalse(flags.is_interning_enabled())
+    with flags.interning():
+      self.assertTrue(flags.is_interning_enabled())
+      # Values placed in a tree are interned.
+      b = Node(Leaf(1, [1, 2]), Leaf(1, [1, 2]), sealed=True)
+      self.assertTrue(base.is_interned(b.a))
+      self.assertIs(b.a, b.b)
+      l = List([Leaf(1, [1, 2]), Leaf(1, [1, 2])])
+      self.assertIs(l[0], b.a)
+      self.assertIs(l[1], b.a)
+
+      # The outermost constructed value is not replaced, but loaded values
+      # are.
+      a = Leaf(1, [1, 2])
+      self.assertIsNot(a, b.a)
+      self.assertIs(base.from_json(a.to_json()), b.a)
+
+      # Unsealed values are not interned.
+      l = List([Node(1), Node(1)])
+      self.assertIsNot(l[0], l[1])
+    l = List([Leaf(2), Leaf(2)])
+    self.assertIsNot(l[0], l[1])
+
+  def test_release(self):
+    a = base.intern(Leaf('release'))
+    a_ref = weakref.ref(a)
+    del a
+    gc.collect()
+    # Interned values are not held by the table.
+    self.assertIsNone(a_ref())
+    count = base.num_interned()
+    a = base.intern(Leaf('release'))
+    self.assertEqual(base.num_interned(), count + 1)
+
+
+class JsonStrTest(unittest.TestCase):
+  """Tests for `pg.to_json_str` and `pg.from_json_str`."""
+
+  def _reference_json_str(self, value, json_indent=None):
+    def _encode_int_keys(v):
+      if isinstance(v, dict):
+        return {
+            f'n_:{k}' if isinstance(k, int) else k: _encode_int_keys(v)
+            for k, v in v.items()
+        }
+      elif isinstance(v, list):
+        return [_encode_int_keys(v) for v in v]
+      return v
+    return json.dumps(
+        _encode_int_keys(base.to_json(value)), indent=json_indent)
+
+  def test_to_json_str(self):
+    values = [
+        1,
+        'foo',
+        None,
+        [1, {2: 'a', 'b': [3, {4: None}]}],
+        {1: {2: {3: 'x'}}, 'y': (1, 2)},
+        Dict(x=Leaf(1, [2]), y=List([Node(a={1: 'a'}), Node(a=[1])])),
+    ]
+    for v in values:
+      for json_indent in (None, 2):
+        self.assertEqual(
+            base.to_json_str(v, json_indent=json_indent),
+            self._reference_json_str(v, json_indent))
+
+  def test_to_json_str_does_not_modify_json_value(self):
+    json_value = {1: [{2: 'a'}], 'b': {'c': 1}}
+    self.assertIs(base._encode_int_keys(json_value['b']), json_value['b'])
+    self.assertEqual(
+        base._encode_int_keys(json_value),
+        {'n_:1': [{'n_:2': 'a'}], 'b': {'c': 1}})
+    self.assertEqual(json_value, {1: [{2: 'a'}], 'b': {'c': 1}})
+
+  def test_from_json_str(self):
+    v = Dict(
+        x=Leaf(1, [2]),
+        y=List([Node(a={1: 'a', 'n': {2: Leaf(2)}}), Node(a=(1, 'n_:'))])
+    )
+    loaded = base.from_json_str(base.to_json_str(v))
+    self.assertEqual(loaded, v)
+    self.assertIsInstance(loaded.y[0].a, Dict)
+    self.assertEqual(loaded.y[0].a[1], 'a')
+    self.assertIsInstance(loaded.y[0].a['n'][2], Leaf)
+    self.assertEqual(base.from_json_str('{"n_:1": {"n_:2": 3}}'), {1: {2: 3}})
+    self.assertEqual(base.from_json_str('[1, "n_:1"]'), [1, 'n_:1'])
+
+  def test_from_json_str_with_unknown_types(self):
+    json_str = '{"x": {"_type": "__main__.Unknown", "y": {"n_:1": 2}}}'
+    with self.assertRaisesRegex(TypeError, 'Cannot load class'):
+      base.from_json_str(json_str)
+    with self.assertRaisesRegex(TypeError, 'is not registered'):
+      base.from_json_str(json_str, auto_import=False)
+    self.assertEqual(
+        base.from_json_str(json_str, auto_dict=True),
+        {'x': {'type_name': '__main__.Unknown', 'y': {1: 2}}})
+
+
+class BinaryTest(unittest.TestCase):
+  """Tests for `pg.to_binary` and `pg.from_binary`."""
+
+  def test_round_trip(self):
+    v = Dict(
+        x=Leaf(1.5, [2]),
+        y=List([Node(a={1: 'a', 'n': Leaf(2)}), Node(a=(1, None))])
+    )
+    data = base.to_binary(v)
+    self.assertLess(len(data), len(base.to_json_str(v)))
+    loaded = base.from_binary(data)
+    self.assertEqual(loaded, v)
+    self.assertIsInstance(loaded.y[0].a, Dict)
+    self.assertIsInstance(loaded.y[0].a['n'], Leaf)
+    self.assertEqual(loaded.y[1].a, (1, None))
+
+  def test_from_binary_with_options(self):
+    data = base.to_binary({'x': {'_type': '__main__.Unknown', 'y': 1}})
+    with self.assertRaisesRegex(TypeError, 'Cannot load class'):
+      base.from_binary(data)
+    self.assertEqual(
+        base.from_binary(data, auto_dict=True),
+        {'x': {'y': 1, 'type_name': '__main__.Unknown'}})
+    v = base.from_binary(
+        base.to_binary(Node(a=1)),
+        root_path=object_utils.KeyPath.parse('a.b'))
+    self.assertEqual(v.sym_path, 'a.b')
+
+
+def _ref(index, copy=False):
+  return base._SharedRef(index, copy).to_json()  # pylint: disable=protected-access
+
+
+class SharedValuesTest(unittest.TestCase):
+  """Tests for `pg.to_json` with `preserve_refs` and `dedup_equal`."""
+
+  def test_no_shared_values(self):
+    v = Dict(x=Leaf(1, [2]), y=List([Node(a=Leaf(1, [2]))]))
+    self.assertEqual(base.to_json(v, preserve_refs=True), base.to_json(v))
+
+    # Plain dicts are not mistaken for documents with shared values.
+    v = Dict(shared=[1], root={'__ref__': 0})
+    self.assertEqual(base.from_json_str(base.to_json_str(v)), v)
+
+  def test_user_data_like_refs(self):
+    a = Leaf(1, [2])
+    v = Dict(
+        p=Ref(a), q=Ref(a),
+        data={'__ref__': 0}, copy={'__copy__': 0}, other={'__ref__': 'x'},
+        ref_like={'id': 0, 'copy': True},
+    )
+    json_value = base.to_json(v, preserve_refs=True)
+    self.assertEqual(json_value['root']['data'], {'__ref__': 0})
+    for loaded in [
+        base.from_json(json_value),
+        base.from_json_str(base.to_json_str(v, preserve_refs=True)),
+        base.from_binary(base.to_binary(v, preserve_refs=True)),
+    ]:
+      for k in ['data', 'copy', 'other', 'ref_like']:
+        self.assertEqual(loaded[k], v[k])
+      self.assertEqual(loaded.p, a)
+      self.assertIs(loaded.p, loaded.q)
+
+    # References are not loaded outside documents.
+    with self.assertRaisesRegex(ValueError, 'is not within a document'):
+      base.from_json(_ref(0))
+
+  def test_refs(self):
+    shared = Node(a=Leaf(1, [2]), b=[1, 2])
+    v = Dict(
+        x=Ref(shared),
+        y=List([Ref(shared), Node(a=Ref(shared))]),
+        z=Ref(shared.b),
+    )
+    json_value = base.to_json(v, preserve_refs=True)
+    self.assertEqual(
+        json_value['_type'], 'pyglove.symbolic.SharedValuesDocument')
+    # The list in `shared` is written before `shared` since it is within it.
+    self.assertEqual(
+        json_value['shared'],
+        [[1, 2], dict(base.to_json(shared), b=_ref(0))])
+    self.assertEqual(json_value['root']['y'][1]['a']['value'],
+                     _ref(1))
+    self.assertNotIn('interned', json_value)
+
+    for loaded in [
+        base.from_json(json_value),
+        base.from_json_str(base.to_json_str(v, preserve_refs=True)),
+        base.from_binary(base.to_binary(v, preserve_refs=True)),
+    ]:
+      self.assertIsInstance(loaded.sym_getattr('x'), Ref)
+      self.assertEqual(loaded.x, shared)
+      self.assertIs(loaded.y[0], loaded.x)
+      self.assertIs(loaded.y[1].a, loaded.x)
+      self.assertIs(loaded.z, loaded.x.b)
+
+  def test_interned_values(self):
+    a = base.intern(Leaf('shared', [1]))
+    v = List([a, Node(a=a, b=Dict(c=a))])
+    json_value = base.to_json(v, preserve_refs=True)
+    self.assertEqual(json_value['shared'], [base.to_json(a)])
+    self.assertEqual(json_value['interned'], [0])
+    loaded = base.from_json(json_value)
+    self.assertIs(loaded[0], a)
+    self.assertIs(loaded[1].a, a)
+    self.assertIs(loaded[1].b.c, a)
+
+  def test_non_symbolic_values(self):
+    p = pg_typing.Int(min_value=1)
+    v = List([p, Dict(x=p)])
+    json_value = base.to_json(v, preserve_refs=True)
+    self.assertEqual(json_value['root'][0], _ref(0))
+    loaded = base.from_json(json_value)
+    self.assertEqual(loaded[0], p)
+    self.assertIs(loaded[1].x, loaded[0])
+
+  def test_dedup_equal(self):
+    v = Dict(
+        x=Node(a=Leaf(1, [2]), b=Leaf(2)),
+        y=List([Node(a=Leaf(1, [2]), b=Leaf(2)), Leaf(1, [2])]),
+        z=Dict(),
+        w=Dict(),
+    )
+    json_value = base.to_json(v, dedup_equal=True)
+    self.assertEqual(
+        json_value['shared'],
+        [base.to_json(Leaf(1, [2])),
+         {'_type': Node.__serialization_key__,
+          'a': _ref(0), 'b': base.to_json(Leaf(2))}])
+    self.assertEqual(
+        json_value['root'],
+        {'x': _ref(1), 'y': [_ref(1, copy=True), _ref(0, copy=True)],
+         'z': {}, 'w': {}})
+    # References are written as typed JSON dicts, therefore deduplication
+    # makes a JSON string shorter when the equal values are larger than them.
+    large = List([Leaf(i % 3, list(range(i % 3, 100))) for i in range(6)])
+    self.assertLess(
+        len(base.to_json_str(large, dedup_equal=True)),
+        len(base.to_json_str(large)))
+
+    # Equal values are loaded as copies of the shared value.
+    loaded = base.from_json(json_value)
+    self.assertEqual(loaded, v)
+    self.assertIs(loaded.x.sym_parent, loaded)
+    self.assertIs(loaded.y[0].sym_parent, loaded.y)
+    self.assertIsNot(loaded.x, loaded.y[0])
+
+  def test_dedup_equal_with_refs(self):
+    a1, a2 = Leaf(1, [2]), Leaf(1, [2])
+    v = List([Ref(a1), Ref(a2), Ref(a2), a1.clone()])
+    json_value = base.to_json(v, dedup_equal=True)
+    self.assertEqual(
+        json_value['shared'], [base.to_json(a1), _ref(0, copy=True)])
+    self.assertEqual(
+        [x if i == 3 else x['value']
+         for i, x in enumerate(json_value['root'])],
+        [_ref(0), _ref(1), _ref(1), _ref(0, copy=True)])
+
+    # The sharing among references to the same value is preserved.
+    loaded = base.from_json(json_value)
+    self.assertEqual([loaded[i] for i in range(4)], [Leaf(1, [2])] * 4)
+    self.assertIs(loaded[1], loaded[2])
+    self.assertIsNot(loaded[0], loaded[1])
+    self.assertIsNot(loaded[3], loaded[0])
+
+
 if __name__ == '__main__':
   unittest.main()
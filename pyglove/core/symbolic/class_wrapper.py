@@ -54,6 +54,10 @@ class ClassWrapper(pg_object.Object, metaclass=ClassWrapperMeta):
   Please see :func:`pyglove.wrap` for details.
   """
 
+  # The state of wrapped objects is not captured by their symbolic attributes,
+  # therefore they cannot be interned.
+  _sym_internable = False
+
   @property
   @abc.abstractmethod
   def sym_wrapped(self):
@@ -71,6 +75,11 @@ class _SubclassedWrapperBase(ClassWrapper):
   # the `__init__` method.
   auto_typing = False
 
+  # NOTE: `_on_reset` restores the instance `__dict__` recorded before
+  # calling the user `__init__`, which does not work with compact storage whose
+  # attributes container is materialized lazily.
+  use_compact_storage = False
+
   @object_utils.explicit_method_override
   def __init__(self, *args, **kwargs):
     """Overridden __init__ to construct symbolic wrapper only."""
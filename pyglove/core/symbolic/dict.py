@@ -239,7 +239,22 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
     for k, v in kwargs.items():
       dict_obj[k] = v
 
-    if value_spec:
+    if flags.is_under_trusted_construction() and not pass_through:
+      # NOTE: under `pg.trusted_construction`, the items are added to the
+      # new dict without going through `_set_item_without_permission_check`,
+      # which validates each item and records its update.
+      for k, v in dict_obj.items():
+        if not isinstance(k, (str, int)):
+          raise KeyError(self._error_message(
+              f'Key must be string or int type. Encountered {k!r}.'))
+        # Missing values are treated as absent, which are filled with the
+        # default values (if any) when the value spec is bound.
+        if not isinstance(v, object_utils.MissingValue):
+          super().__setitem__(
+              k, self._formalized_value_without_validation(k, v))
+      if value_spec:
+        self.use_value_spec(value_spec, allow_partial)
+    elif value_spec:
       if pass_through:
         for k, v in dict_obj.items():
           super().__setitem__(k, self._relocate_if_symbolic(k, v))
@@ -316,7 +331,9 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
 
     self._allow_partial = allow_partial
 
-    if flags.is_type_check_enabled():
+    if flags.is_under_trusted_construction():
+      self._use_value_spec_without_validation(value_spec)
+    elif flags.is_type_check_enabled():
       # NOTE(daiyip): self._value_spec will be set in Dict.custom_apply method
       # called by value_spec.apply, thus we don't need to set self._value_spec
       # explicitly.
@@ -329,6 +346,32 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
       self._value_spec = value_spec
     return self
 
+  def _use_value_spec_without_validation(
+      self, value_spec: pg_typing.Dict) -> None:
+    """Binds value spec to current dict without validating its values."""
+    self._value_spec = value_spec
+    for key_spec, field in value_spec.schema.fields.items():
+      if key_spec.is_const and key_spec not in self:
+        key = key_spec.text
+        value = pg_typing.MISSING_VALUE
+        if field.value.has_default:
+          value = self._formalized_value(key, field, value)
+        super().__setitem__(key, value)
+
+    for k, v in list(self.sym_items()):
+      field = value_spec.schema.get_field(k)
+      if field is None:
+        continue
+      if base._requires_apply(field.value, v):  # pylint: disable=protected-access
+        # Values that need transform or type conversion are applied as usual.
+        super().__setitem__(k, self._formalized_value(k, field, v))
+      elif (isinstance(v, (Dict, base.Symbolic.ListType))
+            and v.value_spec is None
+            and isinstance(field.value, (pg_typing.Dict, pg_typing.List))):
+        # Schema-less child containers are bound with the value specs of their
+        # fields, which is otherwise done by `value_spec.apply`.
+        v.use_value_spec(field.value, self._allow_partial)
+
   def _sym_parent_for_children(self) -> Optional[base.Symbolic]:
     if self._as_object_attributes_container:
       return self.sym_parent
@@ -339,8 +382,9 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
       ) -> List[base.FieldUpdate]:
     """Subclass specific rebind implementation."""
     updates = []
+    resolved_nodes = [self, {}]
     for k, v in path_value_pairs.items():
-      update = self._set_item_of_current_tree(k, v)
+      update = self._set_item_of_current_tree(k, v, resolved_nodes)
       if update is not None:
         updates.append(update)
     return updates
@@ -424,7 +468,7 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
 
   def seal(self, sealed: bool = True) -> 'Dict':
     """Seals or unseals current object from further modification."""
-    if self.is_sealed == sealed:
+    if self.is_sealed == sealed or self._sym_interned:
       return self
     for v in self.sym_values():
       if isinstance(v, base.Symbolic):
@@ -472,9 +516,13 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
     for k in self.sym_keys():
       yield k, self._sym_getattr(k)
 
-  def sym_setparent(self, parent: base.Symbolic):
-    """Override set parent of Dict to handle the passing through scenario."""
-    super().sym_setparent(parent)
+  def _sym_setlocation(
+      self, parent: Optional[base.Symbolic], key: Optional[Union[str, int]]
+      ) -> None:
+    """Override set location of Dict to handle the passing through scenario."""
+    if self._sym_interned:
+      return
+    super()._sym_setlocation(parent, key)
     # NOTE(daiyip): when flag `as_object_attributes_container` is on, it sets
     # the parent of child symbolic values using its parent.
     if self._as_object_attributes_container:
@@ -482,8 +530,27 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
         if isinstance(v, base.TopologyAware):
           v.sym_setparent(parent)
 
+  @property
+  def sym_path(self) -> object_utils.KeyPath:
+    """Returns the path of current dict from the root of its symbolic tree."""
+    # NOTE: an object attributes container shares the same path with
+    # its owning object.
+    if self._as_object_attributes_container and self.sym_parent is not None:
+      return self.sym_parent.sym_path
+    return super().sym_path
+
   def sym_hash(self) -> int:
     """Symbolic hashing."""
+    # NOTE: children of an object attributes container use the owning
+    # object as their parent, thus updates from the subtree do not invalidate
+    # the memoized hash of the container. The owning object memoizes the hash
+    # instead.
+    if self._as_object_attributes_container:
+      return self._sym_hash()
+    return super().sym_hash()
+
+  def _sym_hash(self) -> int:
+    """Computes the symbolic hash without memoization."""
     return base.sym_hash(
         (self.__class__,
          tuple([(k, base.sym_hash(v)) for k, v in self.sym_items()
@@ -497,9 +564,14 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
   def _sym_clone(self, deep: bool, memo=None) -> 'Dict':
     """Override Symbolic._sym_clone."""
     source = dict()
+    # Values substituted from the memo (see `Symbolic.sym_clone`) are not
+    # validated yet, thus cannot be passed through.
+    pass_through = True
     for k, v in self.sym_items():
       if deep or isinstance(v, base.Symbolic):
-        v = base.clone(v, deep, memo)
+        if memo and id(v) in memo and isinstance(v, base.Symbolic):
+          pass_through = False
+        v = base._clone_child(v, deep, memo)  # pylint: disable=protected-access
       source[k] = v
     return Dict(
         source,
@@ -511,16 +583,20 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
         # NOTE(daiyip): parent and root_path are reset to empty
         # for copy object.
         root_path=None,
-        pass_through=True)
+        pass_through=pass_through)
 
   def _update_children_paths(
       self,
       old_path: object_utils.KeyPath,
       new_path: object_utils.KeyPath) -> None:
-    """Update children paths according to root_path of current node."""
-    del old_path
+    """Notifies path changes to the subscribers within current sub-tree."""
     for k, v in self.sym_items():
-      if isinstance(v, base.TopologyAware):
+      if isinstance(v, base.Symbolic):
+        if v._sym_num_path_subscribers and v._sym_path_key is not None:  # pylint: disable=protected-access
+          v._update_children_paths(  # pylint: disable=protected-access
+              object_utils.KeyPath(k, old_path),
+              object_utils.KeyPath(k, new_path))
+      elif isinstance(v, base.TopologyAware):
         v.sym_setpath(object_utils.KeyPath(k, new_path))
 
   def _set_item_without_permission_check(  # pytype: disable=signature-mismatch  # overriding-parameter-type-checks
@@ -548,10 +624,14 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
                 f'Key {key!r} is not allowed for {container_cls}.'))
 
     # Detach old value from object tree.
-    if isinstance(old_value, base.TopologyAware):
+    if isinstance(old_value, base.Symbolic):
+      old_value._sym_setlocation(None, None)  # pylint: disable=protected-access
+    elif isinstance(old_value, base.TopologyAware):
       old_value.sym_setparent(None)
       old_value.sym_setpath(object_utils.KeyPath())
 
+    self._invalidate_sym_hash()
+
     if (pg_typing.MISSING_VALUE == value and
         (not field or isinstance(field.key, pg_typing.NonConstKey))):
       if key in self:
@@ -627,6 +707,28 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
     """Customizes pickle.load."""
     self.__init__(state['value'], **state['kwargs'])
 
+  def _sym_reduce_state(self) -> Optional[Tuple[Any, ...]]:
+    """Returns the symbolic items and init kwargs for pickling."""
+    cls = self.__class__
+    if (cls.__init__ is not Dict.__init__
+        or self._as_object_attributes_container
+        or cls.__getstate__ is not Dict.__getstate__
+        or cls.__setstate__ is not Dict.__setstate__):
+      return None
+    return (tuple(self.sym_items()), self._init_kwargs())
+
+  @classmethod
+  def _sym_restore(
+      cls, items: Tuple[Any, ...], kwargs: typing.Dict[str, Any]) -> 'Dict':
+    """Restores a dict from its items without validation."""
+    kwargs = dict(kwargs)
+    sealed = kwargs.pop('sealed', False)
+    value = cls(**kwargs)
+    for k, v in items:
+      dict.__setitem__(value, k, value._relocate_if_symbolic(k, v))  # pylint: disable=protected-access
+    value.seal(sealed)
+    return value
+
   def __getitem__(self, key: Union[str, int]) -> Any:
     """Get item in this Dict."""
     try:
@@ -770,6 +872,7 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
           '\'popitem\' cannot be performed on a Dict with value spec.')
     if base.treats_as_sealed(self):
       raise base.WritePermissionError('Cannot pop item from a sealed Dict.')
+    self._invalidate_sym_hash()
     return super().popitem()
 
   def clear(self) -> None:
@@ -779,6 +882,7 @@ class Dict(dict, base.Symbolic, pg_typing.CustomTyping):
     value_spec = self._value_spec
     self._value_spec = None
     super().clear()
+    self._invalidate_sym_hash()
 
     if value_spec:
       self.use_value_spec(value_spec, self._allow_partial)
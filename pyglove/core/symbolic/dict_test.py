@@ -14,10 +14,12 @@
 """Tests for pyglove.Dict."""
 
 import copy
+import gc
 import inspect
 import io
 import pickle
 import unittest
+from unittest import mock
 
 from pyglove.core import object_utils
 from pyglove.core import typing as pg_typing
@@ -91,6 +93,46 @@ class DictTest(unittest.TestCase):
         TypeError, '.* must be a `pg.typing.Dict` object'):
       Dict(value_spec=pg_typing.Int())
 
+  def test_init_under_trusted_construction(self):
+    vs = pg_typing.Dict([
+        ('a', pg_typing.Int(min_value=0)),
+        ('b', pg_typing.Int(default=1)),
+        ('c', pg_typing.Float(default=1.0)),
+        ('d', pg_typing.List(pg_typing.Int(), default=[])),
+    ])
+    x = Dict(y=1)
+    with flags.trusted_construction():
+      # Values are not validated, but missing values are filled with defaults
+      # and type conversions are applied.
+      sd1 = Dict(a=-1, b=pg_typing.MISSING_VALUE, c=2, d=[1],
+                 value_spec=vs)
+      self.assertEqual(sd1, dict(a=-1, b=1, c=2.0, d=[1]))
+      self.assertIsInstance(sd1.c, float)
+      self.assertIsInstance(sd1.d, List)
+      self.assertIs(sd1.d.sym_parent, sd1)
+
+      # Values of schema-less dicts are formalized and relocated.
+      sd = Dict({'a': {'b': [1]}, 1: x, 'c': pg_typing.MISSING_VALUE})
+      self.assertEqual(sd, {'a': {'b': [1]}, 1: dict(y=1)})
+      self.assertIsInstance(sd.a, Dict)
+      self.assertIsInstance(sd.a.b, List)
+      self.assertEqual(sd.a.b.sym_path, 'a.b')
+      self.assertIs(sd[1], x)
+      self.assertIs(x.sym_parent, sd)
+      # Values that belong to another tree are copied.
+      sd2 = Dict(z=x)
+      self.assertIsNot(sd2.z, x)
+      self.assertEqual(sd2.z.sym_path, 'z')
+
+      with self.assertRaisesRegex(KeyError, 'Key must be string or int type'):
+        Dict({1.0: 1})
+
+    # Value spec bound under trusted construction takes effect afterwards.
+    with self.assertRaisesRegex(ValueError, 'Value -2 is out of range'):
+      sd1.a = -2
+    with self.assertRaisesRegex(TypeError, 'Expect .* but encountered'):
+      sd1.d.append('abc')
+
   def test_partial(self):
     spec = pg_typing.Dict([
         ('a', pg_typing.Int()),
@@ -1141,6 +1183,40 @@ class DictTest(unittest.TestCase):
     self.assertNotEqual(Dict(a=B(1)), Dict(a=1))
     self.assertTrue(base.eq(Dict(a=B(1)), Dict(a=1)))
 
+  def test_sym_eq_with_memoized_hashes(self):
+    x = Dict(a=1, b=[Dict(c='foo')])
+    y = Dict(a=1, b=[Dict(c='bar')])
+    x.sym_hash()
+    y.sym_hash()
+    # Different hashes are decisive for structurally compared trees.
+    self.assertTrue(base._hashes_differ(x, y))  # pylint: disable=protected-access
+    self.assertFalse(base.eq(x, y))
+    y.b[0].c = 'foo'
+    self.assertFalse(base._hashes_differ(x, y))  # pylint: disable=protected-access
+    self.assertTrue(base.eq(x, y))
+
+    # Equal hashes are not decisive.
+    x, y = Dict(a=-1), Dict(a=-2)
+    self.assertEqual(x.sym_hash(), y.sym_hash())
+    self.assertFalse(base.eq(x, y))
+
+    # Different hashes are not decisive when user equality is involved.
+    class A:
+
+      def __init__(self, value):
+        self.value = value
+
+      def __hash__(self):
+        return hash(self.value) + 1
+
+      def sym_eq(self, other):
+        return self.value == other
+
+    x, y = Dict(a=A(1)), Dict(a=1)
+    self.assertNotEqual(x.sym_hash(), y.sym_hash())
+    self.assertFalse(base._hashes_differ(x, y))  # pylint: disable=protected-access
+    self.assertTrue(base.eq(x, y))
+
   def test_sym_ne(self):
     # Refer test_sym_eq for more details.
     self.assertNotEqual(Dict(), 1)
@@ -1241,6 +1317,74 @@ class DictTest(unittest.TestCase):
 
     self.assertEqual(Dict(x=C('abc')).sym_hash(), Dict(x=C('abc')).sym_hash())
 
+  def test_sym_hash_memoization(self):
+    sd = Dict(x=Dict(y=1), z=[Dict(p=1)])
+    h = sd.sym_hash()
+    self.assertEqual(sd.sym_hash(), h)
+
+    # Updates from the subtree invalidates the memoized hash.
+    sd.x.y = 2
+    self.assertNotEqual(sd.sym_hash(), h)
+    self.assertEqual(sd.sym_hash(), Dict(x=Dict(y=2), z=[Dict(p=1)]).sym_hash())
+
+    sd.z[0].rebind(p=2)
+    self.assertEqual(sd.sym_hash(), Dict(x=Dict(y=2), z=[Dict(p=2)]).sym_hash())
+
+    # Updates without notification invalidates the memoized hash too.
+    sd.x.update(y=3)
+    self.assertEqual(sd.sym_hash(), Dict(x=Dict(y=3), z=[Dict(p=2)]).sym_hash())
+
+    del sd['z']
+    self.assertEqual(sd.sym_hash(), Dict(x=Dict(y=3)).sym_hash())
+
+    sd.clear()
+    self.assertEqual(sd.sym_hash(), Dict().sym_hash())
+
+  def test_sym_generation(self):
+    sd = Dict(x=Dict(y=1), z=[Dict(p=1)])
+    g, gx, gz = sd.sym_generation, sd.x.sym_generation, sd.z.sym_generation
+    sd.x.y = 2
+    self.assertGreater(sd.sym_generation, g)
+    self.assertGreater(sd.x.sym_generation, gx)
+    self.assertEqual(sd.z.sym_generation, gz)
+
+    g = sd.sym_generation
+    sd.z[0].rebind(p=2)
+    self.assertGreater(sd.sym_generation, g)
+    self.assertGreater(sd.z.sym_generation, gz)
+
+  def test_validation_cache(self):
+    def make_spec():
+      return pg_typing.Dict([('x', pg_typing.List(pg_typing.Int(min_value=0)))])
+
+    spec = make_spec().cache_validation()
+    sd = Dict(x=[1, 2], value_spec=make_spec()).seal()
+    self.assertIs(spec.apply(sd), sd)
+    self.assertEqual(len(spec._validation_cache), 1)
+    with mock.patch.object(pg_typing.Dict, 'is_compatible') as is_compatible:
+      self.assertIs(spec.apply(sd), sd)
+      is_compatible.assert_not_called()
+
+    # Mutations invalidate the cache.
+    sd.seal(False)
+    sd.x.append(3)
+    sd.seal()
+    with mock.patch.object(
+        pg_typing.Dict, 'is_compatible', autospec=True,
+        side_effect=pg_typing.Dict.is_compatible) as is_compatible:
+      self.assertIs(spec.apply(sd), sd)
+      is_compatible.assert_called_once()
+
+    # Unsealed values are not cached.
+    sd2 = Dict(x=[1], value_spec=make_spec())
+    spec.apply(sd2)
+    self.assertEqual(len(spec._validation_cache), 1)
+
+    # Entries are removed once the values are garbage collected.
+    del sd, is_compatible
+    gc.collect()
+    self.assertEqual(len(spec._validation_cache), 0)
+
   def test_sym_parent(self):
     sd = Dict(x=dict(a=1), y=[])
     self.assertIsNone(sd.sym_parent)
@@ -13,7 +13,7 @@
 # limitations under the License.
 """Symbolic differences."""
 
-from typing import Any, Callable, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Optional, Sequence, Union
 
 from pyglove.core import object_utils
 from pyglove.core import typing as pg_typing
@@ -479,41 +479,65 @@ def diff(
       assert isinstance(container, base.Symbolic)
       return container.sym_hasattr, container.sym_getattr, container.sym_items
 
-  def _diff(x, y) -> Tuple[object_utils.Nestable[Diff], bool]:
-    if x is y or x == y:
-      return (Diff(x, y), False)
-    if not _should_collapse(x, y):
-      return (Diff(x, y), True)
-
-    diff_value, has_diff = {}, False
+  def _children(pair):
+    """Returns the child pairs to compare for a pair of collapsed values."""
+    x, y = pair
     if isinstance(x, list):
       assert isinstance(y, list)
       def _child(l, index):
-        return l[i] if index < len(l) else Diff.MISSING
-      for i in range(max(len(x), len(y))):
-        child_diff, child_has_diff = _diff(_child(x, i), _child(y, i))
-        has_diff = has_diff or child_has_diff
-        _add_child_diff(diff_value, str(i), child_diff, child_has_diff)
-      diff_value = Diff(pg_list.List, pg_list.List, children=diff_value)
-    else:
-      assert isinstance(x, (dict, base.Symbolic))
-      assert isinstance(y, (dict, base.Symbolic))
-
-      x_haskey, _, x_items = _get_container_ops(x)
-      y_haskey, y_getitem, y_items = _get_container_ops(y)
-
+        return l[index] if index < len(l) else Diff.MISSING
+      return ((str(i), (_child(x, i), _child(y, i)))
+              for i in range(max(len(x), len(y))))
+
+    assert isinstance(x, (dict, base.Symbolic))
+    assert isinstance(y, (dict, base.Symbolic))
+    x_haskey, _, x_items = _get_container_ops(x)
+    y_haskey, y_getitem, y_items = _get_container_ops(y)
+    def _child_pairs():
       for k, xv in x_items():
-        yv = y_getitem(k) if y_haskey(k) else Diff.MISSING
-        child_diff, child_has_diff = _diff(xv, yv)
-        has_diff = has_diff or child_has_diff
-        _add_child_diff(diff_value, k, child_diff, child_has_diff)
-
+        yield k, (xv, y_getitem(k) if y_haskey(k) else Diff.MISSING)
       for k, yv in y_items():
         if not x_haskey(k):
-          child_diff, _ = _diff(Diff.MISSING, yv)
-          has_diff = True
-          _add_child_diff(diff_value, k, child_diff, True)
+          yield k, (Diff.MISSING, yv)
+    return _child_pairs()
+
+  # NOTE: the diff is computed with an explicit stack over the tree of
+  # (left, right) pairs, so it is not bounded by the recursion limit. Each
+  # frame holds a pair being collapsed and the diffs of its visited children,
+  # the bottom frame holds the diff of the root.
+  frames = [(None, [])]
+
+  def _enter(path, pair, parent):
+    del parent
+    x, y = pair
+    # NOTE: subtrees with different memoized hashes are known to be
+    # different without being compared, and same subtrees in 'diff' mode are
+    # dropped without creating their `Diff` objects.
+    if x is y or (not base._hashes_differ(x, y, compute_hashes=True)  # pylint: disable=protected-access
+                  and x == y):
+      frames[-1][1].append(
+          (_key_of(path), Diff(x, y) if mode != 'diff' else None, False))
+      return base.TraverseAction.CONTINUE
+    if not _should_collapse(x, y):
+      frames[-1][1].append((_key_of(path), Diff(x, y), True))
+      return base.TraverseAction.CONTINUE
+    frames.append((pair, []))
+    return base.TraverseAction.ENTER
+
+  def _leave(path, pair, parent):
+    del parent
+    if frames[-1][0] is not pair:
+      return
+    _, children = frames.pop()
+    x, y = pair
+    diff_value, has_diff = {}, False
+    for k, child_diff, child_has_diff in children:
+      has_diff = has_diff or child_has_diff
+      _add_child_diff(diff_value, k, child_diff, child_has_diff)
 
+    if isinstance(x, list):
+      diff_value = Diff(pg_list.List, pg_list.List, children=diff_value)
+    else:
       xt, yt = type(x), type(y)
       same_type = xt is yt
       if not same_type:
@@ -527,9 +551,13 @@ def diff(
           diff_value['_type'] = Diff(xt, yt)
       else:
         diff_value = Diff(xt, yt, children=diff_value)
-    return diff_value, has_diff
+    frames[-1][1].append((_key_of(path), diff_value, has_diff))
+
+  def _key_of(path):
+    return path.key if len(frames) > 1 else None
 
-  diff_value, has_diff = _diff(left, right)
+  object_utils.walk((left, right), _children, _enter, _leave)
+  _, diff_value, has_diff = frames[0][1][0]
   if not has_diff and mode == 'diff':
     diff_value = Diff()
   if flatten:
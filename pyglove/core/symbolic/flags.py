@@ -13,7 +13,8 @@
 # limitations under the License.
 """Global, thread-local and scoped flags for handling symbolic objects."""
 
-from typing import Any, Callable, ContextManager, Optional
+import contextlib
+from typing import Any, Callable, ContextManager, Dict, Iterator, Optional, Sequence, Type
 from pyglove.core.object_utils import thread_local
 
 
@@ -24,9 +25,11 @@ from pyglove.core.object_utils import thread_local
 _ALLOW_EMPTY_FIELD_DESCRIPTION = True
 _ALLOW_REPEATED_CLASS_REGISTRATION = True
 _ORIGIN_STACKTRACE_LIMIT = 10
+_ORIGIN_HISTORY_SIZE = 0
 
 _LOAD_HANDLER = None
 _SAVE_HANDLER = None
+_DEFERRED_NOTIFICATIONS_HANDLER = None
 
 
 def allow_empty_field_description(allow: bool = True) -> None:
@@ -62,6 +65,24 @@ def get_origin_stacktrace_limit() -> int:
   return _ORIGIN_STACKTRACE_LIMIT
 
 
+def set_origin_history_size(size: int) -> None:
+  """Sets the size of the ring buffer for recently tracked origins.
+
+  Args:
+    size: The max number of origins to keep in `pg.symbolic.origin_history()`.
+      If 0, origin history is disabled.
+  """
+  if size < 0:
+    raise ValueError(f'`size` must be non-negative. Encountered: {size}.')
+  global _ORIGIN_HISTORY_SIZE
+  _ORIGIN_HISTORY_SIZE = size
+
+
+def get_origin_history_size() -> int:
+  """Returns the size of the ring buffer for recently tracked origins."""
+  return _ORIGIN_HISTORY_SIZE
+
+
 def set_load_handler(
     load_handler: Optional[Callable[..., Any]]) -> Optional[Callable[..., Any]]:
   """Sets global load handler.
@@ -112,6 +133,19 @@ def get_save_handler() -> Optional[Callable[..., Any]]:
   return _SAVE_HANDLER
 
 
+def set_deferred_notifications_handler(
+    handler: Callable[[Dict[Any, Any]], None]) -> None:
+  """Sets the handler that fires the notifications deferred in a scope.
+
+  Args:
+    handler: A callable object that takes the pending updates accumulated
+      within the outermost `defer_notifications` scope, which is called upon
+      exiting the scope.
+  """
+  global _DEFERRED_NOTIFICATIONS_HANDLER
+  _DEFERRED_NOTIFICATIONS_HANDLER = handler
+
+
 #
 # Scoped flags.
 #
@@ -119,10 +153,15 @@ def get_save_handler() -> Optional[Callable[..., Any]]:
 _TLS_ENABLE_CHANGE_NOTIFICATION = '_enable_change_notification'
 _TLS_ENABLE_TYPE_CHECK = '_enable_type_check'
 _TLS_ENABLE_ORIGIN_TRACKING = '_enable_origin_tracking'
+_TLS_ORIGIN_TRACKING_COUNT = '_origin_tracking_count'
+_TLS_ORIGIN_TRACKING_DECISION = '_origin_tracking_decision'
 _TLS_ACCESSOR_WRITABLE = '_accessor_writable'
 _TLS_ALLOW_PARTIAL = '_allow_partial'
 _TLS_SEALED = '_sealed'
 _TLS_AUTO_CALL_FUNCTORS = '_allow_auto_call_functors'
+_TLS_TRUSTED_CONSTRUCTION = '_trusted_construction'
+_TLS_INTERNING = '_interning'
+_TLS_DEFERRED_NOTIFICATIONS = '_deferred_notifications'
 
 
 def notify_on_change(enabled: bool = True) -> ContextManager[None]:
@@ -158,7 +197,11 @@ def is_change_notification_enabled() -> bool:
   )
 
 
-def track_origin(enabled: bool = True) -> ContextManager[None]:
+def track_origin(
+    enabled: bool = True,
+    *,
+    every_n: int = 1,
+    types: Optional[Sequence[Type[Any]]] = None) -> ContextManager[None]:
   """Returns a context manager to enable or disable origin tracking.
 
   `track_origin` is thread-safe and can be nested. For example::
@@ -171,21 +214,94 @@ def track_origin(enabled: bool = True) -> ContextManager[None]:
       # c's origin will not be tracked, `c.sym_origin` returns None.
       c = a.clone()
 
+  Origin tracking can be sampled to keep its cost bounded, e.g. when it is
+  left on in production loops::
+
+    # Track the origin of 1 in 100 `A` objects.
+    with pg.track_origin(every_n=100, types=[A]):
+      ...
+
   Args:
     enabled: If True, the origin of symbolic values will be tracked during
       object cloning and retuning from functors under current scope.
+    every_n: Track the origin of 1 in every `every_n` origin events (starting
+      from the first one), which are counted per thread. Constructing a value
+      and cloning a value are origin events, while the values created during
+      a clone share its decision. A value returned from `pg.load` or a functor
+      call reuses the decision made upon its construction in current scope.
+    types: An optional list of symbolic types whose origins will be tracked.
+      If None, the origins of all symbolic values will be tracked.
 
   Returns:
     A context manager for enable or disable origin tracking.
   """
+  if every_n < 1:
+    raise ValueError(f'`every_n` must be positive. Encountered: {every_n}.')
+  if enabled:
+    value = (every_n, tuple(types) if types is not None else None)
+  else:
+    value = None
   return thread_local.thread_local_value_scope(
-      _TLS_ENABLE_ORIGIN_TRACKING, enabled, False
+      _TLS_ENABLE_ORIGIN_TRACKING, value, None
   )
 
 
 def is_tracking_origin() -> bool:
   """Returns if origin of symbolic object are being tracked."""
-  return thread_local.thread_local_get(_TLS_ENABLE_ORIGIN_TRACKING, False)
+  return thread_local.thread_local_get(
+      _TLS_ENABLE_ORIGIN_TRACKING, None) is not None
+
+
+def get_origin_tracking_scope() -> Optional[Any]:
+  """Returns an object identifying current `track_origin` scope if enabled."""
+  return thread_local.thread_local_get(_TLS_ENABLE_ORIGIN_TRACKING, None)
+
+
+def should_track_origin(value: Any) -> bool:
+  """Returns True if the origin of a value should be tracked in current scope.
+
+  Unlike `is_tracking_origin`, it applies the sampling options passed to
+  `track_origin`, thus it shall be called once per value.
+
+  Args:
+    value: The value whose origin is about to be tracked.
+
+  Returns:
+    True if the origin of `value` should be tracked.
+  """
+  options = get_origin_tracking_scope()
+  if options is None:
+    return False
+  every_n, types = options
+  if types is not None and not isinstance(value, types):
+    return False
+  if every_n == 1:
+    return True
+  decision = thread_local.thread_local_get(_TLS_ORIGIN_TRACKING_DECISION, None)
+  if decision is not None:
+    return decision
+  count = thread_local.thread_local_increment(_TLS_ORIGIN_TRACKING_COUNT)
+  return (count - 1) % every_n == 0
+
+
+@contextlib.contextmanager
+def origin_event(value: Any) -> Iterator[bool]:
+  """Returns a context manager for an origin event that creates many values.
+
+  The event is sampled once by `should_track_origin(value)`. Values created
+  within the scope (e.g. the copies made by a deep clone) share its decision
+  instead of consuming the sampling counter of `track_origin` on their own.
+
+  Args:
+    value: The value whose origin is about to be tracked.
+
+  Yields:
+    True if the origin of `value` should be tracked.
+  """
+  track = should_track_origin(value)
+  with thread_local.thread_local_value_scope(
+      _TLS_ORIGIN_TRACKING_DECISION, track, None):
+    yield track
 
 
 def enable_type_check(enabled: bool = True) -> ContextManager[None]:
@@ -374,3 +490,133 @@ def auto_call_functors(enabled: bool = True) -> ContextManager[None]:
 def should_call_functors_during_init() -> Optional[bool]:
   """Return True functors should be automatically called during __init__."""
   return thread_local.thread_local_get(_TLS_AUTO_CALL_FUNCTORS, None)
+
+
+def trusted_construction(enabled: bool = True) -> ContextManager[None]:
+  """Returns a context manager to construct symbolic values without validation.
+
+  Under `trusted_construction`, symbolic objects, dicts and lists bind their
+  schemas without validating their members, except the members that are
+  subject to value transforms or type conversions. Unexpected and missing
+  arguments are still checked, and default values are filled for absent keys.
+  Trust applies only to the constructors called directly in the scope: the
+  `_on_bound` and `_on_init` events of symbolic objects, as well as the values
+  constructed within them, are validated as usual. This is useful for
+  constructing values that are known to be valid, e.g. loading from a
+  checkpoint produced by PyGlove. For example::
+
+    with pg.trusted_construction():
+      a = pg.load(file_path)
+
+  `trusted_construction` is thread-safe and can be nested.
+
+  Args:
+    enabled: If True, skip value validation during construction in current
+      scope. Otherwise, validation will be performed.
+
+  Returns:
+    A context manager for entering/exiting trusted construction.
+  """
+  return thread_local.thread_local_value_scope(
+      _TLS_TRUSTED_CONSTRUCTION, enabled, False
+  )
+
+
+def is_under_trusted_construction() -> bool:
+  """Returns True if symbolic values are constructed without validation."""
+  return thread_local.thread_local_get(_TLS_TRUSTED_CONSTRUCTION, False)
+
+
+def interning(enabled: bool = True) -> ContextManager[None]:
+  """Returns a context manager to share identical immutable symbolic values.
+
+  Under `interning`, a sealed pure-data symbolic value (see
+  :func:`pg.symbolic.intern`) is replaced by its canonical instance, which is
+  shared by all equal values, when it is placed into a symbolic tree or
+  returned from `pg.from_json`. For example::
+
+    class A(pg.Object):
+      # Instances of A are sealed upon creation.
+      allow_symbolic_mutation = False
+      x: int
+
+    with pg.interning():
+      l = pg.List([A(1), A(1)])
+      assert l[0] is l[1]
+      assert pg.from_json(l[0].to_json()) is l[0]
+
+  Since a constructor cannot return an existing instance, the outermost
+  constructed value is not replaced, which can be interned explicitly with
+  :func:`pg.symbolic.intern`.
+
+  `interning` is thread-safe and can be nested.
+
+  Args:
+    enabled: If True, intern sealed pure-data symbolic values upon placement
+      and deserialization in current scope. Otherwise, values are not
+      interned.
+
+  Returns:
+    A context manager for entering/exiting interning.
+  """
+  return thread_local.thread_local_value_scope(
+      _TLS_INTERNING, enabled, False
+  )
+
+
+def is_interning_enabled() -> bool:
+  """Returns True if symbolic values are interned in current scope."""
+  return thread_local.thread_local_get(_TLS_INTERNING, False)
+
+
+@contextlib.contextmanager
+def defer_notifications() -> Iterator[None]:
+  """Returns a context manager that defers change notifications in scope.
+
+  Within the scope, mutations on symbolic values are applied immediately,
+  while their notifications are accumulated and fired once upon exiting the
+  outermost scope. Updates on the same field are merged into one, so each
+  `_on_change` (or `_on_bound`) event is triggered at most once per node,
+  bottom-up, after all mutations are done. For example::
+
+    l = pg.List()
+    with pg.defer_notifications():
+      for i in range(50000):
+        l.append(i)
+    # `l._on_change` is called once here.
+
+  Content-based caches (e.g. the results of `sym_missing`, `sym_nondefault`
+  and `sym_hash`) of the modified nodes and their ancestors are reset upon
+  each mutation, thus they are up to date within the scope. However, states
+  maintained by `_on_change` or `_on_bound` of user classes are not updated
+  until the scope exits.
+
+  Different from :meth:`pyglove.Symbolic.sym_transaction`, which defers the
+  notifications within a sub-tree, `defer_notifications` applies to all
+  symbolic values modified by current thread. Notifications triggered with
+  `notify_parents=False` are not deferred.
+
+  Yields:
+    None.
+  """
+  if get_deferred_notifications() is not None:
+    # Nested scopes are merged into the outermost one.
+    yield
+    return
+
+  pending_updates = dict()
+  thread_local.thread_local_set(_TLS_DEFERRED_NOTIFICATIONS, pending_updates)
+  try:
+    yield
+  finally:
+    # NOTE: mutations are applied immediately, therefore the notifications
+    # are fired even when the scope raises.
+    thread_local.thread_local_del(_TLS_DEFERRED_NOTIFICATIONS)
+    if pending_updates:
+      assert _DEFERRED_NOTIFICATIONS_HANDLER is not None
+      _DEFERRED_NOTIFICATIONS_HANDLER(pending_updates)
+
+
+def get_deferred_notifications() -> Optional[Dict[Any, Any]]:
+  """Returns the pending updates of current `defer_notifications` scope."""
+  return thread_local.thread_local_get(_TLS_DEFERRED_NOTIFICATIONS, None)
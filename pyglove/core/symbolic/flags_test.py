@@ -47,6 +47,17 @@ class GlobalFlagsTest(unittest.TestCase):
     flags.set_origin_stacktrace_limit(5)
     self.assertEqual(flags.get_origin_stacktrace_limit(), 5)
 
+  def test_origin_history_size(self):
+    # Default set to 0.
+    self.assertEqual(flags.get_origin_history_size(), 0)
+
+    flags.set_origin_history_size(5)
+    self.assertEqual(flags.get_origin_history_size(), 5)
+    flags.set_origin_history_size(0)
+
+    with self.assertRaisesRegex(ValueError, '`size` must be non-negative'):
+      flags.set_origin_history_size(-1)
+
   def test_load_handler(self):
     # Default set to None
     self.assertIsNone(flags.get_load_handler())
@@ -80,6 +91,27 @@ class ScopedFlagsTest(unittest.TestCase):
       self.assertTrue(flags.is_tracking_origin())
     self.assertFalse(flags.is_tracking_origin())
 
+  def test_track_origin_with_sampling(self):
+    self.assertFalse(flags.should_track_origin(1))
+    with flags.track_origin():
+      self.assertTrue(flags.should_track_origin(1))
+    with flags.track_origin(every_n=3):
+      self.assertTrue(flags.is_tracking_origin())
+      self.assertEqual(
+          [flags.should_track_origin(1) for _ in range(6)],
+          [True, False, False, True, False, False])
+      # Values within an origin event share its decision.
+      with flags.origin_event(1) as track:
+        self.assertTrue(track)
+        self.assertEqual(
+            [flags.should_track_origin(1) for _ in range(3)], [True] * 3)
+      self.assertFalse(flags.should_track_origin(1))
+    with flags.track_origin(types=[str]):
+      self.assertFalse(flags.should_track_origin(1))
+      self.assertTrue(flags.should_track_origin('a'))
+    with self.assertRaisesRegex(ValueError, '`every_n` must be positive'):
+      flags.track_origin(every_n=0)
+
   def test_notify_on_change(self):
     self.assertTrue(flags.is_change_notification_enabled())
     with flags.notify_on_change(False):
@@ -134,6 +166,15 @@ class ScopedFlagsTest(unittest.TestCase):
       self.assertTrue(flags.should_call_functors_during_init())
     self.assertFalse(flags.should_call_functors_during_init())
 
+  def test_trusted_construction(self):
+    self.assertFalse(flags.is_under_trusted_construction())
+    with flags.trusted_construction(True):
+      self.assertTrue(flags.is_under_trusted_construction())
+      with flags.trusted_construction(False):
+        self.assertFalse(flags.is_under_trusted_construction())
+      self.assertTrue(flags.is_under_trusted_construction())
+    self.assertFalse(flags.is_under_trusted_construction())
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -380,7 +380,8 @@ class Functor(pg_object.Object, object_utils.Functor):
       return_value = signature.return_value.apply(
           return_value, root_path=self.sym_path + 'returns'
       )
-    if flags.is_tracking_origin() and isinstance(return_value, base.Symbolic):
+    if (isinstance(return_value, base.Symbolic)
+        and base._should_track_origin(return_value)):  # pylint: disable=protected-access
       return_value.sym_setorigin(self, 'return')
     return return_value
 
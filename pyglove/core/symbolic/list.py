@@ -192,8 +192,22 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
       if isinstance(items, List):
         items = items.sym_values()
 
-      for item in items:
-        self._set_item_without_permission_check(len(self), item)
+      if flags.is_under_trusted_construction():
+        # NOTE: under `pg.trusted_construction`, the items are added to the
+        # new list without going through `_set_item_without_permission_check`,
+        # which validates each item and records its update.
+        values = []
+        for item in items:
+          if pg_typing.MISSING_VALUE == item:
+            continue
+          if isinstance(item, Insertion):
+            item = item.value
+          values.append(
+              self._formalized_value_without_validation(len(values), item))
+        list.extend(self, values)
+      else:
+        for item in items:
+          self._set_item_without_permission_check(len(self), item)
 
     if value_spec:
       self.use_value_spec(value_spec, allow_partial)
@@ -255,7 +269,9 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
               f'spec: {self._value_spec}. New value spec: {value_spec}.'))
     self._allow_partial = allow_partial
 
-    if flags.is_type_check_enabled():
+    if flags.is_under_trusted_construction():
+      self._use_value_spec_without_validation(value_spec)
+    elif flags.is_type_check_enabled():
       # NOTE(daiyip): self._value_spec will be set in List.custom_apply method
       # called by spec.apply, thus we don't need to set the _value_spec
       # explicitly.
@@ -268,6 +284,20 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
       self._value_spec = value_spec
     return self
 
+  def _use_value_spec_without_validation(
+      self, value_spec: pg_typing.List) -> None:
+    """Binds value spec to current list without validating its elements."""
+    self._value_spec = value_spec
+    element_spec = value_spec.element.value
+    for i, v in enumerate(self.sym_values()):
+      if base._requires_apply(element_spec, v):  # pylint: disable=protected-access
+        # Values that need transform or type conversion are applied as usual.
+        super().__setitem__(i, self._formalized_value(i, v))
+      elif (isinstance(v, (List, base.Symbolic.DictType))
+            and v.value_spec is None
+            and isinstance(element_spec, (pg_typing.Dict, pg_typing.List))):
+        v.use_value_spec(element_spec, self._allow_partial)
+
   @property
   def value_spec(self) -> Optional[pg_typing.List]:
     """Returns value spec of this List."""
@@ -300,8 +330,8 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
     for i in range(len(self)):
       yield (i, super().__getitem__(i))
 
-  def sym_hash(self) -> int:
-    """Symbolically hashing."""
+  def _sym_hash(self) -> int:
+    """Symbolically hashing without memoization."""
     return base.sym_hash(
         (self.__class__, tuple([base.sym_hash(e) for e in self.sym_values()]))
     )
@@ -313,18 +343,24 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
   def _sym_clone(self, deep: bool, memo=None) -> 'List':
     """Override Symbolic._clone."""
     source = []
+    # Values substituted from the memo (see `Symbolic.sym_clone`) are not
+    # validated yet, thus the copy cannot be constructed in trusted mode.
+    trusted = True
     for v in self.sym_values():
       if deep or isinstance(v, base.Symbolic):
-        v = base.clone(v, deep, memo)
+        if memo and id(v) in memo and isinstance(v, base.Symbolic):
+          trusted = False
+        v = base._clone_child(v, deep, memo)  # pylint: disable=protected-access
       source.append(v)
-    return List(
-        source,
-        value_spec=self._value_spec,
-        allow_partial=self._allow_partial,
-        accessor_writable=self._accessor_writable,
-        # NOTE(daiyip): parent and root_path are reset to empty
-        # for copy object.
-        root_path=None)
+    with flags.trusted_construction(trusted):
+      return List(
+          source,
+          value_spec=self._value_spec,
+          allow_partial=self._allow_partial,
+          accessor_writable=self._accessor_writable,
+          # NOTE(daiyip): parent and root_path are reset to empty
+          # for copy object.
+          root_path=None)
 
   def _sym_missing(self) -> Dict[Any, Any]:
     """Returns missing fields."""
@@ -346,8 +382,9 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
     # from insertions and deletions.
     path_value_pairs = sorted(
         path_value_pairs.items(), key=lambda x: x[0], reverse=True)
+    resolved_nodes = [self, {}]
     for k, v in path_value_pairs:
-      update = self._set_item_of_current_tree(k, v)
+      update = self._set_item_of_current_tree(k, v, resolved_nodes)
       if update is not None:
         updates.append(update)
     # Reverse the updates so the update is from the smallest number to
@@ -369,7 +406,7 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
 
   def seal(self, sealed: bool = True) -> 'List':
     """Seal or unseal current object from further modification."""
-    if self.is_sealed == sealed:
+    if self.is_sealed == sealed or self._sym_interned:
       return self
     for elem in self.sym_values():
       if isinstance(elem, base.Symbolic):
@@ -381,10 +418,14 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
       self,
       old_path: object_utils.KeyPath,
       new_path: object_utils.KeyPath) -> None:
-    """Update children paths according to root_path of current node."""
-    del old_path
+    """Notifies path changes to the subscribers within current sub-tree."""
     for idx, item in self.sym_items():
-      if isinstance(item, base.TopologyAware):
+      if isinstance(item, base.Symbolic):
+        if item._sym_num_path_subscribers and item._sym_path_key is not None:  # pylint: disable=protected-access
+          item._update_children_paths(  # pylint: disable=protected-access
+              object_utils.KeyPath(idx, old_path),
+              object_utils.KeyPath(idx, new_path))
+      elif isinstance(item, base.TopologyAware):
         item.sym_setpath(object_utils.KeyPath(idx, new_path))
 
   def _set_item_without_permission_check(  # pytype: disable=signature-mismatch  # overriding-parameter-type-checks
@@ -411,13 +452,17 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
         return None
 
     new_value = self._formalized_value(index, value)
+    self._invalidate_sym_hash()
     if index < len(self):
       if should_insert:
         list.insert(self, index, new_value)
+        self._update_children_keys()
       else:
         list.__setitem__(self, index, new_value)
         # Detach old value from object tree.
-        if isinstance(old_value, base.TopologyAware):
+        if isinstance(old_value, base.Symbolic):
+          old_value._sym_setlocation(None, None)  # pylint: disable=protected-access
+        elif isinstance(old_value, base.TopologyAware):
           old_value.sym_setparent(None)
     else:
       super().append(new_value)
@@ -459,15 +504,23 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
     if keys_to_remove:
       for i in reversed(keys_to_remove):
         list.__delitem__(self, i)
+      self._invalidate_sym_hash()
 
-    # Update paths for children.
-    for idx, item in self.sym_items():
-      if isinstance(item, base.TopologyAware) and item.sym_path.key != idx:
-        item.sym_setpath(object_utils.KeyPath(idx, self.sym_path))
-
+    self._update_children_keys()
     if self._onchange_callback is not None:
       self._onchange_callback(field_updates)
 
+  def _update_children_keys(self) -> None:
+    """Updates the keys of children after their positions are changed."""
+    # NOTE: the paths of symbolic children are computed lazily from
+    # their keys, thus this is O(len(self)) regardless of the sub-tree sizes.
+    for idx, item in self.sym_items():
+      if isinstance(item, base.Symbolic):
+        if item._sym_path_key != idx:  # pylint: disable=protected-access
+          item._sym_setlocation(self, idx)  # pylint: disable=protected-access
+      elif isinstance(item, base.TopologyAware) and item.sym_path.key != idx:
+        item.sym_setpath(object_utils.KeyPath(idx, self.sym_path))
+
   def _parse_slice(self, index: slice) -> Tuple[int, int, int]:
     start = index.start if index.start is not None else 0
     start = max(-len(self), start)
@@ -502,6 +555,27 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
     """Customizes pickle.load."""
     self.__init__(state['value'], **state['kwargs'])
 
+  def _sym_reduce_state(self) -> Optional[Tuple[Any, ...]]:
+    """Returns the symbolic items and init kwargs for pickling."""
+    cls = self.__class__
+    if (cls.__init__ is not List.__init__
+        or cls.__getstate__ is not List.__getstate__
+        or cls.__setstate__ is not List.__setstate__):
+      return None
+    return (tuple(self.sym_values()), self._init_kwargs())
+
+  @classmethod
+  def _sym_restore(
+      cls, items: Tuple[Any, ...], kwargs: typing.Dict[str, Any]) -> 'List':
+    """Restores a list from its items without validation."""
+    kwargs = dict(kwargs)
+    sealed = kwargs.pop('sealed', False)
+    value = cls(**kwargs)
+    for i, v in enumerate(items):
+      list.append(value, value._relocate_if_symbolic(i, v))  # pylint: disable=protected-access
+    value.seal(sealed)
+    return value
+
   def __getitem__(self, index) -> Any:
     """Gets the item at a given position."""
     if isinstance(index, numbers.Integral):
@@ -589,6 +663,8 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
 
     old_value = self.sym_getattr(index)
     super().__delitem__(index)
+    self._update_children_keys()
+    self._invalidate_sym_hash()
 
     if flags.is_change_notification_enabled():
       self._notify_field_updates([
@@ -708,18 +784,23 @@ class List(list, base.Symbolic, pg_typing.CustomTyping):
       raise ValueError(
           f'List cannot be cleared: min size is {self._value_spec.min_size}.')
     super().clear()
+    self._invalidate_sym_hash()
 
   def sort(self, *, key=None, reverse=False) -> None:
     """Sorts the items of the list in place.."""
     if base.treats_as_sealed(self):
       raise base.WritePermissionError('Cannot sort a sealed List.')
     super().sort(key=key, reverse=reverse)
+    self._update_children_keys()
+    self._invalidate_sym_hash()
 
   def reverse(self) -> None:
     """Reverse the elements of the list in place."""
     if base.treats_as_sealed(self):
       raise base.WritePermissionError('Cannot reverse a sealed List.')
     super().reverse()
+    self._update_children_keys()
+    self._invalidate_sym_hash()
 
   def custom_apply(
       self,
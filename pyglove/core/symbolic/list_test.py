@@ -17,6 +17,7 @@ import copy
 import inspect
 import io
 import pickle
+import sys
 from typing import Any
 import unittest
 
@@ -70,6 +71,33 @@ class ListTest(unittest.TestCase):
         TypeError, '.* must be a `pg.typing.List` object.'):
       List(value_spec=pg_typing.Int())
 
+  def test_init_under_trusted_construction(self):
+    vs = pg_typing.List(pg_typing.Float(min_value=0.0))
+    x = List([1])
+    with flags.trusted_construction():
+      # Values are not validated, but type conversions are applied.
+      sl = List([-1.0, 2, pg_typing.MISSING_VALUE, Insertion(3.0)],
+                value_spec=vs)
+      self.assertEqual(sl, [-1.0, 2.0, 3.0])
+      self.assertIsInstance(sl[1], float)
+
+      # Values of schema-less lists are formalized and relocated.
+      sl = List([{'a': [1]}, x, x])
+      self.assertIsInstance(sl[0], Dict)
+      self.assertIsInstance(sl[0].a, List)
+      self.assertEqual(sl[0].a.sym_path, '[0].a')
+      self.assertIs(sl[1], x)
+      self.assertEqual(x.sym_path, '[1]')
+      # A value that is already placed is copied.
+      self.assertIsNot(sl[2], x)
+      self.assertEqual(sl[2].sym_path, '[2]')
+
+    # Value spec bound under trusted construction takes effect afterwards.
+    with flags.trusted_construction():
+      sl = List([-1.0], value_spec=vs)
+    with self.assertRaisesRegex(ValueError, 'Value -2.0 is out of range'):
+      sl.append(-2.0)
+
   def test_partial(self):
     spec = pg_typing.List(pg_typing.Dict([
         ('a', pg_typing.Int()),
@@ -1070,6 +1098,32 @@ class ListTest(unittest.TestCase):
     self.assertEqual(hash(List([B(1)])), hash(List([B(1)])))
     self.assertNotEqual(hash(List([B(1)])), hash(List([B(2)])))
 
+  def test_sym_hash_memoization(self):
+    sl = List([Dict(x=1), 2, 3])
+    h = sl.sym_hash()
+    self.assertEqual(sl.sym_hash(), h)
+
+    sl[0].x = 2
+    self.assertEqual(sl.sym_hash(), List([Dict(x=2), 2, 3]).sym_hash())
+
+    sl.append(4)
+    self.assertEqual(sl.sym_hash(), List([Dict(x=2), 2, 3, 4]).sym_hash())
+
+    sl.insert(1, 0)
+    self.assertEqual(sl.sym_hash(), List([Dict(x=2), 0, 2, 3, 4]).sym_hash())
+
+    del sl[0]
+    self.assertEqual(sl.sym_hash(), List([0, 2, 3, 4]).sym_hash())
+
+    sl.reverse()
+    self.assertEqual(sl.sym_hash(), List([4, 3, 2, 0]).sym_hash())
+
+    sl.sort()
+    self.assertEqual(sl.sym_hash(), List([0, 2, 3, 4]).sym_hash())
+
+    sl.clear()
+    self.assertEqual(sl.sym_hash(), List().sym_hash())
+
   def test_sym_parent(self):
     sl = List([[0], dict(x=1)])
     self.assertIsNone(sl.sym_parent)
@@ -1107,6 +1161,58 @@ class ListTest(unittest.TestCase):
     self.assertEqual(sl[1].sym_path, 'a[1]')
     self.assertEqual(sl[1][0].b.sym_path, 'a[1][0].b')
 
+  def test_sym_path_upon_reordering(self):
+    sl = List([dict(x=dict(y=i)) for i in range(3)])
+    sl.reverse()
+    self.assertEqual([v.x.sym_path for v in sl], ['[0].x', '[1].x', '[2].x'])
+    self.assertEqual([v.x.y for v in sl], [2, 1, 0])
+
+    sl.sort(key=lambda v: v.x.y)
+    self.assertEqual([v.x.sym_path for v in sl], ['[0].x', '[1].x', '[2].x'])
+    self.assertEqual([v.x.y for v in sl], [0, 1, 2])
+
+    sl.insert(0, dict(x=dict(y=3)))
+    self.assertEqual(
+        [v.x.sym_path for v in sl], ['[0].x', '[1].x', '[2].x', '[3].x'])
+
+    del sl[1]
+    self.assertEqual([v.x.sym_path for v in sl], ['[0].x', '[1].x', '[2].x'])
+
+    with flags.notify_on_change(False):
+      sl.insert(0, dict(x=dict(y=4)))
+      del sl[2]
+    self.assertEqual([v.x.sym_path for v in sl], ['[0].x', '[1].x', '[2].x'])
+    self.assertEqual([v.x.y for v in sl], [4, 3, 2])
+
+    d = Dict(a=sl)
+    self.assertEqual(d.a[2].x.sym_path, 'a[2].x')
+
+  def test_sym_path_invalidation(self):
+    sl = List([dict(x=dict(y=i)) for i in range(3)])
+    self.assertEqual([v.x.sym_path for v in sl], ['[0].x', '[1].x', '[2].x'])
+
+    # Relocating a node only invalidates the cached paths of its sub-tree.
+    sl[1].z = dict(y=3)
+    self.assertIsNotNone(sl[0].x._sym_path_cache)
+    self.assertIsNotNone(sl[2].x._sym_path_cache)
+    self.assertEqual(sl[1].z.sym_path, '[1].z')
+
+    del sl[0]
+    self.assertIsNone(sl[0].x._sym_path_cache)
+    self.assertEqual([v.x.sym_path for v in sl], ['[0].x', '[1].x'])
+    self.assertEqual(sl[0].z.sym_path, '[0].z')
+
+  def test_sym_path_of_deep_tree(self):
+    depth = sys.getrecursionlimit() * 2
+    leaf = List()
+    root = leaf
+    for _ in range(depth):
+      root = List([root])
+    self.assertEqual(leaf.sym_path.depth, depth)
+
+    root.sym_setpath(object_utils.KeyPath('a'))
+    self.assertEqual(leaf.sym_path.keys[0], 'a')
+
   def test_accessor_writable(self):
     sl = List([0], accessor_writable=False)
     with self.assertRaisesRegex(
@@ -14,10 +14,12 @@
 """Symbolic object."""
 
 import abc
+import copy
 import functools
 import inspect
+import types
 import typing
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from pyglove.core import object_utils
 from pyglove.core import typing as pg_typing
@@ -26,6 +28,75 @@ from pyglove.core.symbolic import dict as pg_dict
 from pyglove.core.symbolic import flags
 
 
+# Sentinel for arguments that are not specified in specialized `__init__`.
+_UNSET = object()
+
+
+class _LazyInit:
+  """Placeholder for the `__init__` generated from the schema of a class.
+
+  Generating `__init__` is a major cost of defining a symbolic class, thus it
+  is deferred until the first access to `cls.__init__`, which happens upon the
+  first instantiation or reflection (e.g. `inspect.signature(cls)`).
+  """
+
+  __sym_generated_init__ = True
+  __explicit_override__ = True
+
+  def __init__(self, owner: 'ObjectMeta'):
+    self._owner = owner
+
+  def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:  # pylint: disable=g-bare-generic
+    init = self._owner.__dict__.get('__init__')
+    if init is self:
+      init = self._owner._generate_init()  # pytype: disable=attribute-error
+      setattr(self._owner, '__init__', init)
+    return init.__get__(instance, owner)
+
+
+def _raw_init(cls: type) -> Any:  # pylint: disable=g-bare-generic
+  """Returns `__init__` of a class without materializing a `_LazyInit`."""
+  for c in cls.__mro__:
+    init = c.__dict__.get('__init__')
+    if init is not None:
+      return init
+  assert False, 'Should never happen.'
+
+
+def _has_managed_init(cls: type) -> bool:  # pylint: disable=g-bare-generic
+  """Returns True if `__init__` of a class is not overridden by the user."""
+  init = _raw_init(cls)
+  return (init is Object.__dict__['__init__']
+          or hasattr(init, '__sym_generated_init__'))
+
+
+def _init_only_maps_fields(cls: type) -> bool:  # pylint: disable=g-bare-generic
+  """Returns True if `__init__` of a class only maps arguments to fields."""
+  fast_pickle = cls._sym_fast_pickle  # pytype: disable=attribute-error
+  if fast_pickle is None:
+    return _has_managed_init(cls)
+  return fast_pickle
+
+
+def _trusted_field_value(
+    field: pg_typing.Field,
+    value: Any,
+    allow_partial: bool,
+    transform_fn: Any,
+    key: str,
+    root_path: Optional[object_utils.KeyPath]) -> Any:
+  """Returns the value of a field under `pg.trusted_construction`."""
+  if base._requires_apply(field.value, value):  # pylint: disable=protected-access
+    return field.apply(
+        value, allow_partial, transform_fn,
+        object_utils.KeyPath(key, root_path))
+  if (isinstance(value, (base.Symbolic.DictType, base.Symbolic.ListType))
+      and value.value_spec is None
+      and isinstance(field.value, (pg_typing.Dict, pg_typing.List))):
+    value.use_value_spec(field.value, allow_partial)
+  return value
+
+
 class ObjectMeta(abc.ABCMeta):
   """Meta class for pg.Object."""
 
@@ -287,6 +358,29 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
   # Automatically infer schema during subclass creation time.
   auto_schema = True
 
+  # If True, the field values of an object will be stored in a tuple in the
+  # order of the schema, instead of in a symbolic dict. The symbolic dict will
+  # be materialized upon first use that is not read-only (e.g. `rebind`),
+  # which reduces the memory footprint of objects that are created in large
+  # numbers and rarely modified. Only applicable to classes whose fields all
+  # have constant keys.
+  use_compact_storage = False
+
+  # Field index (key to position in schema order) for compact storage, which
+  # is None when the schema has non-constant keys.
+  _sym_compact_field_index = None
+
+  # Whether instances can be unpickled or cloned from their validated field
+  # values without calling `__init__`. If None, it is True when `__init__` is
+  # not overridden by the user. A subclass with a custom `__init__` may set it
+  # to True, if its `__init__` only maps arguments to field values, and the
+  # states beyond its symbolic fields are set up in `_on_init`.
+  _sym_fast_pickle = None
+
+  # Per-instance compact storage: the field index and the field values.
+  _sym_compact_keys = None
+  _sym_compact_values = None
+
   #
   # Customizable class behaviors.
   #
@@ -309,7 +403,7 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
       user_cls: The source class that calls this class method.
     """
     object_utils.ensure_explicit_method_override(
-        cls.__init__,
+        _raw_init(cls),
         (
             '`pg.Object.__init__` is a PyGlove managed method. For setting up '
             'the class initialization logic, please override `_on_bound()` or '
@@ -449,6 +543,15 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
     # Finalize init_arg_list baesd on schema.
     cls._finalize_init_arg_list()
 
+    # Update the field index for compact storage.
+    field_index = {}
+    for i, key in enumerate(cls.__schema__.fields.keys()):
+      if not isinstance(key, pg_typing.ConstStrKey):
+        field_index = None
+        break
+      field_index[str(key)] = i
+    cls._sym_compact_field_index = field_index
+
     # Update all schema-based signatures.
     cls._update_signatures_based_on_schema()
 
@@ -459,33 +562,198 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
   @classmethod
   def _update_signatures_based_on_schema(cls):
     """Customizable trait: updates method signatures upon schema change."""
-    if cls.__init__ is not Object.__init__ and not hasattr(
-        cls.__init__, '__sym_generated_init__'
+    init = _raw_init(cls)
+    if init is not Object.__dict__['__init__'] and not hasattr(
+        init, '__sym_generated_init__'
     ):
       # We only generate `__init__` from pg.Object subclass which does not
       # override the `__init__` method.
       # Functor and ClassWrapper override their `__init__` methods, therefore
       # they need to synchronize the __init__ signature by themselves.
       return
+    setattr(cls, '__init__', _LazyInit(cls))
+
+  @classmethod
+  def _generate_init(cls) -> types.FunctionType:
+    """Generates `__init__` with the signature based on the schema."""
     signature = pg_typing.Signature.from_schema(
         cls.__schema__, cls.__module__, '__init__', f'{cls.__name__}.__init__'
     )
     pseudo_init = signature.make_function(['pass'])
 
-    # Create a new `__init__` that passes through all the arguments to
-    # in `pg.Object.__init__`. This is needed for each class to use different
-    # signature.
-    @object_utils.explicit_method_override
-    @functools.wraps(pseudo_init)
-    def _init(self, *args, **kwargs):
-      # We pass through the arguments to `Object.__init__` instead of
-      # `super()` since the parent class uses a generated `__init__` will
-      # be delegated to `Object.__init__` eventually. Therefore, directly
-      # calling `Object.__init__` is equivalent to calling `super().__init__`.
-      Object.__init__(self, *args, **kwargs)
-
+    # Create a new `__init__` that is specialized for the schema, which
+    # delegates to `pg.Object.__init__` on cases that it does not handle.
+    # This is needed for each class to use different signature.
+    init_fn = cls._make_specialized_init()
+    if init_fn is None:
+      def init_fn(self, *args, **kwargs):
+        # We pass through the arguments to `Object.__init__` instead of
+        # `super()` since the parent class uses a generated `__init__` will
+        # be delegated to `Object.__init__` eventually. Therefore, directly
+        # calling `Object.__init__` is equivalent to calling
+        # `super().__init__`.
+        Object.__init__(self, *args, **kwargs)
+
+    _init = object_utils.explicit_method_override(
+        functools.wraps(pseudo_init)(init_fn))
     setattr(_init, '__sym_generated_init__', True)
-    setattr(cls, '__init__', _init)
+    return _init
+
+  @classmethod
+  def _make_specialized_init(cls) -> Optional[types.FunctionType]:
+    """Generates an `__init__` that is specialized for current schema.
+
+    The generated `__init__` maps the arguments to fields and validates each
+    field with unrolled code, which saves the generic interpretation of the
+    schema in `Object.__init__`. It only handles the common cases, namely
+    arguments that match the schema under default flags, and delegates to
+    `Object.__init__` for the rest (e.g. to report errors on arguments).
+
+    Returns:
+      The generated `__init__` function, or None if the schema has non-const
+      keys, variable positional arguments or frozen positional arguments,
+      which are not specialized.
+    """
+    init_arg_list = cls.init_arg_list
+    if (cls._sym_compact_field_index is None
+        or (init_arg_list and init_arg_list[-1].startswith('*'))
+        or any(cls.__schema__.get_field(arg).frozen for arg in init_arg_list)):
+      return None
+
+    init_args = (
+        'self, *args, allow_partial=False, sealed=None, root_path=None, '
+        'explicit_init=False, **kwargs')
+    generic_init = (
+        '_Object.__init__(self, *args, allow_partial=allow_partial, '
+        'sealed=sealed, root_path=root_path, explicit_init=explicit_init, '
+        '**kwargs)')
+    exec_locals = dict(
+        _Object=Object,
+        _schema=cls.__schema__,
+        _UNSET=_UNSET,
+        _MISSING=object_utils.MISSING_VALUE,
+        _MissingValue=object_utils.MissingValue,
+        _Symbolic=base.Symbolic,
+        _KeyPath=object_utils.KeyPath,
+        _JSON_CONTAINER_TYPES=(list, tuple, dict),
+        _deepcopy=copy.deepcopy,
+        _from_json=base.from_json,
+        _transform_fns=(
+            base.symbolic_transform_fn(False),
+            base.symbolic_transform_fn(True)),
+        _is_under_trusted_construction=flags.is_under_trusted_construction,
+        _trusted_construction=flags.trusted_construction,
+        _trusted_field_value=_trusted_field_value,
+        _is_type_check_enabled=flags.is_type_check_enabled,
+        _is_under_partial_scope=flags.is_under_partial_scope,
+    )
+    fields = list(cls.__schema__.fields.values())
+    arg_index = {name: i for i, name in enumerate(init_arg_list)}
+    names = [f'_v{i}' for i in range(len(fields))]
+
+    # Map arguments to fields.
+    body = [
+        'num_args = len(args)',
+        'num_kwargs = 0',
+        f'if num_args > {len(init_arg_list)}:',
+        f'  return {generic_init}',
+    ]
+    for i, field in enumerate(fields):
+      key = str(field.key)
+      exec_locals[f'_f{i}'] = field
+      if field.frozen:
+        body.append(f'{names[i]} = _UNSET')
+        continue
+      if key in arg_index:
+        body.extend([
+            f'if num_args > {arg_index[key]}:',
+            f'  {names[i]} = args[{arg_index[key]}]',
+            'else:',
+        ])
+        indent = '  '
+      else:
+        indent = ''
+      body.extend([
+          f'{indent}{names[i]} = kwargs.get({key!r}, _UNSET)',
+          f'{indent}if {names[i]} is not _UNSET:',
+          f'{indent}  num_kwargs += 1',
+      ])
+
+    # Delegate to `Object.__init__` on unexpected or duplicated keyword
+    # arguments, missing required arguments, a different schema and
+    # non-default flags.
+    required = [names[i] for i, f in enumerate(fields)
+                if not f.value.has_default]
+    body.extend([
+        'cls = self.__class__',
+        'partial = _is_under_partial_scope()',
+        'if partial is None:',
+        '  partial = allow_partial',
+        'if (len(kwargs) != num_kwargs',
+        # NOTE: the generated `__init__` could be called from a
+        # subclass with a different schema, e.g. via `super().__init__`.
+        '    or cls.__schema__ is not _schema',
+        '    or allow_partial.__class__ is not bool',
+        *[f'    or ({n} is _UNSET and not partial)' for n in required],
+        *[f'    or isinstance({n}, _MissingValue)' for n in names],
+        '    or not _is_type_check_enabled()):',
+        f'  return {generic_init}',
+        'if sealed is None:',
+        '  sealed = not cls.allow_symbolic_mutation',
+        'super(_Object, self).__init__(',
+        '    allow_partial=allow_partial,',
+        '    accessor_writable=cls.allow_symbolic_assignment,',
+        '    sealed=sealed,',
+        '    root_path=root_path,',
+        '    init_super=not explicit_init)',
+        'transform_fn = _transform_fns[allow_partial]',
+        'trusted = _is_under_trusted_construction()',
+    ])
+
+    # Validate and transform field values.
+    for i, field in enumerate(fields):
+      key, v = str(field.key), names[i]
+      apply_value = (
+          f'_f{i}.apply({{}}, partial, transform_fn, _KeyPath({key!r}, '
+          'root_path))')
+      body.append(f'if {v} is _UNSET:')
+      default = field.default_value
+      if (field.value.has_default
+          and field.value.transform is None
+          and default.__class__ in (bool, int, float, str, type(None))):
+        # NOTE: immutable default values are already validated upon
+        # schema creation, thus we use them as is.
+        exec_locals[f'_d{i}'] = default
+        body.append(f'  {v} = _d{i}')
+      elif field.value.has_default:
+        exec_locals[f'_d{i}'] = default
+        body.append(f'  {v} = ' + apply_value.format(f'_deepcopy(_d{i})'))
+      else:
+        body.append(f'  {v} = ' + apply_value.format('_MISSING'))
+      body.extend([
+          'else:',
+          f'  if (isinstance({v}, _JSON_CONTAINER_TYPES)',
+          f'      and not isinstance({v}, _Symbolic)):',
+          f'    {v} = _from_json({v}, allow_partial=partial, '
+          f'root_path=_KeyPath({key!r}, root_path))',
+          '  if trusted:',
+          f'    {v} = _trusted_field_value(_f{i}, {v}, partial, transform_fn, '
+          f'{key!r}, root_path)',
+          '  else:',
+          f'    {v} = ' + apply_value.format(v),
+      ])
+    body.extend([
+        f'self._sym_init_attributes(({"".join(n + ", " for n in names)}), '
+        'allow_partial, sealed)',
+        'if trusted:',
+        '  with _trusted_construction(False):',
+        '    self._on_init()',
+        'else:',
+        '  self._on_init()',
+        'self.seal(sealed)',
+    ])
+    return object_utils.make_function(
+        '__init__', [init_args], body, exec_locals=exec_locals)
 
   @classmethod
   def _generate_sym_attributes(cls):
@@ -692,25 +960,39 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
             f'{self.__class__.__name__}.__init__() missing {len(missing_args)} '
             f'required {arg_phrase}: {keys_str}.')
 
-    self._set_raw_attr(
-        '_sym_attributes',
-        pg_dict.Dict(
-            field_args,
-            value_spec=self.__class__.sym_fields,
-            allow_partial=allow_partial,
-            sealed=sealed,
-            # NOTE(daiyip): Accessor writable is honored by
-            # `Object.__setattr__` thus we could always make `_sym_attributes`
-            # accessor writable. This prevents a child object's attribute access
-            # from being changed when it's attached to a parent whose symbolic
-            # attributes could not be directly written.
-            accessor_writable=True,
-            root_path=root_path,
-            as_object_attributes_container=True,
-        ),
+    sym_attributes = pg_dict.Dict(
+        field_args,
+        value_spec=self.__class__.sym_fields,
+        allow_partial=allow_partial,
+        sealed=sealed,
+        # NOTE(daiyip): Accessor writable is honored by
+        # `Object.__setattr__` thus we could always make `_sym_attributes`
+        # accessor writable. This prevents a child object's attribute access
+        # from being changed when it's attached to a parent whose symbolic
+        # attributes could not be directly written.
+        accessor_writable=True,
+        root_path=root_path,
+        as_object_attributes_container=True,
     )
-    self._sym_attributes.sym_setparent(self)
-    self._on_init()
+    sym_attributes.sym_setparent(self)
+    field_index = self.__class__._sym_compact_field_index
+    if (self.__class__.use_compact_storage
+        and field_index is not None
+        and len(field_index) == len(sym_attributes)
+        and all(a == b for a, b in zip(field_index, sym_attributes.keys()))):
+      self._set_raw_attr('_sym_compact_keys', field_index)
+      self._set_raw_attr(
+          '_sym_compact_values', tuple(sym_attributes.sym_values()))
+    else:
+      self._set_raw_attr('_sym_attributes', sym_attributes)
+
+    if flags.is_under_trusted_construction():
+      # NOTE: trust only applies to binding the arguments above, the event
+      # handlers and the values they construct are validated as usual.
+      with flags.trusted_construction(False):
+        self._on_init()
+    else:
+      self._on_init()
     self.seal(sealed)
 
   #
@@ -785,6 +1067,8 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
     if key == '_sym_attributes':
       raise ValueError(
           f'{self.__class__.__name__}.__init__ should call `super().__init__`.')
+    if self._sym_compact_values is not None:
+      return isinstance(key, str) and key in self._sym_compact_keys
     return (
         isinstance(key, str)
         and not key.startswith('_')
@@ -795,46 +1079,143 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
       self, key: Union[str, int]
       ) -> Optional[pg_typing.Field]:
     """Returns the field definition for a symbolic attribute."""
+    if self._sym_compact_values is not None:
+      return self.__class__.__schema__.get_field(key)
     return self._sym_attributes.sym_attr_field(key)
 
   def sym_keys(self) -> Iterator[str]:
     """Iterates the keys of symbolic attributes."""
+    if self._sym_compact_values is not None:
+      return iter(self._sym_compact_keys)
     return self._sym_attributes.sym_keys()
 
   def sym_values(self):
     """Iterates the values of symbolic attributes."""
+    if self._sym_compact_values is not None:
+      return iter(self._sym_compact_values)
     return self._sym_attributes.sym_values()
 
   def sym_items(self):
     """Iterates the (key, value) pairs of symbolic attributes."""
+    if self._sym_compact_values is not None:
+      return zip(self._sym_compact_keys, self._sym_compact_values)
     return self._sym_attributes.sym_items()
 
   def sym_eq(self, other: Any) -> bool:
     """Tests symbolic equality."""
-    return self is other or (
-        type(self) is type(other) and base.eq(
-            self._sym_attributes, other._sym_attributes))   # pylint: disable=protected-access
+    if self is other:
+      return True
+    if type(self) is not type(other):
+      return False
+    if (self._sym_compact_values is None
+        and other._sym_compact_values is None):  # pylint: disable=protected-access
+      return base.eq(self._sym_attributes, other._sym_attributes)   # pylint: disable=protected-access
+    if set(self.sym_keys()) != set(other.sym_keys()):
+      return False
+    for k, v in self.sym_items():
+      if base.ne(v, other.sym_getattr(k)):
+        return False
+    return True
 
   def sym_lt(self, other: Any) -> bool:
     """Tests symbolic less-than."""
     if type(self) is not type(other):
       return base.lt(self, other)
-    return base.lt(self._sym_attributes, other._sym_attributes)  # pylint: disable=protected-access
+    return base.lt(self._sym_attributes_view(), other._sym_attributes_view())  # pylint: disable=protected-access
+
+  def _sym_hash(self) -> int:
+    """Symbolically hashing without memoization."""
+    if self._sym_compact_values is not None:
+      # NOTE: this is the same as the hash of the materialized
+      # attributes container.
+      attributes_hash = base.sym_hash(
+          (pg_dict.Dict,
+           tuple([(k, base.sym_hash(v)) for k, v in self.sym_items()
+                  if v != pg_typing.MISSING_VALUE])))
+    else:
+      attributes_hash = base.sym_hash(self._sym_attributes)
+    return base.sym_hash((self.__class__, attributes_hash))
 
-  def sym_hash(self) -> int:
-    """Symbolically hashing."""
-    return base.sym_hash((self.__class__, base.sym_hash(self._sym_attributes)))
+  def _sym_attributes_view(self) -> pg_dict.Dict:
+    """Returns the attributes container for read-only access.
+
+    Unlike `_sym_attributes`, this does not materialize the container of an
+    object with compact storage, but returns a transient one instead.
+
+    Returns:
+      A symbolic dict of the symbolic attributes.
+    """
+    if self._sym_compact_values is not None:
+      return self._sym_new_attributes_container()
+    return self._sym_attributes
+
+  def _sym_init_attributes(
+      self, values: Sequence[Any], allow_partial: bool, sealed: bool) -> None:
+    """Sets validated field values in schema order from `__init__`."""
+    keys = self.__class__._sym_compact_field_index
+    values = tuple([self._relocate_if_symbolic(k, v)
+                    for k, v in zip(keys, values)])
+    if sealed:
+      # NOTE: current object is already marked as sealed, thus we seal
+      # the children here since `seal` will not propagate to them.
+      for v in values:
+        if isinstance(v, base.Symbolic):
+          v.seal()
+    if self.__class__.use_compact_storage:
+      self._set_raw_attr('_sym_compact_keys', keys)
+      self._set_raw_attr('_sym_compact_values', values)
+    else:
+      self._set_raw_attr(
+          '_sym_attributes',
+          self._sym_new_attributes_container(zip(keys, values), allow_partial))
 
-  def sym_setparent(self, parent: base.Symbolic):
-    """Sets the parent of current node in the symbolic tree."""
+  def _sym_new_attributes_container(
+      self,
+      items: Optional[Iterable[Tuple[str, Any]]] = None,
+      allow_partial: Optional[bool] = None) -> pg_dict.Dict:
+    """Creates the attributes container from validated field values."""
+    container = pg_dict.Dict(
+        allow_partial=(
+            self._allow_partial if allow_partial is None else allow_partial),
+        accessor_writable=True,
+        as_object_attributes_container=True)
+    # NOTE: field values are validated and are already placed under
+    # current object, thus we add them to the container without relocation.
+    for k, v in (self.sym_items() if items is None else items):
+      dict.__setitem__(container, k, v)
+    container._set_raw_attr('_value_spec', self.__class__.sym_fields)  # pylint: disable=protected-access
+    container._set_raw_attr('_sealed', self._sealed)  # pylint: disable=protected-access
+    container._set_raw_attr('_sym_parent', self)  # pylint: disable=protected-access
+    return container
+
+  @functools.cached_property
+  def _sym_attributes(self) -> pg_dict.Dict:
+    """Materializes the attributes container from compact storage."""
+    # NOTE: the attributes container is set as an instance attribute
+    # by `__init__` unless compact storage is used, in which case it will be
+    # materialized here upon first access.
+    if self._sym_compact_values is None:
+      raise AttributeError('_sym_attributes')
+    container = self._sym_new_attributes_container()
+    self._set_raw_attr('_sym_compact_keys', None)
+    self._set_raw_attr('_sym_compact_values', None)
+    return container
+
+  def _sym_setlocation(
+      self, parent: Optional[base.Symbolic], key: Optional[str]) -> None:
+    """Places current node under a parent with a key."""
+    if self._sym_interned:
+      return
     old_parent = self.sym_parent
-    super().sym_setparent(parent)
+    super()._sym_setlocation(parent, key)
     if old_parent is not parent:
       self._on_parent_change(old_parent, parent)
 
   def _sym_getattr(  # pytype: disable=signature-mismatch  # overriding-parameter-type-checks
       self, key: str) -> Any:
     """Get symbolic field by key."""
+    if self._sym_compact_values is not None:
+      return self._sym_compact_values[self._sym_compact_keys[key]]
     return self._sym_attributes.sym_getattr(key)
 
   def _sym_rebind(
@@ -844,18 +1225,47 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
     if base.treats_as_sealed(self):
       raise base.WritePermissionError(
           f'Cannot rebind a sealed {self.__class__.__name__}.')
-    return self._sym_attributes._sym_rebind(path_value_pairs)  # pylint: disable=protected-access
+    if self._sym_compact_values is None:
+      return self._sym_attributes._sym_rebind(path_value_pairs)  # pylint: disable=protected-access
+
+    # NOTE: with compact storage, the attributes container will be
+    # materialized only when the fields of current object are updated.
+    updates = []
+    resolved_nodes = [self, {}]
+    for k, v in path_value_pairs.items():
+      update = self._set_item_of_current_tree(k, v, resolved_nodes)
+      if update is not None:
+        updates.append(update)
+    return updates
 
   def _sym_clone(self, deep: bool, memo: Any = None) -> 'Object':
     """Copy flags."""
     kwargs = dict()
-    for k, v in self._sym_attributes.sym_items():
+    # Values substituted from the memo (see `Symbolic.sym_clone`) are not
+    # validated yet, thus the copy cannot be constructed in trusted mode.
+    trusted = True
+    for k, v in self.sym_items():
       if deep or isinstance(v, base.Symbolic):
-        v = base.clone(v, deep, memo)
+        if memo and id(v) in memo and isinstance(v, base.Symbolic):
+          trusted = False
+        v = base._clone_child(v, deep, memo)  # pylint: disable=protected-access
       kwargs[k] = v
-    return self.__class__(allow_partial=self._allow_partial,
-                          sealed=self._sealed,
-                          **kwargs)  # pytype: disable=not-instantiable
+    cls = self.__class__
+    if trusted and _init_only_maps_fields(cls):
+      # NOTE: the copy is constructed from validated field values without
+      # calling a user `__init__`, which may construct other values from its
+      # arguments. Therefore only the managed `__init__` skips validation.
+      init = cls.__init__ if _has_managed_init(cls) else Object.__init__
+      copy_obj = cls.__new__(cls)
+      with flags.trusted_construction():
+        init(copy_obj,
+             allow_partial=self._allow_partial,
+             sealed=self._sealed,
+             **kwargs)
+      return copy_obj
+    return cls(allow_partial=self._allow_partial,
+               sealed=self._sealed,
+               **kwargs)  # pytype: disable=not-instantiable
 
   def _sym_missing(self) -> Dict[str, Any]:
     """Returns missing values."""
@@ -873,7 +1283,15 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
 
   def seal(self, sealed: bool = True) -> 'Object':
     """Seal or unseal current object from further modification."""
-    self._sym_attributes.seal(sealed)
+    if self._sym_interned:
+      return self
+    if self._sym_compact_values is not None:
+      if self.is_sealed != sealed:
+        for v in self._sym_compact_values:
+          if isinstance(v, base.Symbolic):
+            v.seal(sealed)
+    else:
+      self._sym_attributes.seal(sealed)
     super().seal(sealed)
     return self
 
@@ -881,8 +1299,8 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
       self,
       old_path: object_utils.KeyPath,
       new_path: object_utils.KeyPath) -> None:
-    """Update children paths according to root_path of current node."""
-    self._sym_attributes.sym_setpath(new_path)
+    """Notifies path changes to the subscribers within current sub-tree."""
+    self._sym_attributes._update_children_paths(old_path, new_path)  # pylint: disable=protected-access
     self._on_path_change(old_path, new_path)
 
   def _set_item_without_permission_check(  # pytype: disable=signature-mismatch  # overriding-parameter-type-checks
@@ -890,6 +1308,18 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
     """Set item without permission check."""
     return self._sym_attributes._set_item_without_permission_check(key, value)  # pylint: disable=protected-access
 
+  @property
+  def _subscribes_path_changes(self) -> bool:
+    """Returns True if current object subscribes path changes.
+
+    For pg.Object, this return True only when `_on_path_change` or
+    `_update_children_paths` is overridden from subclass.
+    """
+    return (
+        self._on_path_change.__code__ is not Object._on_path_change.__code__  # pytype: disable=attribute-error
+        or self._update_children_paths.__code__   # pytype: disable=attribute-error
+        is not Object._update_children_paths.__code__)
+
   @property
   def _subscribes_field_updates(self) -> bool:
     """Returns True if current object subscribes field updates.
@@ -912,6 +1342,41 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
     """Customizes pickle.load."""
     self.__init__(**state['kwargs'])
 
+  def _sym_reduce_state(self) -> Optional[Tuple[Any, ...]]:
+    """Returns the validated field values in schema order for pickling."""
+    cls = self.__class__
+    field_index = cls._sym_compact_field_index
+    if (not _init_only_maps_fields(cls)
+        or field_index is None
+        or cls.__getstate__ is not Object.__getstate__
+        or cls.__setstate__ is not Object.__setstate__):
+      return None
+    if self._sym_compact_values is not None:
+      values = self._sym_compact_values
+    else:
+      attributes = self._sym_attributes
+      if (len(field_index) != len(attributes)
+          or any(a != b for a, b in zip(field_index, attributes.keys()))):
+        return None
+      values = tuple(attributes.sym_values())
+    return (values, self._allow_partial, self._sealed)
+
+  @classmethod
+  def _sym_restore(
+      cls, values: Tuple[Any, ...], allow_partial: bool, sealed: bool
+      ) -> 'Object':
+    """Restores an object from its validated field values."""
+    obj = cls.__new__(cls)
+    super(Object, obj).__init__(
+        allow_partial=allow_partial,
+        accessor_writable=cls.allow_symbolic_assignment,
+        sealed=sealed,
+        root_path=None)
+    obj._sym_init_attributes(values, allow_partial, sealed)  # pylint: disable=protected-access
+    obj._on_init()  # pylint: disable=protected-access
+    obj.seal(sealed)
+    return obj
+
   def __setattr__(self, name: str, value: Any) -> None:
     """Set field value by attribute."""
     # NOTE(daiyip): two types of members are treated as regular members:
@@ -971,7 +1436,7 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
             self.__class__.__serialization_key__
         )
     }
-    json_dict.update(self._sym_attributes.to_json(**kwargs))
+    json_dict.update(self._sym_attributes_view().to_json(**kwargs))
     return json_dict
 
   def format(self,
@@ -980,7 +1445,7 @@ class Object(base.Symbolic, metaclass=ObjectMeta):
              root_indent: int = 0,
              **kwargs) -> str:
     """Formats this object."""
-    return self._sym_attributes.format(
+    return self._sym_attributes_view().format(
         compact,
         verbose,
         root_indent,
@@ -28,6 +28,7 @@ from pyglove.core import typing as pg_typing
 from pyglove.core.symbolic import base
 from pyglove.core.symbolic import flags
 from pyglove.core.symbolic import inferred
+from pyglove.core.symbolic import object as pg_object
 from pyglove.core.symbolic.base import query as pg_query
 from pyglove.core.symbolic.base import traverse as pg_traverse
 from pyglove.core.symbolic.dict import Dict
@@ -165,6 +166,94 @@ class ObjectTest(unittest.TestCase):
     with self.assertRaisesRegex(TypeError, '.* takes no arguments.'):
       B(1)
 
+  def test_deferred_init(self):
+
+    class A(Object):
+      x: int
+
+    class B(A):
+      y: str = 'foo'
+
+    # `__init__` is generated upon first access.
+    self.assertIsInstance(A.__dict__['__init__'], pg_object._LazyInit)
+    self.assertIsInstance(B.__dict__['__init__'], pg_object._LazyInit)
+    self.assertEqual(B(1, 'bar'), B(x=1, y='bar'))
+    self.assertIsInstance(A.__dict__['__init__'], pg_object._LazyInit)
+    self.assertTrue(B.__dict__['__init__'].__sym_generated_init__)
+    self.assertEqual(list(inspect.signature(A).parameters), ['x'])
+    self.assertNotIsInstance(A.__dict__['__init__'], pg_object._LazyInit)
+
+    # Schema updates regenerate `__init__`.
+    A.update_schema([('z', pg_typing.Int(default=1))])
+    self.assertIsInstance(A.__dict__['__init__'], pg_object._LazyInit)
+    self.assertEqual(list(inspect.signature(A).parameters), ['x', 'z'])
+
+  def test_specialized_init(self):
+
+    class A(Object):
+      x: int
+      y: list[int] = [1]
+      z: str = 'foo'
+
+    self.assertTrue(A.__init__.__sym_generated_init__)
+    self.assertNotEqual(A.__init__.__code__, Object.__init__.__code__)
+
+    def generic_init(*args, **kwargs):
+      a = A.__new__(A)
+      Object.__init__(a, *args, **kwargs)
+      return a
+
+    for args, kwargs in [
+        ((1,), {}),
+        ((1, [2, 3]), dict(z='bar')),
+        ((), dict(x=1, z='bar')),
+        ((), dict(allow_partial=True)),
+        ((1,), dict(sealed=True)),
+        ((1,), dict(root_path=object_utils.KeyPath.parse('a.b'))),
+    ]:
+      a, b = A(*args, **kwargs), generic_init(*args, **kwargs)
+      self.assertTrue(base.eq(a, b))
+      self.assertEqual(a.sym_path, b.sym_path)
+      self.assertEqual(a.is_sealed, b.is_sealed)
+      self.assertEqual(a.y.is_sealed, b.y.is_sealed)
+      self.assertEqual(a.is_partial, b.is_partial)
+      self.assertIs(a.y.sym_parent, a)
+      self.assertEqual(a.y.sym_path, b.y.sym_path)
+
+    # Default values are not shared.
+    self.assertIsNot(A(1).y, A(1).y)
+
+    # Symbolic values that belong to other trees are copied.
+    a = A(1)
+    b = A(2, a.y)
+    self.assertIsNot(b.y, a.y)
+    self.assertIs(a.y.sym_parent, a)
+
+    # Fall back to `Object.__init__` upon errors and non-default flags.
+    with self.assertRaisesRegex(TypeError, 'missing 1 required argument'):
+      A()
+    with self.assertRaisesRegex(
+        TypeError, 'got multiple values for argument \'x\''):
+      A(1, x=2)
+    with self.assertRaisesRegex(TypeError, 'got unexpected keyword argument'):
+      A(1, w=2)
+    with self.assertRaisesRegex(TypeError, 'Expect .* but encountered'):
+      A('foo')
+    with flags.allow_partial(True):
+      self.assertTrue(A().is_partial)
+    with flags.trusted_construction():
+      self.assertEqual(A(1).y, [1])
+
+    # Subclasses that call `super().__init__` use their own schema.
+    class B(A):
+      w: int = 2
+
+      @object_utils.explicit_method_override
+      def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    self.assertEqual(B(1, w=3).w, 3)
+
   def test_partial(self):
 
     @pg_members([
@@ -1107,6 +1196,194 @@ class ObjectTest(unittest.TestCase):
     self.assertIs(a.z, a2.z)
     self.assertIs(a.y.c, a2.y.c)
 
+  def test_trusted_construction(self):
+
+    @pg_members([
+        ('x', pg_typing.Int(min_value=0)),
+        ('y', pg_typing.Dict([
+            ('p', pg_typing.Str()),
+            ('q', pg_typing.Float(default=1.0)),
+            (pg_typing.StrKey('n_.*'), pg_typing.Float()),
+        ])),
+        ('z', pg_typing.List(pg_typing.Dict([('r', pg_typing.Int())]))),
+        ('t', pg_typing.List(
+            pg_typing.Int(), default=[],
+            transform=lambda x: x if isinstance(x, list) else [x])),
+    ])
+    class A(Object):
+      pass
+
+    with flags.trusted_construction():
+      # Values are not validated.
+      a = A(-1, Dict(p='foo'), List([Dict(r=1)]))
+      self.assertEqual(a.x, -1)
+
+      # Unexpected and missing arguments are still checked.
+      with self.assertRaisesRegex(
+          TypeError, 'got unexpected keyword argument: \'w\''):
+        A(1, Dict(p='foo'), List(), w=1)
+      with self.assertRaisesRegex(
+          TypeError, 'missing 1 required argument: \'x\''):
+        A(y=Dict(p='foo'), z=List())
+
+      # Transforms and type conversions are still applied, including the
+      # members of non-const keys.
+      a = A(1, Dict(p='foo', q=2, n_1=3), List(), t=1)
+      self.assertEqual(a.y.q, 2.0)
+      self.assertIsInstance(a.y.q, float)
+      self.assertIsInstance(a.y.n_1, float)
+      self.assertEqual(a.t, [1])
+      with self.assertRaisesRegex(TypeError, 'Expect .* but encountered'):
+        A(1, Dict(p=1), List())
+
+      # Absent values are filled with defaults, and value specs are bound to the
+      # schema-less members.
+      a = A(1, Dict(p='foo'), List([Dict(r=1)]))
+      self.assertEqual(a.y.q, 1.0)
+      self.assertIs(a.y.value_spec, A.__schema__['y'].value)
+      self.assertIs(a.z.value_spec, A.__schema__['z'].value)
+      self.assertIs(a.z[0].value_spec, A.__schema__['z'].value.element.value)
+
+    # Value specs bound under trusted construction take effect afterwards.
+    with self.assertRaisesRegex(TypeError, 'Expect .* but encountered'):
+      a.y.p = 1
+    with self.assertRaisesRegex(TypeError, 'Expect .* but encountered'):
+      a.z[0].r = 'abc'
+
+    # Values are validated outside the scope.
+    with self.assertRaisesRegex(ValueError, 'Value -1 is out of range'):
+      A(-1, Dict(p='foo'), List())
+
+    # Values constructed by event handlers are validated.
+    class B(Object):
+      x: int
+
+      def _on_bound(self):
+        super()._on_bound()
+        self._child = A(self.x, Dict(p='foo'), List())
+
+    with flags.trusted_construction():
+      with self.assertRaisesRegex(ValueError, 'Value -1 is out of range'):
+        B(-1)
+
+    # Objects with a user `__init__` are cloned with validation.
+    class C(Object):
+      x: int
+
+      @object_utils.explicit_method_override
+      def __init__(self, x, **kwargs):
+        super().__init__(x=x, **kwargs)
+        self._child = A(-1, Dict(p='foo'), List())
+
+    with self.assertRaisesRegex(ValueError, 'Value -1 is out of range'):
+      C(1)
+    with flags.trusted_construction(False):
+      c = C.__new__(C)
+      Object.__init__(c, x=1)
+    with self.assertRaisesRegex(ValueError, 'Value -1 is out of range'):
+      c.clone()
+
+  def test_compact_storage(self):
+
+    @pg_members([
+        ('x', pg_typing.Int()),
+        ('y', pg_typing.Any(default=None)),
+    ])
+    class A(Object):
+      allow_symbolic_assignment = True
+      use_compact_storage = True
+
+    a = A(1, y=A(2))
+    self.assertIsNotNone(a._sym_compact_values)
+    self.assertNotIn('_sym_attributes', a.__dict__)
+
+    # Read-only access does not materialize the attributes container.
+    self.assertEqual(a.x, 1)
+    self.assertEqual(a.sym_getattr('x'), 1)
+    self.assertTrue(a.sym_hasattr('y'))
+    self.assertFalse(a.sym_hasattr('z'))
+    self.assertEqual(list(a.sym_keys()), ['x', 'y'])
+    self.assertEqual(list(a.sym_items()), [('x', 1), ('y', A(2))])
+    self.assertIs(a.sym_attr_field('x'), A.__schema__['x'])
+    self.assertIs(a.y.sym_parent, a)
+    self.assertEqual(a.y.sym_path, 'y')
+    self.assertEqual(a, A(1, y=A(2)))
+    self.assertNotEqual(a, A(1, y=A(3)))
+    self.assertEqual(hash(a), hash(A(1, y=A(2))))
+    self.assertEqual(
+        base.to_json(a),
+        {'_type': A.__type_name__, 'x': 1,
+         'y': {'_type': A.__type_name__, 'x': 2, 'y': None}})
+    self.assertEqual(repr(a), 'A(x=1, y=A(x=2, y=None))')
+    self.assertEqual(a.clone(deep=True), a)
+    self.assertIsNotNone(a._sym_compact_values)
+
+    # Compact storage is transparent to symbolic operations.
+    self.assertEqual(pg_query(a, where=lambda v: v == 2), {'y.x': 2})
+
+    # The attributes container is materialized upon mutation.
+    h = hash(a)
+    a.rebind({'y.x': 3})
+    self.assertIsNotNone(a._sym_compact_values)
+    self.assertIsNone(a.y._sym_compact_values)
+    self.assertEqual(a.y.x, 3)
+    self.assertNotEqual(hash(a), h)
+    a.x = 4
+    self.assertIsNone(a._sym_compact_values)
+    self.assertEqual(a, A(4, y=A(3)))
+    self.assertIs(a.sym_init_args.y, a.y)
+    self.assertIs(a.y.sym_parent, a)
+    self.assertEqual(a.sym_missing(), {})
+
+    # Compact storage is not used by classes with non-const keys.
+    @pg_members([
+        (pg_typing.StrKey(), pg_typing.Int()),
+    ])
+    class C(Object):
+      use_compact_storage = True
+
+    c = C(x=1)
+    self.assertIsNone(c._sym_compact_values)
+    self.assertEqual(c.x, 1)
+
+  def test_sym_clone_with_override(self):
+
+    @pg_members([
+        ('x', pg_typing.Any()),
+        ('y', pg_typing.Any()),
+    ])
+    class A(Object):
+      pass
+
+    a = A(A(1, 2), [A(3, 4), dict(p=A(5, 6))])
+    b = A(7, 8)
+    a2 = a.sym_clone(deep=True, override={
+        'x': b,
+        'y[0].x': A(9, 10),
+        'y[1].p.x': 11,
+        'y[1].q': 12,
+    })
+    self.assertEqual(
+        a2, A(A(7, 8), [A(A(9, 10), 4), dict(p=A(11, 6), q=12)]))
+    self.assertEqual(a, A(A(1, 2), [A(3, 4), dict(p=A(5, 6))]))
+    self.assertIs(a2.x, b)
+    self.assertIs(a2.x.sym_parent, a2)
+    self.assertEqual(a2.y[0].x.sym_path, 'y[0].x')
+
+    # Nested overrides are applied in order.
+    a2 = a.sym_clone(deep=True, override={'x': A(1, 1), 'x.y': 3})
+    self.assertEqual(a2.x, A(1, 3))
+
+    # Substituted values are validated.
+    @pg_members([
+        ('z', pg_typing.Dict([('p', pg_typing.Object(A))])),
+    ])
+    class B(Object):
+      pass
+
+    with self.assertRaisesRegex(TypeError, 'Expect .* but encountered'):
+      B(dict(p=A(1, 2))).sym_clone(deep=True, override={'z.p': 1})
+
   def test_sym_origin(self):
 
     @pg_members([
@@ -1181,6 +1458,44 @@ class ObjectTest(unittest.TestCase):
         ValueError, 'Cannot set the origin with a different source value'):
       a.sym_setorigin(a2, 'builder3')
 
+  def test_sym_origin_with_sampling(self):
+
+    @pg_members([
+        ('x', pg_typing.Any())
+    ])
+    class A(Object):
+      pass
+
+    @pg_functor
+    def builder(x):
+      return A(x)
+
+    def tracking_rate(values):
+      return sum(v.sym_origin is not None for v in values) / len(values)
+
+    with flags.track_origin(every_n=2):
+      # Each clone is one origin event, including the values it creates.
+      a = A(A(A(1)))
+      self.assertEqual(
+          tracking_rate([a.clone(deep=True) for _ in range(100)]), 0.5)
+
+    with flags.track_origin(every_n=2, types=[A]):
+      # The value returned from a functor is sampled only once.
+      b = builder.partial()
+      results = [b(1) for _ in range(100)]
+      self.assertEqual(tracking_rate(results), 0.5)
+      self.assertTrue(all(r.sym_origin is None or r.sym_origin.tag == 'return'
+                          for r in results))
+
+    with flags.track_origin(every_n=3, types=[A]):
+      values = [b(1) for _ in range(300)]
+      self.assertAlmostEqual(tracking_rate(values), 1 / 3)
+
+    # The raw origin of values skipped by sampling is None.
+    for v in values:
+      self.assertTrue(v._sym_origin is None  # pylint: disable=protected-access
+                      or isinstance(v._sym_origin, Origin))  # pylint: disable=protected-access
+
   def test_sym_partial(self):
     # Refer to `test_partial` for more details.
 
@@ -1520,6 +1835,31 @@ class ObjectTest(unittest.TestCase):
     self.assertNotEqual(
         base.sym_hash(A(1, 2).result), base.sym_hash(A(2, 3).result))
 
+  def test_sym_hash_memoization(self):
+
+    @pg_members([
+        ('x', pg_typing.Any()),
+    ])
+    class A(Object):
+      pass
+
+    a = A(Dict(y=A(1)))
+    h = a.sym_hash()
+    self.assertEqual(a.sym_hash(), h)
+    self.assertEqual(hash(a), h)
+
+    # Rebinding a deep leaf invalidates the memoized hash along the parent
+    # chain, including the symbolic attributes of objects.
+    a.rebind({'x.y.x': 2})
+    self.assertNotEqual(a.sym_hash(), h)
+    self.assertEqual(a.sym_hash(), A(Dict(y=A(2))).sym_hash())
+    self.assertEqual(
+        a.sym_init_args.sym_hash(), A(Dict(y=A(2))).sym_init_args.sym_hash()
+    )
+
+    a.rebind(x=1)
+    self.assertEqual(a.sym_hash(), A(1).sym_hash())
+
   def test_sym_parent(self):
 
     @pg_members([
@@ -2628,6 +2968,142 @@ class EventsTest(unittest.TestCase):
         'c.z', 'c', 'b', 'a.x', 'a', ''
     ])
 
+  def test_rebind_with_shared_parents(self):
+
+    @pg_members([
+        (pg_typing.StrKey(), pg_typing.Any())
+    ])
+    class Node(Object):
+      pass
+
+    node = Node(a=Node(x=1), l=[Node(x=1), Node(x=2)])
+    node.rebind({
+        'a': Node(x=3),
+        'a.x': 4,
+        'l[1]': Node(x=5),
+        'l[1].x': 6,
+        'l[0].x': 7,
+    })
+    self.assertEqual(node, Node(a=Node(x=4), l=[Node(x=7), Node(x=6)]))
+
+  def test_sym_transaction(self):
+    change_order = []
+
+    @pg_members([
+        (pg_typing.StrKey(), pg_typing.Any())
+    ])
+    class Node(Object):
+
+      def _on_change(self, field_updates):
+        change_order.append((self.sym_path, field_updates))
+
+    node = Node(a=Node(x=1, y=1), b=Node(z=1))
+    with node.sym_transaction() as n:
+      self.assertIs(n, node)
+      node.rebind({'a.x': 2, 'b.z': 2})
+      node.a.rebind(y=2)
+      with node.a.sym_transaction():
+        node.a.rebind(x=3)
+      node.rebind({'a.x': 4})
+      self.assertEqual(node.a.x, 4)
+      self.assertEqual(change_order, [])
+
+    self.assertEqual([p for p, _ in change_order], ['b', 'a', ''])
+    updates = change_order[1][1]
+    self.assertEqual(list(updates.keys()), ['x', 'y'])
+    self.assertEqual(updates['x'].old_value, 1)
+    self.assertEqual(updates['x'].new_value, 4)
+    self.assertEqual(len(change_order[2][1]), 3)
+
+    # Notifications are not deferred after the transaction.
+    change_order[:] = []
+    node.a.rebind(x=5)
+    self.assertEqual([p for p, _ in change_order], ['a', ''])
+
+    # Content-based caches are up to date within the transaction.
+    hash_value = node.sym_hash()
+    with node.sym_transaction():
+      node.a.rebind(x=0)
+      self.assertNotEqual(node.sym_hash(), hash_value)
+      self.assertEqual(
+          node.sym_hash(), Node(a=Node(x=0, y=2), b=Node(z=2)).sym_hash())
+    change_order[:] = []
+
+    # Notifications are still triggered when the transaction fails.
+    change_order[:] = []
+    with self.assertRaisesRegex(ValueError, 'abc'):
+      with node.sym_transaction():
+        node.a.rebind(x=6)
+        raise ValueError('abc')
+    self.assertEqual([p for p, _ in change_order], ['a', ''])
+
+  def test_defer_notifications(self):
+    change_order = []
+
+    @pg_members([
+        (pg_typing.StrKey(), pg_typing.Any())
+    ])
+    class Node(Object):
+
+      def _on_change(self, field_updates):
+        change_order.append((self.sym_path, field_updates))
+
+    node = Node(a=Node(x=1, y=[]), b=Node(z=1))
+    other = Node(x=1)
+    with flags.defer_notifications():
+      with flags.defer_notifications():
+        node.rebind({'a.x': 2, 'b.z': 2})
+      node.a.y.append(1)
+      node.a.y.append(2)
+      node.rebind({'a.x': 3})
+      other.rebind(x=2)
+      self.assertEqual(change_order, [])
+
+    self.assertEqual(
+        sorted(p for p, _ in change_order), ['', '', 'a', 'b'])
+    updates = dict(change_order)['a']
+    self.assertEqual(list(updates.keys()), ['x', 'y[0]', 'y[1]'])
+    self.assertEqual(updates['x'].old_value, 1)
+    self.assertEqual(updates['x'].new_value, 3)
+
+    # Notifications are not deferred after the scope.
+    change_order[:] = []
+    node.a.rebind(x=4)
+    self.assertEqual([p for p, _ in change_order], ['a', ''])
+
+    # Deferred updates within a transaction are forwarded to it.
+    change_order[:] = []
+    with node.sym_transaction():
+      with flags.defer_notifications():
+        node.a.rebind(x=5)
+      self.assertEqual(change_order, [])
+    self.assertEqual([p for p, _ in change_order], ['a', ''])
+
+    # Notifications are still triggered when the scope fails.
+    change_order[:] = []
+    with self.assertRaisesRegex(ValueError, 'abc'):
+      with flags.defer_notifications():
+        node.a.rebind(x=6)
+        raise ValueError('abc')
+    self.assertEqual([p for p, _ in change_order], ['a', ''])
+
+    # Content-based caches are up to date within the scope.
+    @pg_members([
+        ('a', pg_typing.Dict([('x', pg_typing.Int(default=0))]))
+    ])
+    class Root(Object):
+      pass
+
+    root = Root(a=dict(x=1))
+    self.assertEqual(root.sym_nondefault(), {'a.x': 1})
+    hash_value = root.sym_hash()
+    with flags.defer_notifications():
+      root.a.rebind(x=2)
+      self.assertEqual(root.sym_nondefault(), {'a.x': 2})
+      self.assertNotEqual(root.sym_hash(), hash_value)
+      root.a.rebind(x=0)
+      self.assertEqual(root.sym_nondefault(), {})
+
   def test_on_parent_change(self):
 
     class A(Object):
@@ -2664,10 +3140,19 @@ class EventsTest(unittest.TestCase):
     self.assertEqual(x.old_path, 'a')
     self.assertEqual(x.new_path, 'x')
 
-    _ = Dict(y=y)
+    z = Dict(y=y)
     self.assertEqual(x.old_path, 'x')
     self.assertEqual(x.new_path, 'y.x')
 
+    # Path changes are notified when ancestors are reordered or detached.
+    l = List([1, z])
+    self.assertEqual(x.new_path, '[1].y.x')
+    l.reverse()
+    self.assertEqual(x.old_path, '[1].y.x')
+    self.assertEqual(x.new_path, '[0].y.x')
+    l.rebind({'[0]': 2})
+    self.assertEqual(x.new_path, 'y.x')
+
 
 class TraverseTest(unittest.TestCase):
   """Tests for `pg.traverse` on symbolic Object."""
@@ -2889,6 +3374,20 @@ class QueryTest(unittest.TestCase):
         pg_query(self._v, custom_selector=selector),
         {'[0].b.a.x': 1})
 
+  def test_query_by_type(self):
+    self.assertEqual(
+        pg_query(self._v, type=self._A),
+        {
+            '[0].a': self._A(x=0),
+            '[0].b.a': self._A(x=1),
+        })
+    self.assertEqual(
+        pg_query(self._v, r'.*b.*', type=(int, self._A)),
+        {
+            '[0].b.a': self._A(x=1),
+            '[0].b.z': 2,
+        })
+
   def test_query_with_no_match(self):
     self.assertEqual(0, len(pg_query(self._v, r'xx')))
 
@@ -3204,6 +3703,14 @@ class SerializationTest(unittest.TestCase):
     base.save('foo', path3, file_format='txt')
     self.assertEqual(base.load(path3, file_format='txt'), 'foo')
 
+    # Test save/load in binary.
+    path4 = os.path.join(tmp_dir, 'subdir/a.pgb')
+    base.save(A(a=1, b=[0, 1]), path4, file_format='binary')
+    with open(path4, 'rb') as f:
+      self.assertEqual(f.read(), base.to_binary(A(a=1, b=[0, 1])))
+    self.assertEqual(
+        base.load(path4, file_format='binary'), A(a=1, b=[0, 1]))
+
     # Test save/load in unsupported format.
     with self.assertRaisesRegex(ValueError, 'Unsupported `file_format`'):
       base.save(A(a=1, b=[0]), path2, file_format='bin')
@@ -3517,6 +4024,14 @@ class Foo(Object):
   p: typing.Optional['Foo'] = None
 
 
+class FooWithCustomInit(Foo):
+
+  @object_utils.explicit_method_override
+  def __init__(self, y, **kwargs):
+    super().__init__(y=y, **kwargs)
+    self.num_inits = 1
+
+
 class PickleTest(unittest.TestCase):
 
   def assert_pickle_correctness(self, v: Object) -> Object:
@@ -3538,6 +4053,41 @@ class PickleTest(unittest.TestCase):
   def test_partial(self):
     self.assert_pickle_correctness(Foo.partial())
 
+  def test_restore_without_init(self):
+    v = Foo([dict(x=2)], dict(x=1), p=Foo([], dict(a=2)))
+    payload = pickle.dumps(v)
+    init = Foo.__init__
+    def _raise(*args, **kwargs):
+      raise AssertionError('`__init__` should not be called.')
+    Foo.__init__ = _raise
+    try:
+      v2 = pickle.loads(payload)
+    finally:
+      Foo.__init__ = init
+    self.assertEqual(v, v2)
+    self.assertIs(v2.p.sym_parent, v2)
+    self.assertEqual(v2.x[0].sym_path, 'x[0]')
+    self.assertEqual(v2.p.y.sym_path, 'p.y')
+
+  def test_custom_init(self):
+    v2 = self.assert_pickle_correctness(
+        Foo([], dict(a=1), p=FooWithCustomInit(dict(b=1))))
+    self.assertEqual(v2.p.num_inits, 1)
+
+  def test_interned(self):
+    shared = base.intern(Foo([], dict(a=1)).seal())
+    v2 = self.assert_pickle_correctness(List([shared, Dict(x=shared)]))
+    self.assertIs(v2[0], shared)
+    self.assertIs(v2[1].x, shared)
+
+    # Equal values interned in another process are restored as shared ones.
+    payload = pickle.dumps(List([shared, shared]))
+    del shared, v2
+    v3 = pickle.loads(payload)
+    self.assertTrue(base.is_interned(v3[0]))
+    self.assertIs(v3[0], v3[1])
+    self.assertIsNone(v3[0].sym_parent)
+
 
 if __name__ == '__main__':
   unittest.main()
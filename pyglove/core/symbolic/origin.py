@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tracking the origin of a symbolic object."""
 
+import collections
+import sys
 import traceback
 from typing import Any, Callable, List, Optional
 
@@ -36,6 +38,13 @@ class Origin(object_utils.Formattable):
   `sym_setorigin` method of symbolic values will be automatically called during
   object creation, cloning or being returned from a functor. The stack
   information can be obtained by `origin.stack` or `origin.stacktrace`.
+
+  To keep the tracking cheap, only the code objects and line numbers of the
+  stack frames are captured upon creation, which are formatted on first access
+  of `origin.stack` or `origin.stacktrace`. Origins created when origin
+  tracking is enabled are also recorded in a ring buffer, whose size is set by
+  `pg.symbolic.set_origin_history_size`, and can be accessed by
+  `pg.symbolic.origin_history()`.
   """
 
   def __init__(self,
@@ -66,19 +75,32 @@ class Origin(object_utils.Formattable):
 
     self._source = source
     self._tag = tag
+    self._frames = None
     self._stack = None
     self._stacktrace = None
 
+    tracking = flags.is_tracking_origin()
     if stacktrace is None:
-      stacktrace = flags.is_tracking_origin()
+      stacktrace = tracking
 
     if stacklimit is None:
       stacklimit = flags.get_origin_stacktrace_limit()
 
     if stacktrace:
-      self._stack = traceback.extract_stack(limit=stacklimit - stacktop)
-      if stacktop < 0:
-        self._stack = self._stack[:stacktop]
+      # NOTE: we capture the code object and the current line number of
+      # each frame instead of the frame itself, which would otherwise keep the
+      # local variables of the frame alive.
+      frames = []
+      frame = sys._getframe(max(-stacktop, 0))  # pylint: disable=protected-access
+      limit = stacklimit - max(stacktop, 0)
+      while frame is not None and len(frames) < limit:
+        frames.append((frame.f_code, frame.f_lineno))
+        frame = frame.f_back
+      frames.reverse()
+      self._frames = frames
+
+    if tracking:
+      _record(self)
 
   @property
   def source(self) -> Any:
@@ -126,15 +148,22 @@ class Origin(object_utils.Formattable):
   @property
   def stack(self) -> Optional[List[traceback.FrameSummary]]:
     """Returns the frame summary of original stack."""
+    if self._stack is None and self._frames is not None:
+      self._stack = traceback.StackSummary.from_list([
+          traceback.FrameSummary(
+              code.co_filename, lineno, code.co_name, lookup_line=False)
+          for code, lineno in self._frames])
+      self._frames = None
     return self._stack
 
   @property
   def stacktrace(self) -> Optional[str]:
     """Returns stack trace string."""
-    if self._stack is None:
+    stack = self.stack
+    if stack is None:
       return None
     if self._stacktrace is None:
-      self._stacktrace = ''.join(traceback.format_list(self._stack))
+      self._stacktrace = ''.join(traceback.format_list(stack))
     return self._stacktrace
 
   def chain(self, tag: Optional[str] = None) -> List['Origin']:
@@ -185,3 +214,39 @@ class Origin(object_utils.Formattable):
   def __ne__(self, other: Any) -> bool:
     """Operator !=."""
     return not self.__eq__(other)
+
+
+_HISTORY = collections.deque(maxlen=0)
+
+
+def _history() -> collections.deque:  # pylint: disable=g-bare-generic
+  """Returns the history ring buffer resized to the configured size."""
+  global _HISTORY
+  size = flags.get_origin_history_size()
+  if _HISTORY.maxlen != size:
+    _HISTORY = collections.deque(_HISTORY, maxlen=size)
+  return _HISTORY
+
+
+def _record(origin: Origin) -> None:
+  """Records an origin in the history ring buffer."""
+  if flags.get_origin_history_size():
+    _history().append(origin)
+
+
+def origin_history() -> List[Origin]:
+  """Returns the recently tracked origins from the oldest to the most recent.
+
+  The number of origins kept is bounded by
+  `pg.symbolic.set_origin_history_size`, which is 0 (disabled) by default::
+
+    pg.symbolic.set_origin_history_size(100)
+    with pg.track_origin(every_n=1000):
+      ...
+    for origin in pg.symbolic.origin_history():
+      print(origin.tag, origin.stacktrace)
+
+  Returns:
+    A list of origins created when origin tracking is enabled.
+  """
+  return list(_history())
@@ -16,6 +16,7 @@
 import unittest
 
 from pyglove.core.symbolic import flags
+from pyglove.core.symbolic import origin
 from pyglove.core.symbolic.dict import Dict
 from pyglove.core.symbolic.origin import Origin
 
@@ -46,6 +47,36 @@ class OriginTest(unittest.TestCase):
     o = Origin(a, '__init__', stacktrace=True)
     self.assertEqual(len(o.stack), 2)
 
+  def test_lazy_stacktrace(self):
+    def foo():
+      return Origin(None, '__init__', stacktrace=True, stacklimit=2)
+    o = foo()
+    self.assertIsNone(o._stack)
+    self.assertEqual(o.stack[-1].name, 'foo')
+    self.assertEqual(o.stack[-2].name, 'test_lazy_stacktrace')
+    self.assertIn('return Origin(None', o.stacktrace)
+
+  def test_origin_history(self):
+    flags.set_origin_history_size(2)
+    try:
+      a = Dict(a=1)
+      with flags.track_origin():
+        b = a.clone()
+        c = b.clone()
+        d = c.clone()
+      history = origin.origin_history()
+      self.assertEqual(len(history), 2)
+      self.assertIs(history[-1], d.sym_origin)
+
+      # Origins are not recorded when tracking is disabled.
+      d.clone()
+      self.assertEqual(len(origin.origin_history()), 2)
+
+      flags.set_origin_history_size(0)
+      self.assertEqual(origin.origin_history(), [])
+    finally:
+      flags.set_origin_history_size(0)
+
   def test_root(self):
     a = Dict(a=1)
     b = Dict(b=2)
@@ -0,0 +1,377 @@
+# Copyright 2022 The PyGlove Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent query index for symbolic trees."""
+
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple, Type, Union
+import weakref
+
+from pyglove.core import object_utils
+from pyglove.core.symbolic import base
+
+
+class QueryIndex:
+  """An opt-in index over the nodes of a symbolic tree.
+
+  A query index maps the types of symbolic nodes and the string keys within a
+  tree to the nodes that contain them, so that typed queries become lookups
+  instead of full traversals. Once created, the index is attached to the root
+  and is used transparently by :func:`pyglove.query` (with the ``type``
+  argument) and :func:`pyglove.contains` (with the ``type`` argument)::
+
+    index = pg.symbolic.QueryIndex(value)
+
+    # Looked up from the index, no traversal.
+    pg.query(value, type=pg.hyper.OneOf)
+    pg.contains(value, type=pg.hyper.OneOf)
+
+    # Look up all values by key name.
+    index.select_key('learning_rate')
+
+  The index is maintained incrementally: every mutation within the tree marks
+  the mutated node as dirty, whose direct children are re-scanned on the next
+  lookup, and nodes removed from the tree are skipped when they are found to
+  be no longer reachable from the root. Therefore mutations made with change
+  notification disabled are reflected as well. The index holds weak
+  references to the nodes, so removed nodes are dropped once they are garbage
+  collected. When stale entries outnumber the live ones, the index is rebuilt.
+
+  Since the index only tracks symbolic nodes, queries on non-symbolic types
+  (e.g. ``int``) fall back to full traversal. So do queries on trees that
+  contain interned values (see :func:`pg.symbolic.intern`), which are shared
+  among trees and thus cannot be located from their parents.
+  """
+
+  def __init__(self, root: base.Symbolic):
+    """Creates and attaches an index to a symbolic root.
+
+    Args:
+      root: The root symbolic value to index. Lookups are relative to it.
+    """
+    if not isinstance(root, base.Symbolic):
+      raise TypeError(
+          f'Query index can only be created for a symbolic value. '
+          f'Encountered: {root!r}.')
+    self._root = root
+    self._rebuild()
+    root._set_raw_attr('_sym_query_index', self)  # pylint: disable=protected-access
+
+  @property
+  def root(self) -> base.Symbolic:
+    """Returns the root of the index."""
+    return self._root
+
+  def detach(self) -> None:
+    """Detaches current index from its root."""
+    if self._root._sym_query_index is self:  # pylint: disable=protected-access
+      self._root._set_raw_attr('_sym_query_index', None)  # pylint: disable=protected-access
+
+  @property
+  def has_shared_nodes(self) -> bool:
+    """Returns True if the tree contains shared (interned) nodes.
+
+    Shared nodes and their sub-trees are not indexed.
+    """
+    self._refresh()
+    return self._has_shared_nodes
+
+  def __len__(self) -> int:
+    """Returns the number of indexed nodes, including stale ones."""
+    return len(self._nodes)
+
+  def _rebuild(self) -> None:
+    """Rebuilds the index from the root."""
+    # NOTE: nodes are weakly referenced, so the nodes removed from the tree
+    # are not kept alive by the index.
+    # Indexed symbolic nodes by their ids.
+    self._nodes: MutableMapping[int, base.Symbolic] = (
+        weakref.WeakValueDictionary())
+    # Indexed symbolic nodes by their types.
+    self._nodes_by_type: Dict[
+        Type[Any], MutableMapping[int, base.Symbolic]] = {}
+    # Owner nodes by string keys.
+    self._owners_by_key: Dict[str, MutableMapping[int, base.Symbolic]] = {}
+    # Nodes whose children need to be re-scanned.
+    self._dirty_nodes: MutableMapping[int, base.Symbolic] = (
+        weakref.WeakValueDictionary())
+    # Whether the tree contains shared nodes.
+    self._has_shared_nodes = False
+    self._add_subtree(self._root)
+
+  def select(
+      self,
+      type: Union[Type[Any], Tuple[Type[Any], ...]]  # pylint: disable=redefined-builtin
+  ) -> List[Tuple[object_utils.KeyPath, base.Symbolic]]:
+    """Returns the nodes of given type(s) in traversal order.
+
+    Args:
+      type: A symbolic type or a tuple of symbolic types.
+
+    Returns:
+      A list of (path relative to the root, node) for all nodes within the
+      tree that are instances of `type`, in the order of `pg.traverse`.
+    """
+    self._refresh()
+    located = []
+    num_stale = 0
+    key_positions = {}
+    for node_type, nodes in self._nodes_by_type.items():
+      if not issubclass(node_type, type):
+        continue
+      for node in nodes.values():
+        location = self._locate(node, key_positions)
+        if location is None:
+          num_stale += 1
+        else:
+          located.append((location, node))
+    self._maybe_rebuild(num_stale, len(located))
+    located.sort(key=lambda x: x[0][0])
+    return [(object_utils.KeyPath(keys), node)
+            for (_, keys), node in located]
+
+  def count(
+      self,
+      type: Union[Type[Any], Tuple[Type[Any], ...]]  # pylint: disable=redefined-builtin
+  ) -> int:
+    """Returns the number of indexed nodes of given type(s).
+
+    Args:
+      type: A symbolic type or a tuple of symbolic types.
+
+    Returns:
+      The number of indexed nodes that are instances of `type`, which may
+      include the nodes that were removed from the tree.
+    """
+    self._refresh()
+    return sum(len(nodes) for node_type, nodes in self._nodes_by_type.items()
+               if issubclass(node_type, type))
+
+  def contains(
+      self,
+      type: Union[Type[Any], Tuple[Type[Any], ...]]  # pylint: disable=redefined-builtin
+  ) -> bool:
+    """Returns True if the tree contains a node of given type(s)."""
+    self._refresh()
+    key_positions = {}
+    for node_type, nodes in self._nodes_by_type.items():
+      if not issubclass(node_type, type):
+        continue
+      for node in nodes.values():
+        if self._locate(node, key_positions) is not None:
+          return True
+    return False
+
+  def select_key(self, key: str) -> Dict[str, Any]:
+    """Returns the values under a key name in traversal order.
+
+    Args:
+      key: A string key.
+
+    Returns:
+      A dict of path (relative to the root) to value for every field named
+      `key` within the tree.
+    """
+    self._refresh()
+    owners = self._owners_by_key.get(key)
+    if not owners:
+      return {}
+    located = []
+    num_stale = 0
+    key_positions = {}
+    for owner in owners.values():
+      location = self._locate(owner, key_positions)
+      children = _children_of(owner)
+      if location is None or not _has_key(children, key):
+        num_stale += 1
+      else:
+        order, keys = location
+        order += (_key_position(children, key, key_positions),)
+        keys.append(key)
+        located.append((order, keys, owner))
+    self._maybe_rebuild(num_stale, len(located))
+    located.sort(key=lambda x: x[0])
+    return {str(object_utils.KeyPath(keys)): owner.sym_getattr(key)
+            for _, keys, owner in located}
+
+  def _on_change(self, node: base.Symbolic) -> None:
+    """Marks a node within the tree as changed."""
+    self._dirty_nodes[id(node)] = node
+
+  def _refresh(self) -> None:
+    """Re-scans the children of dirty nodes."""
+    if not self._dirty_nodes:
+      return
+    dirty_nodes = self._dirty_nodes
+    self._dirty_nodes = weakref.WeakValueDictionary()
+    key_positions = {}
+    for node in list(dirty_nodes.values()):
+      owner = node._sym_parent_for_children()  # pylint: disable=protected-access
+      if self._locate(owner, key_positions) is not None:
+        self._scan_children(node)
+
+  def _add_subtree(self, node: base.Symbolic) -> None:
+    """Adds a sub-tree to the index."""
+    # NOTE: the attributes container of an object is not visible to
+    # queries, therefore we only index its children.
+    if not _is_object_attributes_container(node):
+      node_id = id(node)
+      if node_id in self._nodes:
+        return
+      self._nodes[node_id] = node
+      nodes = self._nodes_by_type.get(node.__class__)
+      if nodes is None:
+        nodes = weakref.WeakValueDictionary()
+        self._nodes_by_type[node.__class__] = nodes
+      nodes[node_id] = node
+    self._scan_children(node)
+
+  def _scan_children(self, node: base.Symbolic) -> None:
+    """Indexes the keys and the new symbolic children of a node."""
+    owner = node._sym_parent_for_children()  # pylint: disable=protected-access
+    is_list = isinstance(node, list)
+    for k, v in node.sym_items():
+      if not is_list and isinstance(k, str):
+        owners = self._owners_by_key.get(k)
+        if owners is None:
+          owners = weakref.WeakValueDictionary()
+          self._owners_by_key[k] = owners
+        owners[id(owner)] = owner
+      if isinstance(v, base.Symbolic) and id(v) not in self._nodes:
+        # NOTE: an interned value placed in the tree keeps its own
+        # location, thus it cannot be located from the root.
+        if v._sym_interned and _raw_attr(v, '_sym_parent') is not owner:  # pylint: disable=protected-access
+          self._has_shared_nodes = True
+        else:
+          self._add_subtree(v)
+
+  def _maybe_rebuild(self, num_stale: int, num_live: int) -> None:
+    """Rebuilds the index when stale entries outnumber the live ones."""
+    # NOTE: removed nodes that are still alive are kept in the index
+    # since they may be attached back to the tree without being re-scanned.
+    # This bounds their number with an amortized rebuild.
+    if num_stale > max(num_live, 16):
+      self._rebuild()
+
+  def _locate(
+      self,
+      node: base.Symbolic,
+      key_positions: Dict[int, Dict[Any, int]]
+  ) -> Optional[Tuple[Tuple[int, ...], List[Union[str, int]]]]:
+    """Locates a node from the root.
+
+    Args:
+      node: A symbolic node.
+      key_positions: A cache of key positions for the dict children, shared
+        across the calls within a query.
+
+    Returns:
+      A tuple of (child positions, keys) from the root to the node, or None
+      if the node is no longer within the tree.
+    """
+    positions = []
+    keys = []
+    root = self._root
+    current = node
+    while current is not root:
+      parent = _raw_attr(current, '_sym_parent')
+      if parent is None:
+        return None
+      children = _children_of(parent)
+      key = _raw_attr(current, '_sym_path_key')
+      # NOTE: a removed node may still point to its former parent,
+      # therefore we check whether the parent still holds it.
+      if key is None or _child_of(children, key) is not current:
+        # The node may be anchored by an explicit path, whose key is looked
+        # up from its parent.
+        key = _key_of(children, current)
+        if key is None:
+          return None
+      positions.append(_key_position(children, key, key_positions))
+      keys.append(key)
+      current = parent
+    positions.reverse()
+    keys.reverse()
+    return tuple(positions), keys
+
+
+_raw_attr = object.__getattribute__
+
+
+# The children of a symbolic node: a list, a dict, or a tuple of (field
+# index, field values) for an object with compact storage.
+_Children = Union[list, dict, Tuple[Dict[str, int], Tuple[Any, ...]]]  # pylint: disable=g-bare-generic
+
+
+def _children_of(node: base.Symbolic) -> _Children:
+  """Returns the raw container of the children of a symbolic node."""
+  if isinstance(node, base.Symbolic.ObjectType):
+    # NOTE: the children of an object with compact storage are read from
+    # the compact storage directly, since accessing `_sym_attributes` would
+    # materialize the attributes container.
+    values = _raw_attr(node, '_sym_compact_values')
+    if values is not None:
+      return (_raw_attr(node, '_sym_compact_keys'), values)
+    return _raw_attr(node, '_sym_attributes')
+  return node
+
+
+def _has_key(children: _Children, key: Union[str, int]) -> bool:
+  if isinstance(children, tuple):
+    return key in children[0]
+  return key in children
+
+
+def _child_of(children: _Children, key: Union[str, int]) -> Any:
+  if isinstance(children, list):
+    if isinstance(key, int) and 0 <= key < list.__len__(children):
+      return list.__getitem__(children, key)
+    return None
+  if isinstance(children, tuple):
+    position = children[0].get(key)
+    return None if position is None else children[1][position]
+  return dict.get(children, key)
+
+
+def _key_of(children: _Children, child: Any) -> Any:
+  if isinstance(children, list):
+    items = enumerate(list.__iter__(children))
+  elif isinstance(children, tuple):
+    items = zip(children[0], children[1])
+  else:
+    items = dict.items(children)
+  for k, v in items:
+    if v is child:
+      return k
+  return None
+
+
+def _key_position(
+    children: _Children,
+    key: Union[str, int],
+    key_positions: Dict[int, Dict[Any, int]]) -> int:
+  """Returns the position of a key within its parent's children."""
+  if isinstance(children, list):
+    return key
+  if isinstance(children, tuple):
+    return children[0][key]
+  positions = key_positions.get(id(children))
+  if positions is None:
+    positions = {k: i for i, k in enumerate(dict.keys(children))}
+    key_positions[id(children)] = positions
+  return positions[key]
+
+
+def _is_object_attributes_container(node: base.Symbolic) -> bool:
+  return (isinstance(node, base.Symbolic.DictType)
+          and node._as_object_attributes_container)  # pylint: disable=protected-access
+
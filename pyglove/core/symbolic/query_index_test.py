@@ -0,0 +1,255 @@
+# Copyright 2022 The PyGlove Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for pyglove.symbolic.QueryIndex."""
+
+import gc
+import unittest
+import weakref
+
+from pyglove.core import typing as pg_typing
+from pyglove.core.symbolic import flags
+from pyglove.core.symbolic.base import contains as pg_contains
+from pyglove.core.symbolic.base import query as pg_query
+from pyglove.core.symbolic.dict import Dict
+from pyglove.core.symbolic.list import List
+from pyglove.core.symbolic.object import members as pg_members
+from pyglove.core.symbolic.object import Object
+from pyglove.core.symbolic.query_index import QueryIndex
+
+
+@pg_members([('x', pg_typing.Any())])
+class A(Object):
+  pass
+
+
+@pg_members([
+    ('a', pg_typing.Any()),
+    ('y', pg_typing.Any(default=1)),
+])
+class B(Object):
+  pass
+
+
+@pg_members([])
+class C(Object):
+  pass
+
+
+@pg_members([])
+class F(Object):
+  pass
+
+
+@pg_members([
+    ('x', pg_typing.Any()),
+    ('y', pg_typing.Any(default=None)),
+])
+class M(Object):
+  use_compact_storage = True
+
+
+class QueryIndexTest(unittest.TestCase):
+  """Tests for `pg.symbolic.QueryIndex`."""
+
+  def _value(self):
+    return Dict(
+        p=A(x=0),
+        q=List([B(a=A(x=1)), B(a=A(x=A(x=2)))]),
+        r=Dict(x=3),
+        # Fillers that make the other nodes a small fraction of the tree.
+        s=List([F() for _ in range(40)]),
+    )
+
+  def test_basics(self):
+    v = self._value()
+    with self.assertRaisesRegex(
+        TypeError, 'Query index can only be created for a symbolic value'):
+      QueryIndex(1)
+
+    index = QueryIndex(v)
+    self.assertIs(index.root, v)
+    self.assertIs(v._sym_query_index, index)
+    # v, v.p, v.q, v.q[0], v.q[0].a, v.q[1], v.q[1].a, v.q[1].a.x, v.r, v.s
+    # and 40 fillers.
+    self.assertEqual(len(index), 50)
+    self.assertEqual(index.count(A), 4)
+    self.assertEqual(index.count((A, B)), 6)
+    self.assertEqual(
+        [(str(k), v) for k, v in index.select(B)],
+        [('q[0]', B(a=A(x=1))), ('q[1]', B(a=A(x=A(x=2))))])
+    self.assertTrue(index.contains(B))
+    self.assertFalse(index.contains(C))
+    self.assertEqual(
+        index.select_key('x'),
+        {
+            'p.x': 0,
+            'q[0].a.x': 1,
+            'q[1].a.x': A(x=2),
+            'q[1].a.x.x': 2,
+            'r.x': 3,
+        })
+    self.assertEqual(index.select_key('z'), {})
+    index.detach()
+    self.assertIsNone(v._sym_query_index)
+
+  def test_query(self):
+    v = self._value()
+    index = QueryIndex(v)
+    self.assertEqual(
+        pg_query(v, type=A),
+        {
+            'p': A(x=0),
+            'q[0].a': A(x=1),
+            'q[1].a': A(x=A(x=2)),
+        })
+    self.assertEqual(
+        pg_query(v, type=A, enter_selected=True),
+        {
+            'p': A(x=0),
+            'q[0].a': A(x=1),
+            'q[1].a': A(x=A(x=2)),
+            'q[1].a.x': A(x=2),
+        })
+    self.assertEqual(
+        pg_query(v, r'q.*', where=lambda v, p: isinstance(p, B), type=A),
+        {
+            'q[0].a': A(x=1),
+            'q[1].a': A(x=A(x=2)),
+        })
+    self.assertEqual(
+        pg_query(v, type=Dict, enter_selected=True),
+        {'': v, 'r': Dict(x=3)})
+    # Non-symbolic types fall back to traversal.
+    self.assertEqual(pg_query(v, r'.*x', type=int), {
+        'p.x': 0,
+        'q[0].a.x': 1,
+        'q[1].a.x.x': 2,
+        'r.x': 3,
+    })
+    self.assertTrue(pg_contains(v, type=B))
+    self.assertFalse(pg_contains(v, type=C))
+    self.assertTrue(pg_contains(v, type=int))
+
+    # Results are the same as (and in the same order as) traversal.
+    indexed_results = [
+        pg_query(v, type=A, enter_selected=True),
+        pg_query(v, r'.*x', type=(A, B)),
+    ]
+    index.detach()
+    self.assertEqual(
+        [list(r.items()) for r in indexed_results],
+        [list(pg_query(v, type=A, enter_selected=True).items()),
+         list(pg_query(v, r'.*x', type=(A, B)).items())])
+
+  def test_index_maintenance(self):
+    v = self._value()
+    index = QueryIndex(v)
+
+    v.rebind({'q[0].a': B(a=A(x=4)), 'r.z': A(x=5)})
+    self.assertEqual(
+        pg_query(v, type=A),
+        {
+            'p': A(x=0),
+            'q[0].a.a': A(x=4),
+            'q[1].a': A(x=A(x=2)),
+            'r.z': A(x=5),
+        })
+    self.assertEqual(index.select_key('z'), {'r.z': A(x=5)})
+
+    # Insertion shifts the paths of existing nodes.
+    v.q.insert(0, B(a=A(x=6)))
+    self.assertEqual(
+        list(pg_query(v, type=B, enter_selected=True).keys()),
+        ['q[0]', 'q[1]', 'q[1].a', 'q[2]'])
+
+    # Mutations without notification are reflected as well.
+    with flags.notify_on_change(False):
+      del v.q[1]
+      v.p = B(a=1)
+    self.assertEqual(
+        pg_query(v, type=B),
+        {
+            'p': B(a=1),
+            'q[0]': B(a=A(x=6)),
+            'q[1]': B(a=A(x=A(x=2))),
+        })
+    self.assertFalse(pg_contains(v.q, type=Dict))
+    self.assertEqual(index.select_key('a'), {
+        'p.a': 1,
+        'q[0].a': A(x=6),
+        'q[1].a': A(x=A(x=2)),
+    })
+
+    # Detached sub-trees are excluded, and included again when re-attached.
+    q = v.q
+    del v['q']
+    self.assertEqual(list(pg_query(v, type=B).keys()), ['p'])
+    self.assertEqual(list(pg_query(v, type=A).keys()), ['r.z'])
+    v.q = q
+    self.assertEqual(
+        list(pg_query(v, type=A, enter_selected=True).keys()),
+        ['r.z', 'q[0].a', 'q[1].a', 'q[1].a.x'])
+
+  def test_rebuild_on_stale_entries(self):
+    v = Dict(x=List([A(x=i) for i in range(100)]))
+    index = QueryIndex(v)
+    self.assertEqual(len(index), 102)
+    v.x = List([A(x=1)])
+    self.assertEqual(len(index.select(A)), 1)
+    self.assertEqual(len(index), 3)
+
+  def test_removed_nodes_are_not_kept_alive(self):
+    v = Dict(x=List([A(x=i) for i in range(10)]), y=A(x=B(a=1)))
+    index = QueryIndex(v)
+    self.assertEqual(len(index), 14)
+    y = weakref.ref(v.y)
+    del v['x']
+    del v['y']
+    gc.collect()
+    self.assertIsNone(y())
+    self.assertEqual(len(index), 1)
+    self.assertEqual(index.count(A), 0)
+    self.assertEqual(index.select_key('a'), {})
+
+  def test_compact_objects_stay_compact(self):
+    v = Dict(a=List([M(x=M(x=1), y=A(x=2)), M(x=3, y=M(x=4))]))
+    index = QueryIndex(v)
+
+    def num_compact():
+      return sum(m._sym_compact_values is not None  # pylint: disable=protected-access
+                 for _, m in pg_query(v, where=lambda x: isinstance(x, M),
+                                      enter_selected=True).items())
+    self.assertEqual(num_compact(), 4)
+    self.assertEqual(
+        [str(k) for k, _ in index.select((M, A))],
+        ['a[0]', 'a[0].x', 'a[0].y', 'a[1]', 'a[1].y'])
+    self.assertTrue(index.contains(A))
+    self.assertEqual(
+        list(index.select_key('y').items()),
+        [('a[0].x.y', None), ('a[0].y', A(x=2)),
+         ('a[1].y', M(x=4)), ('a[1].y.y', None)])
+    self.assertEqual(list(index.select_key('x').keys()),
+                     ['a[0].x', 'a[0].x.x', 'a[0].y.x', 'a[1].x', 'a[1].y.x'])
+    self.assertEqual(num_compact(), 4)
+
+    # Materialized objects are still located.
+    v.a[1].rebind(x=5)
+    self.assertEqual(num_compact(), 3)
+    self.assertEqual(
+        [str(k) for k, _ in index.select(M)],
+        ['a[0]', 'a[0].x', 'a[1]', 'a[1].y'])
+
+
+if __name__ == '__main__':
+  unittest.main()
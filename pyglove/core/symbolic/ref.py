@@ -151,7 +151,28 @@ class Ref(
   def sym_eq(self, other: Any) -> bool:
     return isinstance(other, Ref) and self.value is other.value
 
-  def sym_jsonify(self, *, save_ref_value: bool = False, **kwargs: Any) -> Any:
+  def sym_jsonify(
+      self,
+      *,
+      save_ref_value: bool = False,
+      preserve_refs: bool = False,
+      **kwargs: Any
+  ) -> Any:
+    if preserve_refs:
+      # NOTE: the referenced value is written once in the shared value
+      # table, and each reference to it is loaded as a `pg.Ref` to the same
+      # value. See `pg.to_json` for details.
+      return {
+          object_utils.JSONConvertible.TYPE_NAME_KEY: (
+              self.__class__.__serialization_key__
+          ),
+          'value': base.to_json(
+              self._value,
+              save_ref_value=save_ref_value,
+              preserve_refs=preserve_refs,
+              **kwargs
+          ),
+      }
     if save_ref_value:
       return base.to_json(self._value, save_ref_value=save_ref_value, **kwargs)
     raise TypeError(f'{self!r} cannot be serialized at the moment.')
@@ -225,6 +246,9 @@ class Ref(
     ]
 
 
+base.Symbolic.RefType = Ref
+
+
 def maybe_ref(value: Any) -> Optional[Ref]:
   """Returns a reference if a value is not symbolic or already has a parent."""
   if isinstance(value, base.Symbolic):
@@ -21,6 +21,7 @@ from typing import Any
 import unittest
 
 from pyglove.core import typing as pg_typing
+from pyglove.core.symbolic import base
 from pyglove.core.symbolic import ref
 from pyglove.core.symbolic.base import contains
 from pyglove.core.symbolic.dict import Dict
@@ -118,6 +119,15 @@ class RefTest(unittest.TestCase):
         A(1).to_json()
     )
 
+    a = A(1)
+    v = Dict(x=ref.Ref(a), y=[ref.Ref(a)])
+    json_value = v.to_json(preserve_refs=True)
+    self.assertEqual(json_value['shared'], [a.to_json()])
+    loaded = base.from_json(json_value)
+    self.assertIsInstance(loaded.sym_getattr('x'), ref.Ref)
+    self.assertIs(loaded.x, loaded.y[0])
+    self.assertEqual(loaded.x, a)
+
   def test_pickle(self):
     with self.assertRaisesRegex(
         TypeError, '.* cannot be pickled at the moment'):
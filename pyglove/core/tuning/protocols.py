@@ -53,6 +53,10 @@ class _DataEntity(symbolic.Object):
 class Measurement(_DataEntity):
   """Measurement of a trial at certain step."""
 
+  # Measurements are created in large numbers, thus we store their fields
+  # compactly.
+  use_compact_storage = True
+
 
 @symbolic.members([
     ('id', pg_typing.Int(), 'Identifier of the trial.'),
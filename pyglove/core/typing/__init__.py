@@ -306,6 +306,7 @@ from pyglove.core.typing.class_schema import Field
 from pyglove.core.typing.class_schema import FieldKeyDef
 from pyglove.core.typing.class_schema import FieldValueDef
 from pyglove.core.typing.class_schema import FieldDef
+from pyglove.core.typing.class_schema import ApplyError
 from pyglove.core.typing.class_schema import Schema
 from pyglove.core.typing.class_schema import create_field
 from pyglove.core.typing.class_schema import create_schema
@@ -371,6 +372,8 @@ from pyglove.core.typing.inspect import callable_eq
 
 # Annotation conversion.
 import pyglove.core.typing.annotation_conversion  # pylint: disable=unused-import
+from pyglove.core.typing.annotation_conversion import value_spec_cache_info
+from pyglove.core.typing.annotation_conversion import clear_value_spec_cache
 
 # Interface for custom typing.
 from pyglove.core.typing.custom_typing import CustomTyping
@@ -381,6 +384,8 @@ from pyglove.core.typing.callable_signature import CallableType
 from pyglove.core.typing.callable_signature import Signature
 from pyglove.core.typing.callable_signature import signature
 from pyglove.core.typing.callable_signature import schema
+from pyglove.core.typing.callable_signature import signature_cache_info
+from pyglove.core.typing.callable_signature import clear_signature_cache
 
 # For backward compatibility.
 get_signature = signature
@@ -14,7 +14,9 @@
 """Conversion from annotations to PyGlove value specs."""
 
 import collections
+import copy
 import inspect
+import threading
 import types
 import typing
 
@@ -85,12 +87,109 @@ def _value_spec_from_default_value(
   return value_spec
 
 
+ValueSpecCacheInfo = collections.namedtuple(
+    'ValueSpecCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _ValueSpecCache:
+  """An LRU cache for the value specs converted from type annotations.
+
+  Only value specs without child specs (e.g. `pg.typing.Int()` or
+  `pg.typing.Object(A)`) are cached. A shallow copy of the cached spec is
+  returned on each lookup, so callers can modify the returned spec (e.g. via
+  `noneable` or `set_default`) without affecting the cache.
+  """
+
+  _CACHEABLE_SPEC_TYPES = frozenset([
+      vs.Bool, vs.Int, vs.Float, vs.Str, vs.Object, vs.Type, vs.Any])
+
+  def __init__(self, maxsize: int):
+    self._maxsize = maxsize
+    self._entries = collections.OrderedDict()
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+
+  def get(
+      self,
+      annotation: typing.Any,
+      accept_value_as_annotation: bool,
+      parent_module: typing.Optional[types.ModuleType],
+  ) -> class_schema.ValueSpec:
+    """Returns the value spec converted from a type annotation."""
+    if isinstance(
+        annotation, (str, typing.ForwardRef, class_schema.ForwardRef)):
+      # Forward references may be resolved against the module of the caller.
+      return _convert_type_annotation(
+          annotation, accept_value_as_annotation, parent_module)
+
+    # NOTE: the type of the annotation is a part of the key, since values
+    # used as annotations (e.g. 1 and True) can be equal across types.
+    key = (type(annotation), annotation, accept_value_as_annotation,
+           parent_module)
+    try:
+      with self._lock:
+        spec = self._entries.get(key)
+        if spec is not None:
+          self._entries.move_to_end(key)
+          self._hits += 1
+          return copy.copy(spec)
+    except TypeError:
+      # Unhashable annotations are not cached.
+      return _convert_type_annotation(
+          annotation, accept_value_as_annotation, parent_module)
+
+    spec = _convert_type_annotation(
+        annotation, accept_value_as_annotation, parent_module)
+    with self._lock:
+      self._misses += 1
+      if type(spec) in self._CACHEABLE_SPEC_TYPES:
+        # NOTE: the cached spec is never returned, thus it stays unchanged.
+        self._entries[key] = copy.copy(spec)
+        if len(self._entries) > self._maxsize:
+          self._entries.popitem(last=False)
+    return spec
+
+  def info(self) -> ValueSpecCacheInfo:
+    return ValueSpecCacheInfo(
+        self._hits, self._misses, self._maxsize, len(self._entries))
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+      self._hits = 0
+      self._misses = 0
+
+
+_VALUE_SPEC_CACHE = _ValueSpecCache(maxsize=4096)
+
+
+def value_spec_cache_info() -> ValueSpecCacheInfo:
+  """Returns the hits, misses and size of the annotation conversion cache."""
+  return _VALUE_SPEC_CACHE.info()
+
+
+def clear_value_spec_cache() -> None:
+  """Clears the annotation conversion cache and resets its counters."""
+  _VALUE_SPEC_CACHE.clear()
+
+
 def _value_spec_from_type_annotation(
     annotation: typing.Any,
     accept_value_as_annotation: bool,
     parent_module: typing.Optional[types.ModuleType] = None
 ) -> class_schema.ValueSpec:
   """Creates a value spec from type annotation."""
+  return _VALUE_SPEC_CACHE.get(
+      annotation, accept_value_as_annotation, parent_module)
+
+
+def _convert_type_annotation(
+    annotation: typing.Any,
+    accept_value_as_annotation: bool,
+    parent_module: typing.Optional[types.ModuleType] = None
+) -> class_schema.ValueSpec:
+  """Converts a type annotation into a value spec without caching."""
   if annotation is bool:
     return vs.Bool()
   elif annotation is int:
@@ -315,5 +315,44 @@ class ValueSpecFromAnnotationTest(unittest.TestCase):
     )
 
 
+class ValueSpecCacheTest(unittest.TestCase):
+  """Tests for the memoization of annotation conversion."""
+
+  def setUp(self):
+    super().setUp()
+    annotation_conversion.clear_value_spec_cache()
+
+  def test_hits_and_misses(self):
+    s1 = ValueSpec.from_annotation(int, True)
+    s2 = ValueSpec.from_annotation(int, True)
+    self.assertEqual(s1, vs.Int())
+    self.assertIsNot(s1, s2)
+    info = annotation_conversion.value_spec_cache_info()
+    self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    # Modifying a returned spec does not affect the cache.
+    s1.noneable().set_default(1)
+    self.assertEqual(ValueSpec.from_annotation(int, True), vs.Int())
+
+    # Values used as annotations are keyed by their types.
+    self.assertEqual(
+        ValueSpec.from_annotation(1, True, True), vs.Int(default=1))
+    self.assertEqual(
+        ValueSpec.from_annotation(True, True, True), vs.Bool(default=True))
+
+  def test_specs_with_child_specs(self):
+    s1 = ValueSpec.from_annotation(typing.List[int], True)
+    s1.element.value.noneable()
+    self.assertEqual(
+        ValueSpec.from_annotation(typing.List[int], True), vs.List(vs.Int()))
+    # The element spec is served from the cache.
+    self.assertEqual(annotation_conversion.value_spec_cache_info().hits, 1)
+
+  def test_forward_refs(self):
+    self.assertEqual(ValueSpec.from_annotation('Foo', True).cls, Foo)
+    ValueSpec.from_annotation('Foo', True)
+    self.assertEqual(annotation_conversion.value_spec_cache_info().currsize, 0)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -13,13 +13,17 @@
 # limitations under the License.
 """Callable signatures based on PyGlove typing."""
 
+import collections
+import functools
 import dataclasses
 import enum
 import inspect
 import sys
+import threading
 import types
 import typing
-from typing import Any, Callable, Dict, List, Optional, Union
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from pyglove.core import object_utils
 from pyglove.core.typing import class_schema
@@ -767,13 +771,166 @@ class Signature(object_utils.Formattable):
     return fn
 
 
+def _state_of(target: Any) -> Tuple[Any, ...]:
+  """Returns the objects whose replacement changes the signature."""
+  if inspect.isclass(target):
+    init, new = target.__init__, target.__new__
+    return ((init, new, getattr(target, '__signature__', None))
+            + _state_of(init) + _state_of(new))
+  state = [getattr(target, '__code__', None),
+           getattr(target, '__defaults__', None)]
+  for attr in ('__kwdefaults__', '__annotations__'):
+    d = getattr(target, attr, None)
+    if d:
+      # NOTE: the dicts can be modified in place, thus we compare their items.
+      state.extend(d.keys())
+      state.extend(d.values())
+    state.append(None)
+  return tuple(state)
+
+
+def _same_state(x: Tuple[Any, ...], y: Tuple[Any, ...]) -> bool:
+  """Returns True if two states hold the same objects."""
+  return len(x) == len(y) and all(a is b for a, b in zip(x, y))
+
+
+SignatureCacheInfo = collections.namedtuple(
+    'SignatureCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _SignatureCache:
+  """A weak-keyed LRU cache for the signatures of callables.
+
+  Entries are keyed on the identity of the callable (or the function of a
+  bound method), and are invalidated when its `__code__`, `__defaults__`,
+  `__kwdefaults__` or `__annotations__` (or those of the constructor of a
+  class) are changed. They are evicted when the callable is garbage collected.
+  """
+
+  def __init__(self, maxsize: int):
+    self._maxsize = maxsize
+    # Map of id(callable) to (weak reference of the callable, variants).
+    self._entries = collections.OrderedDict()
+    # NOTE: the lock is reentrant, since a garbage collection within the
+    # locked region may call `_evict` from the same thread.
+    self._lock = threading.RLock()
+    self._hits = 0
+    self._misses = 0
+
+  def get(
+      self,
+      func: Callable[..., Any],
+      auto_typing: bool,
+      auto_doc: bool) -> Signature:
+    """Returns the signature of a callable, which is shared across calls."""
+    target, is_bound = func, False
+    if inspect.ismethod(func):
+      # NOTE: bound methods are created on every attribute access, while
+      # their signatures do not depend on the bound object.
+      target, is_bound = func.__func__, True
+
+    # NOTE: entries are keyed on `id` instead of the callable itself, since
+    # callables such as symbolic objects with `__call__` may define mutable
+    # `__eq__` and `__hash__`.
+    key = id(target)
+    options = (auto_typing, auto_doc, is_bound)
+    state = _state_of(target)
+    entry = self._entries.get(key)
+    if entry is not None and entry[0]() is target:
+      variant = entry[1].get(options)
+      if variant is not None and _same_state(variant[0], state):
+        with self._lock:
+          if key in self._entries:
+            self._entries.move_to_end(key)
+          self._hits += 1
+        return variant[1]
+
+    sig = Signature.from_callable(func, auto_typing, auto_doc)
+    with self._lock:
+      self._misses += 1
+      entry = self._entries.get(key)
+      if entry is None or entry[0]() is not target:
+        try:
+          ref = weakref.ref(target, functools.partial(self._evict, key))
+        except TypeError:
+          # Callables that cannot be weakly referenced are not cached.
+          return sig
+        entry = (ref, {})
+        self._entries[key] = entry
+        if len(self._entries) > self._maxsize:
+          self._entries.popitem(last=False)
+      entry[1][options] = (state, sig)
+    return sig
+
+  def _evict(self, key: int, ref: weakref.ref) -> None:
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and entry[0] is ref:
+        del self._entries[key]
+
+  def info(self) -> SignatureCacheInfo:
+    return SignatureCacheInfo(
+        self._hits, self._misses, self._maxsize, len(self._entries))
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+      self._hits = 0
+      self._misses = 0
+
+
+_SIGNATURE_CACHE = _SignatureCache(maxsize=4096)
+
+
 def signature(
     func: Callable[..., Any],
     auto_typing: bool = True,
     auto_doc: bool = True,
 ) -> Signature:  # pylint:disable=g-bare-generic
-  """Gets signature from a python callable."""
-  return Signature.from_callable(func, auto_typing, auto_doc)
+  """Gets signature from a python callable.
+
+  Signatures are memoized per callable. Each call returns a new `Signature`
+  object which can be annotated independently, while the value specs of its
+  arguments are shared across calls, thus they should not be modified in
+  place.
+
+  Args:
+    func: A python callable.
+    auto_typing: If True, convert argument annotations to PyGlove value specs.
+    auto_doc: If True, extract argument descriptions from docstrs.
+
+  Returns:
+    The signature of `func`.
+  """
+  if isinstance(func, object_utils.Functor):
+    return Signature.from_callable(func, auto_typing, auto_doc)
+  return _shallow_copy(_SIGNATURE_CACHE.get(func, auto_typing, auto_doc))
+
+
+def _shallow_copy(sig: Signature) -> Signature:
+  """Copies a signature and its arguments without copying the value specs."""
+  def _copy(x):
+    if x is None:
+      return None
+    y = object.__new__(x.__class__)
+    y.__dict__.update(x.__dict__)
+    return y
+  sig = _copy(sig)
+  sig.args = [_copy(arg) for arg in sig.args]
+  sig.kwonlyargs = [_copy(arg) for arg in sig.kwonlyargs]
+  sig.varargs = _copy(sig.varargs)
+  sig.varkw = _copy(sig.varkw)
+  return sig
+
+
+def signature_cache_info() -> SignatureCacheInfo:
+  """Returns the hits, misses and size of the signature cache."""
+  return _SIGNATURE_CACHE.info()
+
+
+def clear_signature_cache() -> None:
+  """Clears the signature cache and resets its counters."""
+  _SIGNATURE_CACHE.clear()
 
 
 def schema(
@@ -809,7 +966,9 @@ def schema(
   s = getattr(cls_or_fn, '__schema__', None)
   if isinstance(s, class_schema.Schema):
     return s
-  return signature(
+  # NOTE: the value specs of a schema may be extended in place, thus
+  # we do not use the memoized signature here.
+  return Signature.from_callable(
       cls_or_fn, auto_typing=auto_typing, auto_doc=auto_doc
   ).annotate(
       args, return_value=returns
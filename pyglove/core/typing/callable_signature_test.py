@@ -741,6 +741,134 @@ class FromSchemaTest(unittest.TestCase):
       Signature.from_callable(Foo())
 
 
+class SignatureCacheTest(unittest.TestCase):
+  """Tests for the memoization of `callable_signature.signature`."""
+
+  def setUp(self):
+    super().setUp()
+    callable_signature.clear_signature_cache()
+
+  def test_hits_and_misses(self):
+    def foo(x: int, *args, y: str = 'a', **kwargs):
+      del x, args, y, kwargs
+
+    s1 = callable_signature.signature(foo)
+    s2 = callable_signature.signature(foo)
+    self.assertEqual(s1, s2)
+    self.assertIsNot(s1, s2)
+    self.assertIs(s1.args[0].value_spec, s2.args[0].value_spec)
+    info = callable_signature.signature_cache_info()
+    self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    # Different options are cached separately.
+    callable_signature.signature(foo, auto_typing=False)
+    self.assertEqual(callable_signature.signature_cache_info().misses, 2)
+
+    # Annotating a signature does not affect the cached one.
+    s1.annotate([('x', vs.Int(min_value=0))])
+    self.assertEqual(s1.args[0].value_spec, vs.Int(min_value=0))
+    self.assertEqual(
+        callable_signature.signature(foo).args[0].value_spec, vs.Int())
+
+    # Replacing `__code__` invalidates the cache.
+    def bar(z):
+      del z
+    foo.__code__ = bar.__code__
+    self.assertEqual(callable_signature.signature(foo).arg_names, ['z'])
+
+    # Entries are evicted when the function is garbage collected.
+    del foo
+    self.assertEqual(callable_signature.signature_cache_info().currsize, 0)
+
+  def test_invalidation_by_defaults_and_annotations(self):
+    def foo(x: int = 1, *, y: str = 'a'):
+      del x, y
+
+    self.assertEqual(callable_signature.signature(foo).args[0].value_spec,
+                     vs.Int(default=1))
+
+    foo.__defaults__ = (2,)
+    self.assertEqual(callable_signature.signature(foo).args[0].value_spec,
+                     vs.Int(default=2))
+
+    foo.__kwdefaults__['y'] = 'b'
+    self.assertEqual(
+        callable_signature.signature(foo).kwonlyargs[0].value_spec,
+        vs.Str(default='b'))
+
+    foo.__annotations__['x'] = float
+    self.assertEqual(callable_signature.signature(foo).args[0].value_spec,
+                     vs.Float(default=2.0))
+    info = callable_signature.signature_cache_info()
+    self.assertEqual((info.hits, info.misses), (0, 4))
+    callable_signature.signature(foo)
+    self.assertEqual(callable_signature.signature_cache_info().hits, 1)
+
+  def test_callables_with_mutable_hash(self):
+    class Foo:
+
+      def __init__(self, v):
+        self.v = v
+
+      def __call__(self, x):
+        del x
+
+      def __eq__(self, other):
+        return isinstance(other, Foo) and self.v == other.v
+
+      def __hash__(self):
+        return hash(self.v)
+
+    f1, f2 = Foo(1), Foo(1)
+    callable_signature.signature(f1)
+    f1.v = 2
+    callable_signature.signature(f1)
+    callable_signature.signature(f2)
+    info = callable_signature.signature_cache_info()
+    self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+    del f1
+    self.assertEqual(callable_signature.signature_cache_info().currsize, 1)
+
+  def test_bound_methods(self):
+    class A:
+
+      def foo(self, x):
+        del x
+
+    a1, a2 = A(), A()
+    self.assertEqual(callable_signature.signature(a1.foo).arg_names, ['x'])
+    self.assertEqual(callable_signature.signature(a2.foo).arg_names, ['x'])
+    self.assertEqual(
+        callable_signature.signature(A.foo).arg_names, ['self', 'x'])
+    info = callable_signature.signature_cache_info()
+    self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 1))
+
+  def test_classes(self):
+    class A:
+
+      def __init__(self, x):
+        del x
+
+    self.assertEqual(callable_signature.signature(A).arg_names, ['x'])
+
+    # Replacing `__init__` invalidates the cache.
+    def __init__(self, y):  # pylint: disable=invalid-name
+      del self, y
+    A.__init__ = __init__
+    self.assertEqual(callable_signature.signature(A).arg_names, ['y'])
+
+  def test_lru(self):
+    cache = callable_signature._SignatureCache(maxsize=2)
+    fns = [lambda x: x, lambda y: y, lambda z: z]
+    for fn in fns:
+      cache.get(fn, False, False)
+    self.assertEqual(cache.info().currsize, 2)
+    cache.get(fns[0], False, False)
+    self.assertEqual(cache.info().hits, 0)
+    cache.get(fns[2], False, False)
+    self.assertEqual(cache.info().hits, 1)
+
+
 class GetSchemaTest(unittest.TestCase):
   """Tests for `schema`."""
 
@@ -687,6 +687,43 @@ class SchemaTest(unittest.TestCase):
             }
         })
 
+  def test_apply_many(self):
+    schema = class_schema.create_schema(
+        [('x', vs.Int(min_value=0)), (ks.StrKey('y.*'), vs.Str())],
+        allow_nonconst_keys=True)
+    records = [
+        {'x': 1, 'y1': 'a'},
+        {'x': -1},
+        {'x': 2, 'z': 1},
+        {'x': 3, 'y2': 'b'},
+        {'x': 4, 'y1': 1},
+    ]
+    results, errors = schema.apply_many(records, continue_on_error=True)
+    self.assertEqual(
+        results, [{'x': 1, 'y1': 'a'}, None, None, {'x': 3, 'y2': 'b'}, None])
+    self.assertEqual(
+        [(i, str(path)) for i, path, _ in errors],
+        [(1, '[1].x'), (2, '[2]'), (4, '[4].y1')])
+    self.assertIn('out of range', errors[0][2])
+    self.assertIn('Keys [\'z\'] are not allowed in Schema', errors[1][2])
+    self.assertIn('Expect <class \'str\'>', errors[2][2])
+
+    _, errors = schema.apply_many(
+        records, root_path=object_utils.KeyPath('rows'),
+        continue_on_error=True)
+    self.assertEqual(
+        [str(path) for _, path, _ in errors],
+        ['rows[1].x', 'rows[2]', 'rows[4].y1'])
+
+    # Raises on the first error by default.
+    with self.assertRaisesRegex(
+        ValueError, r'.* is out of range .*\(path=\[1\]\.x\)'):
+      schema.apply_many(records)
+
+    self.assertEqual(
+        schema.apply_many([{}, {'x': 1}], allow_partial=True),
+        ([{'x': typed_missing.MISSING_VALUE}, {'x': 1}], []))
+
   def test_apply_with_custom_typing(self):
 
     class NumberType(custom_typing.CustomTyping):
@@ -29,6 +29,9 @@ class _TypeConverterRegistry:
     self._converter_list = []
     self._json_value_types = set(
         [int, float, bool, type(None), list, tuple, dict, str])
+    # Memoized lookups, which are cleared upon registration.
+    self._converter_cache = {}
+    self._json_value_converter_cache = {}
 
   def register(
       self,
@@ -49,13 +52,24 @@ class _TypeConverterRegistry:
     else:
       json_value_convertible = dest in self._json_value_types
     self._converter_list.append((src, dest, convert_fn, json_value_convertible))
+    self._converter_cache.clear()
+    self._json_value_converter_cache.clear()
 
   def get_converter(
       self, src: Type[Any], dest: Type[Any]) -> Optional[Callable[[Any], Any]]:
     """Get converter from source type to destination type."""
-    # TODO(daiyip): Right now we don't see the need of a large number of
-    # converters, thus its affordable to iterate the list.
-    # We may consider more efficient way to do lookup in future.
+    key = (src, dest)
+    try:
+      return self._converter_cache[key]
+    except KeyError:
+      pass
+    converter = self._find_converter(src, dest)
+    self._converter_cache[key] = converter
+    return converter
+
+  def _find_converter(
+      self, src: Type[Any], dest: Type[Any]) -> Optional[Callable[[Any], Any]]:
+    """Finds the converter from source type to destination type."""
     # NOTE(daiyip): We do reverse lookup since usually subclass converter
     # is register after base class.
     for src_type, dest_type, converter, _ in reversed(self._converter_list):
@@ -69,11 +83,18 @@ class _TypeConverterRegistry:
   def get_json_value_converter(
       self, src: Type[Any]) -> Optional[Callable[[Any], Any]]:
     """Get converter from source type to a JSON simple type."""
-    for src_type, _, converter, json_value_convertible in reversed(
+    try:
+      return self._json_value_converter_cache[src]
+    except KeyError:
+      pass
+    converter = None
+    for src_type, _, fn, json_value_convertible in reversed(
         self._converter_list):
       if pg_inspect.is_subclass(src, src_type) and json_value_convertible:
-        return converter
-    return None
+        converter = fn
+        break
+    self._json_value_converter_cache[src] = converter
+    return converter
 
 
 _TYPE_CONVERTER_REGISTRY = _TypeConverterRegistry()
@@ -21,6 +21,7 @@ import numbers
 import re
 import sys
 import typing
+import weakref
 import __main__
 from pyglove.core import object_utils
 from pyglove.core.typing import callable_signature
@@ -126,6 +127,62 @@ class ValueSpecBase(ValueSpec):
     # Reset frozen after setting the default value.
     self._frozen = frozen
 
+  # Validated sealed values by their ids, when validation cache is enabled.
+  _validation_cache = None
+
+  def __setattr__(self, name: str, value: typing.Any) -> None:
+    super().__setattr__(name, value)
+    # NOTE: the compiled function and the validation cache depend on
+    # the states of current spec, thus we discard them upon any change of the
+    # states.
+    if name not in ('_compiled', '_validation_cache'):
+      if self._compiled is not None:
+        super().__setattr__('_compiled', None)
+      if self._validation_cache:
+        self._validation_cache.clear()
+
+  def __getstate__(self) -> typing.Dict[str, typing.Any]:
+    """Excludes the compiled function and cached results from pickling."""
+    state = self.__dict__.copy()
+    state.pop('_compiled', None)
+    if state.get('_validation_cache') is not None:
+      state['_validation_cache'] = {}
+    return state
+
+  def cache_validation(self, enabled: bool = True) -> 'ValueSpecBase':
+    """Enables or disables the validation cache and returns `self`.
+
+    With validation cache, a sealed symbolic value that has been validated by
+    current spec is accepted without validation when it is applied again,
+    as long as it is not modified since. This saves the deep validation of
+    sealed building blocks that are assigned into many parents, e.g.::
+
+      spec = pg.typing.Dict([('x', pg.typing.Int())]).cache_validation()
+
+    Since the cached values are accepted as is, the `child_transform` of
+    `apply` is not called on their children, which is the case for symbolic
+    values under the default transform.
+
+    Args:
+      enabled: Whether to enable the validation cache.
+
+    Returns:
+      `self`.
+    """
+    self._validation_cache = {} if enabled else None
+    return self
+
+  @property
+  def is_validation_cached(self) -> bool:
+    """Returns True if validation cache is enabled."""
+    return self._validation_cache is not None
+
+  def _generation_if_cacheable(self, value: typing.Any) -> typing.Optional[int]:
+    """Returns the generation of a value if its validation can be cached."""
+    if not getattr(value, 'is_sealed', False):
+      return None
+    return getattr(value, 'sym_generation', None)
+
   @functools.cached_property
   def skip_user_transform(self) -> 'ValueSpec':
     """Returns a value spec of this without transform."""
@@ -274,6 +331,40 @@ class ValueSpecBase(ValueSpec):
       raise ValueError(
           f'Value cannot be None. (Path=\'{root_path}\', ValueSpec={self!r})')
 
+    cache = self._validation_cache
+    if cache is not None:
+      generation = self._generation_if_cacheable(value)
+      if generation is not None:
+        entry = cache.get(id(value))
+        if (entry is not None
+            and entry[0]() is value
+            and entry[1] == generation
+            and (allow_partial or not entry[2])):
+          return value
+        result = self._apply_uncached(
+            value, allow_partial, child_transform, root_path)
+        # NOTE: we only cache the values that are accepted as is.
+        if (result is value
+            and self._generation_if_cacheable(value) == generation):
+          key = id(value)
+          cache[key] = (
+              weakref.ref(value, lambda _: cache.pop(key, None)),
+              generation,
+              allow_partial)
+        return result
+    return self._apply_uncached(
+        value, allow_partial, child_transform, root_path)
+
+  def _apply_uncached(
+      self,
+      value: typing.Any,
+      allow_partial: bool,
+      child_transform: typing.Optional[typing.Callable[
+          [object_utils.KeyPath, Field, typing.Any],
+          typing.Any
+      ]],
+      root_path: object_utils.KeyPath) -> typing.Any:
+    """Applies current spec to a value that is not missing or None."""
     # NOTE(daiyip): CustomTyping will take over the apply logic other than
     # standard apply process. This allows users to plugin complex types as
     # the inputs for Schema.apply and have full control on the transform.
@@ -340,6 +431,51 @@ class ValueSpecBase(ValueSpec):
     del root_path
     return value
 
+  def _compile(self) -> typing.Callable[..., typing.Any]:
+    """Compiles current spec into a function with the signature of `apply`."""
+    cls = self.__class__
+    apply = self.apply
+    if (cls.apply is not ValueSpecBase.apply
+        or self._frozen
+        or self._transform is not None
+        or self._validation_cache is not None):
+      return apply
+
+    value_type = self.value_type
+    custom_apply, validate = None, None
+    if cls._apply is not ValueSpecBase._apply:
+      custom_apply = self._apply
+    if cls._validate is not ValueSpecBase._validate:
+      validate = self._validate
+
+    # Whether a value type can skip the MISSING_VALUE, None, CustomTyping
+    # handling and the type conversion in `apply`.
+    accepted_types = {}
+
+    def _accepts(t: typing.Type[typing.Any]) -> bool:
+      accepted = (
+          t is not type(None)
+          and not issubclass(t, (object_utils.MissingValue, CustomTyping))
+          and (value_type is None or pg_inspect.is_subclass(t, value_type)))
+      accepted_types[t] = accepted
+      return accepted
+
+    def compiled(value, allow_partial=False, child_transform=None,
+                 root_path=None):
+      accepted = accepted_types.get(type(value))
+      if accepted is None:
+        accepted = _accepts(type(value))
+      if not accepted:
+        return apply(value, allow_partial, child_transform, root_path)
+      if root_path is None:
+        root_path = object_utils.KeyPath()
+      if custom_apply is not None:
+        value = custom_apply(value, allow_partial, child_transform, root_path)
+      if validate is not None:
+        validate(root_path, value)
+      return value
+    return compiled
+
   def is_compatible(self, other: ValueSpec) -> bool:
     """Returns if current spec can receive all values from the other spec."""
     if self is other:
@@ -1153,11 +1289,24 @@ class List(Generic, ValueSpecBase):
     # NOTE(daiyip): list elements can be contextual values, thus we try
     # to get their symbolic form instead of the evaluated form.
     getitem = getattr(value, 'sym_getattr', value.__getitem__)
+    if child_transform is not None:
+      for i in range(len(value)):
+        v = self._element.apply(
+            getitem(i), allow_partial=allow_partial,
+            transform_fn=child_transform,
+            root_path=object_utils.KeyPath(i, root_path))
+        if getitem(i) is not v:
+          set_item(i, v)
+      return value
+
+    # NOTE: without child transform, `Field.apply` is a plain call to the
+    # compiled element spec, thus we call it directly.
+    apply_element = self._element.value.compile()
     for i in range(len(value)):
-      v = self._element.apply(
-          getitem(i), allow_partial=allow_partial, transform_fn=child_transform,
-          root_path=object_utils.KeyPath(i, root_path))
-      if getitem(i) is not v:
+      item = getitem(i)
+      v = apply_element(
+          item, allow_partial, None, object_utils.KeyPath(i, root_path))
+      if item is not v:
         set_item(i, v)
     return value
 
@@ -1723,6 +1872,37 @@ class Dict(Generic, ValueSpecBase):
         root_path=root_path
     )
 
+  def apply_many(
+      self,
+      values: typing.Iterable[typing.Any],
+      allow_partial: bool = False,
+      child_transform: typing.Optional[typing.Callable[
+          [object_utils.KeyPath, Field, typing.Any], typing.Any]] = None,
+      root_path: typing.Optional[object_utils.KeyPath] = None,
+      continue_on_error: bool = False,
+  ) -> typing.Tuple[
+      typing.List[typing.Any], typing.List[class_schema.ApplyError]]:
+    """Dict specific apply_many, which reuses key resolution across values."""
+    values = list(values)
+    if (self._schema is not None
+        and not self._frozen
+        and self._transform is None
+        and all(type(v) is dict for v in values)):
+      # NOTE: plain dicts are handled by `Dict._apply` with the schema
+      # only, thus we apply the schema to them in bulk.
+      return self._schema.apply_many(
+          values,
+          allow_partial=allow_partial,
+          child_transform=child_transform,
+          root_path=root_path,
+          continue_on_error=continue_on_error)
+    return super().apply_many(
+        values,
+        allow_partial=allow_partial,
+        child_transform=child_transform,
+        root_path=root_path,
+        continue_on_error=continue_on_error)
+
   def _extend(self, base: 'Dict') -> None:
     """Dict specific extension."""
     if base.schema:
@@ -2597,6 +2777,9 @@ class Union(Generic, ValueSpecBase):
         candidate_types.add(child_value_type)
 
     self._candidates = candidates
+    # Strong-typed candidate by value type, see `_candidate_by_type`.
+    self._dispatch_table = {}
+    self._dispatch_token = None
     union_value_type = None if no_value_type_check else tuple(candidate_types)
     super().__init__(
         union_value_type,
@@ -2683,17 +2866,12 @@ class Union(Generic, ValueSpecBase):
              root_path: object_utils.KeyPath) -> typing.Any:
     """Union specific apply."""
     # Match strong-typed candidates first.
-    if not self.type_resolved:
+    if self.forward_refs and not self.type_resolved:
       return value
 
-    for c in self._candidates:
-      if c.value_type is not None and isinstance(value, c.value_type):
-        return c.apply(
-            value,
-            allow_partial=allow_partial,
-            child_transform=child_transform,
-            root_path=root_path
-        )
+    c = self._candidate_by_type(value)
+    if c is not None:
+      return c.compile()(value, allow_partial, child_transform, root_path)
 
     def _try_candidate(c, value) -> typing.Tuple[typing.Any, bool]:
       try:
@@ -2730,6 +2908,36 @@ class Union(Generic, ValueSpecBase):
         f'{value!r} does not match any candidate of {self!r}.'
     )
 
+  def _candidate_by_type(
+      self, value: typing.Any) -> typing.Optional[ValueSpec]:
+    """Returns the first strong-typed candidate that matches a value's type."""
+    # NOTE: like `functools.singledispatch`, the table is cleared when ABCs
+    # register new virtual subclasses, which changes `isinstance` results.
+    cache_token = abc.get_cache_token()
+    if self._dispatch_token != cache_token:
+      self._dispatch_table = {}
+      self._dispatch_token = cache_token
+    value_type = type(value)
+    try:
+      return self._dispatch_table[value_type]
+    except KeyError:
+      pass
+    candidate = None
+    cacheable = True
+    for c in self._candidates:
+      if c.value_type is None:
+        continue
+      # `isinstance` checks against runtime-checkable protocols depend on the
+      # attributes of values, thus results that depend on them are not cached.
+      if cacheable and _has_protocol(c.value_type):
+        cacheable = False
+      if isinstance(value, c.value_type):
+        candidate = c
+        break
+    if cacheable:
+      self._dispatch_table[value_type] = candidate
+    return candidate
+
   def _extend(self, base: 'Union') -> None:
     """Union specific extension."""
     def _base_candidate(c, v):
@@ -2753,6 +2961,7 @@ class Union(Generic, ValueSpecBase):
         raise TypeError(
             f'{self!r} cannot extend {base!r}: incompatible value spec {sc}.')
       sc.extend(bc)
+    self._dispatch_table = {}
 
   def is_compatible(self, other: ValueSpec) -> bool:
     """Union specific compatibility check."""
@@ -2840,6 +3049,15 @@ class Union(Generic, ValueSpecBase):
 # pytype: enable=attribute-error
 
 
+def _has_protocol(value_type: typing.Union[
+    typing.Type[typing.Any], typing.Tuple[typing.Type[typing.Any], ...]]
+) -> bool:
+  """Returns True if a value type is or contains a protocol class."""
+  if isinstance(value_type, tuple):
+    return any(getattr(t, '_is_protocol', False) for t in value_type)
+  return getattr(value_type, '_is_protocol', False)
+
+
 class GenericTypeAlias(Generic):
   """Base class for generic type aliases."""
 
@@ -11,7 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import abc
 import contextlib
+import copy
 import datetime
 import inspect
 import sys
@@ -3282,6 +3284,53 @@ class UnionTest(ValueSpecTest):
     ):
       vs.Union([typing.Callable[[int], int], str]).apply(1)
 
+  def test_apply_with_dispatch(self):
+    v = vs.Union([vs.Int(min_value=0), vs.Float(), vs.Str(), vs.Callable()])
+    for _ in range(2):
+      self.assertEqual(v.apply(1), 1)
+      self.assertEqual(v.apply(True), True)
+      self.assertEqual(v.apply(1.0), 1.0)
+      self.assertEqual(v.apply('a'), 'a')
+      self.assertIs(v.apply(len), len)
+      with self.assertRaisesRegex(ValueError, '.* is out of range'):
+        v.apply(-1)
+    self.assertIs(v._candidate_by_type(True), v.candidates[0])
+    self.assertIsNone(v._candidate_by_type(len))
+
+  def test_apply_with_dispatch_on_abcs(self):
+
+    class Base(metaclass=abc.ABCMeta):
+      pass
+
+    class A:
+      pass
+
+    v = vs.Union([vs.Object(Base), vs.Object(A), vs.Int()])
+    self.assertIsNone(v._candidate_by_type(1.0))
+    self.assertIs(v._candidate_by_type(A()), v.candidates[1])
+    # Results are updated upon registering virtual subclasses.
+    Base.register(float)
+    Base.register(A)
+    self.assertIs(v._candidate_by_type(1.0), v.candidates[0])
+    self.assertIs(v._candidate_by_type(A()), v.candidates[0])
+
+  def test_apply_with_dispatch_on_protocols(self):
+
+    @typing.runtime_checkable
+    class HasFoo(typing.Protocol):
+
+      def foo(self):
+        pass
+
+    class A:
+      pass
+
+    v = vs.Union([vs.Object(HasFoo), vs.Int()])
+    self.assertIsNone(v._candidate_by_type(A()))
+    # Protocol checks depend on the attributes of values.
+    A.foo = lambda self: None
+    self.assertIs(v._candidate_by_type(A()), v.candidates[0])
+
   def test_is_compatible(self):
     self.assertTrue(
         vs.Union([vs.Int(), vs.Bool()]).is_compatible(
@@ -3572,6 +3621,123 @@ class TransformTest(ValueSpecTest):
     self.assertEqual(v.apply(Ref(1)), Ref(A(1)))
 
 
+class CompileTest(ValueSpecTest):
+
+  def test_compile(self):
+    v = vs.List(vs.Dict([('x', vs.Int(min_value=0)), ('y', vs.Str())]))
+    fn = v.compile()
+    self.assertIs(v.compile(), fn)
+    self.assertEqual(fn([dict(x=1, y='a')]), [dict(x=1, y='a')])
+    with self.assertRaisesRegex(ValueError, 'Value cannot be None'):
+      fn(None)
+    with self.assertRaisesRegex(
+        ValueError, r'.* is out of range .*\(path=\[0\]\.x\)'):
+      fn([dict(x=-1, y='a')])
+    with self.assertRaisesRegex(
+        TypeError, r'Expect <class \'str\'> .*\(path=\[1\]\.y\)'):
+      fn([dict(x=1, y='a'), dict(x=1, y=1)])
+
+  def test_compile_with_changes(self):
+    v = vs.Int()
+    fn = v.compile()
+    v.noneable()
+    self.assertIsNot(v.compile(), fn)
+    self.assertIsNone(v.compile()(None))
+
+    v = vs.Any(transform=int)
+    self.assertEqual(v.compile()('1'), 1)
+
+    v = vs.Int().freeze(1)
+    self.assertEqual(v.compile()(1), 1)
+    with self.assertRaisesRegex(ValueError, 'Frozen field is not assignable'):
+      v.compile()(2)
+
+  def test_apply_many(self):
+    v = vs.Dict([('x', vs.Int(min_value=0))])
+    self.assertEqual(
+        v.apply_many([dict(x=1), dict(x=-1)], continue_on_error=True),
+        ([dict(x=1), None],
+         [(1, object_utils.KeyPath.parse('[1].x'),
+           'Value -1 is out of range (min=0, max=None). (path=[1].x)')]))
+
+    v = vs.List(vs.Int())
+    self.assertEqual(
+        v.apply_many([[1], [2, 'a']], continue_on_error=True),
+        ([[1], None],
+         [(1, object_utils.KeyPath(1),
+           'Expect <class \'int\'> but encountered <class \'str\'>: a. '
+           '(path=[1][1])')]))
+    with self.assertRaisesRegex(
+        TypeError, r'Expect .* \(path=\[1\]\[1\]\)'):
+      v.apply_many([[1], [2, 'a']])
+
+  def test_compile_with_failed_transform(self):
+    calls = []
+
+    def transform(x):
+      calls.append(x)
+      if len(calls) == 1:
+        raise ValueError('bad value')
+      return x
+
+    v = vs.List(vs.Dict([('x', vs.Any(transform=transform))]))
+    with self.assertRaisesRegex(ValueError, r'bad value \(path=\[0\]\.x\)'):
+      v.apply([dict(x=1)])
+    self.assertEqual(calls, [1])
+
+  def test_compile_with_forward_refs(self):
+    class A:
+      pass
+
+    v = vs.Object(forward_ref('A'))
+    self.assertEqual(v.compile(), v.apply)
+    with simulate_forward_declaration(A):
+      a = A()
+      self.assertIs(v.compile()(a), a)
+      self.assertIsNot(v.compile(), v.apply)
+
+
+class ValidationCacheTest(ValueSpecTest):
+
+  class Sealed:
+
+    def __init__(self, generation=0):
+      self.is_sealed = True
+      self.sym_generation = generation
+
+  def test_cache_validation(self):
+    v = vs.Object(self.Sealed)
+    self.assertFalse(v.is_validation_cached)
+    self.assertIs(v.cache_validation(), v)
+    self.assertTrue(v.is_validation_cached)
+    self.assertEqual(v.compile(), v.apply)
+
+    x = self.Sealed()
+    self.assertIs(v.apply(x), x)
+    self.assertEqual(len(v._validation_cache), 1)
+
+    # Values validated with `allow_partial=True` are not used for non-partial
+    # validation.
+    y = self.Sealed()
+    v.apply(y, allow_partial=True)
+    self.assertTrue(v._validation_cache[id(y)][2])
+    v.apply(y)
+    self.assertFalse(v._validation_cache[id(y)][2])
+
+    # Changes of the spec clear the cache.
+    v.noneable()
+    self.assertEqual(len(v._validation_cache), 0)
+
+    # Copies keep the option without the cached values.
+    v.apply(x)
+    v2 = copy.deepcopy(v)
+    self.assertTrue(v2.is_validation_cached)
+    self.assertEqual(len(v2._validation_cache), 0)
+
+    v.cache_validation(False)
+    self.assertFalse(v.is_validation_cached)
+
+
 @contextlib.contextmanager
 def simulate_forward_declaration(*module_level_symbols):
   try:
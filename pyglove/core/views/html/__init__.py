@@ -13,6 +13,8 @@
 # limitations under the License.
 """HTML views for PyGlove objects."""
 
+import importlib
+
 # pylint: disable=g-importing-member
 # pylint: disable=g-bad-import-order
 
@@ -25,3 +27,12 @@ from pyglove.core.views.html.tree_view import HtmlTreeView
 
 # pylint: enable=g-bad-import-order
 # pylint: enable=g-importing-member
+
+
+def __getattr__(name):
+  # NOTE: `controls` is loaded upon first access, which also avoids
+  # circular dependency between `pyglove.core.views.html` and
+  # `pyglove.core.symbolic`.
+  if name == 'controls':
+    return importlib.import_module(f'{__name__}.controls')
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
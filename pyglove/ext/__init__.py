@@ -13,7 +13,24 @@
 # limitations under the License.
 """Package pyglove.generators."""
 
-from pyglove.ext import early_stopping
-from pyglove.ext import evolution
-from pyglove.ext import mutfun
-from pyglove.ext import scalars
+import importlib
+
+from pyglove.core import object_utils
+
+# NOTE: sub-modules are loaded upon first access to cut the import
+# time of `pyglove`. The types defined in them are loaded on demand during
+# deserialization as well.
+__all__ = ['early_stopping', 'evolution', 'mutfun', 'scalars']
+
+for _name in __all__:
+  object_utils.JSONConvertible.add_lazy_module(f'{__name__}.{_name}')
+
+
+def __getattr__(name):
+  if name in __all__:
+    return importlib.import_module(f'{__name__}.{name}')
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
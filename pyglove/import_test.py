@@ -0,0 +1,94 @@
+# Copyright 2024 The PyGlove Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the import of `pyglove`, which guard against its cost."""
+
+import json
+import subprocess
+import sys
+import textwrap
+import unittest
+
+
+def _run(code: str):
+  """Runs code in a fresh interpreter and returns its JSON output."""
+  output = subprocess.check_output(
+      [sys.executable, '-c', textwrap.dedent(code)], text=True)
+  return json.loads(output.strip().splitlines()[-1])
+
+
+class ImportTest(unittest.TestCase):
+
+  def test_lazy_modules(self):
+    loaded = _run("""
+        import json, sys
+        import pyglove as pg
+        print(json.dumps(sorted(
+            m for m in sys.modules
+            if m.startswith('pyglove.ext.') or '.controls' in m)))
+        """)
+    self.assertEqual(loaded, [])
+
+  def test_access_lazy_modules(self):
+    names = _run("""
+        import json
+        import pyglove as pg
+        print(json.dumps([
+            pg.evolution.__name__,
+            pg.ext.scalars.__name__,
+            pg.views.html.controls.__name__,
+            'mutfun' in dir(pg),
+        ]))
+        """)
+    self.assertEqual(names, [
+        'pyglove.ext.evolution',
+        'pyglove.ext.scalars',
+        'pyglove.core.views.html.controls',
+        True,
+    ])
+
+  def test_deserialize_from_lazy_modules(self):
+    json_str = _run("""
+        import json
+        import pyglove as pg
+        print(json.dumps(pg.to_json_str(pg.scalars.STEP + 1)))
+        """)
+    value = _run(f"""
+        import json
+        import pyglove as pg
+        v = pg.from_json_str({json_str!r})
+        print(json.dumps([type(v).__module__, v(2)]))
+        """)
+    self.assertEqual(value, ['pyglove.ext.scalars.base', 3])
+
+  def test_deferred_init(self):
+    num_generated_inits = _run("""
+        import json
+        import pyglove as pg
+        from pyglove.core.symbolic import object as pg_object
+
+        def subclasses(cls):
+          for c in cls.__subclasses__():
+            yield c
+            yield from subclasses(c)
+
+        print(json.dumps(sum(
+            hasattr(c.__dict__.get('__init__'), '__sym_generated_init__')
+            and not isinstance(c.__dict__['__init__'], pg_object._LazyInit)
+            for c in set(subclasses(pg.Object)))))
+        """)
+    self.assertEqual(num_generated_inits, 0)
+
+
+if __name__ == '__main__':
+  unittest.main()